@@ -0,0 +1,19 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core instead of ``json.dumps``.
+
+    FastAPI hands ``render`` the already serialized response model, so
+    encoding it with pydantic-core's Rust serializer gives the same
+    compact UTF-8 output as ``JSONResponse`` at a fraction of the cost
+    for large list and search payloads. Unlike ``JSONResponse``, which
+    rejects them, NaN and infinite floats are rendered as ``null`` the
+    same way ``model_dump_json`` does.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, inf_nan_mode="null")
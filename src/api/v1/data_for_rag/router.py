@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from fastapi import APIRouter, UploadFile, Request, File, Form, Body
+from fastapi.responses import StreamingResponse
 
 from src.api.v1.data_for_rag.schemas import (
     KnowledgeBaseSchema,
@@ -21,6 +22,11 @@ from src.utils.validators.validate_file_mime import validate_file_mime
 router = APIRouter(prefix="/api/v1/knowledge-base", tags=["Knowledge Base"])
 
 
+async def _to_ndjson(files: AsyncIterator[FileSchema]) -> AsyncIterator[bytes]:
+    async for file in files:
+        yield file.model_dump_json().encode() + b"\n"
+
+
 def _process_file_path(
     file: UploadFile, folder_path: Optional[str] = None
 ) -> None:
@@ -107,6 +113,18 @@ async def list_files(
     )
 
 
+@router.get("/files-stream", tags=["RAG Files"])
+async def stream_files(
+    request: Request,
+    prefix: Optional[str] = "",
+):
+    """Stream files in storage as NDJSON without sorting or buffering"""
+    return StreamingResponse(
+        _to_ndjson(settings.RAG_STORAGE.iter_files(prefix, request)),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.post("/upload", response_model=FileSchema, tags=["RAG Files"])
 async def upload_file(
     request: Request,
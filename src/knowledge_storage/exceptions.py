@@ -67,6 +67,33 @@ class ItemNotFoundError(KnowledgeStorageError):
         )
 
 
+class EntityNotEmptyError(KnowledgeStorageError):
+    """Raised when deleting a category or subcategory that has contents."""
+
+    def __init__(self, storage_name: str, name: str):
+        self.storage_name = storage_name
+        self.name = name
+        super().__init__(f"'{name}' in storage '{storage_name}' is not empty")
+
+
+class VersionConflictError(KnowledgeStorageError):
+    """Raised when an entity was changed since the caller last read it."""
+
+    def __init__(
+        self,
+        name: str,
+        expected_version: int,
+        actual_version: Optional[int] = None,
+    ):
+        self.name = name
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+        super().__init__(
+            f"'{name}' was modified concurrently: expected version "
+            f"{expected_version}, found {actual_version}"
+        )
+
+
 class UserNotFoundError(KnowledgeStorageError):
     """Raised when a user is not found."""
 
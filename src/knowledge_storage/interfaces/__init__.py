@@ -1,17 +1,27 @@
 from .base_entity_interface import BaseEntityInterface
+from .category_interface import CategoryInterface
 from .knowledge_category_interface import KnowledgeCategoryInterface
+from .knowledge_category_protocol import KnowledgeCategoryReader
+from .knowledge_entity_interface import KnowledgeEntityInterface
 from .knowledge_storage_interface import KnowledgeStorageInterface
 from .permission_interface import PermissionInterface
 from .searchable_interface import SearchableInterface
+from .session_interface import SessionInterface
+from .subcategory_interface import SubCategoryInterface
 from .taggable_interface import TaggableInterface
 from .versionable_interface import VersionableInterface
 
 __all__ = [
     "KnowledgeStorageInterface",
     "KnowledgeCategoryInterface",
+    "KnowledgeCategoryReader",
+    "KnowledgeEntityInterface",
+    "CategoryInterface",
+    "SubCategoryInterface",
     "BaseEntityInterface",
     "TaggableInterface",
     "PermissionInterface",
     "VersionableInterface",
     "SearchableInterface",
+    "SessionInterface",
 ]
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, Union, List
+from typing import Generic, List, TypeVar, Optional
 
-from src.knowledge_storage.schemas import PaginationParams, PaginatedResponse
+from src.knowledge_storage.schemas import (
+    BulkOptions,
+    PaginationParams,
+    PaginatedResponse,
+)
 
 EntityParams = TypeVar("EntityParams")
 EntityPath = TypeVar("EntityPath")
@@ -16,9 +20,10 @@ class BaseEntityInterface(
 
     This interface defines common operations that can be performed on any
     entity in the system, such as creation, retrieval, updating, and deletion.
+    ``create`` and ``delete`` default to the bulk ``create_many`` and
+    ``delete_many`` primitives with a single element.
     """
 
-    @abstractmethod
     async def create(
         self, path: EntityPath, params: EntityParams
     ) -> EntityResult:
@@ -31,24 +36,43 @@ class BaseEntityInterface(
         Returns:
             Created entity details
         """
+        (created,) = await self.create_many(path, [params])
+        return created
+
+    @abstractmethod
+    async def create_many(
+        self,
+        path: EntityPath,
+        params: List[EntityParams],
+        options: Optional[BulkOptions] = None,
+    ) -> List[EntityResult]:
+        """Create several entities under the same parent.
+
+        Args:
+            path: Path to the parent entity
+            params: Parameters for each entity to create
+            options: Optional batching options
+
+        Returns:
+            Created entity details in the same order as ``params``
+        """
         pass
 
     @abstractmethod
-    async def get(
-        self, path: EntityPath, is_detail: bool = False
-    ) -> EntityResult:
+    async def get(self, path: EntityPath) -> EntityResult:
         """Retrieve an entity by its path.
 
+        Detailed views are exposed by each entity interface through its
+        own ``*_detail`` method.
+
         Args:
             path: Path to the entity
-            is_detail: If True, returns detailed information
 
         Returns:
             Entity information
         """
         pass
 
-    @abstractmethod
     async def delete(self, path: EntityPath) -> EntityResult:
         """Delete an entity.
 
@@ -58,6 +82,24 @@ class BaseEntityInterface(
         Returns:
             Deletion details
         """
+        (deleted,) = await self.delete_many([path])
+        return deleted
+
+    @abstractmethod
+    async def delete_many(
+        self,
+        paths: List[EntityPath],
+        options: Optional[BulkOptions] = None,
+    ) -> List[EntityResult]:
+        """Delete several entities.
+
+        Args:
+            paths: Paths to the entities to delete
+            options: Optional batching options
+
+        Returns:
+            Deletion details in the same order as ``paths``
+        """
         pass
 
     @abstractmethod
@@ -91,7 +133,7 @@ class BaseEntityInterface(
     @abstractmethod
     async def list(
         self, path: EntityPath, pagination: Optional[PaginationParams] = None
-    ) -> Union[List[EntityResult], PaginatedResponse]:
+    ) -> PaginatedResponse[EntityResult]:
         """List all entities under a given path.
 
         Args:
@@ -99,6 +141,6 @@ class BaseEntityInterface(
             pagination: Optional pagination parameters
 
         Returns:
-            List of entities or paginated response
+            Paginated response with the entities
         """
         pass
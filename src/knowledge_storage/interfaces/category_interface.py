@@ -0,0 +1,703 @@
+from abc import ABC
+from datetime import datetime
+from typing import (
+    AsyncIterator,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
+
+from src.knowledge_storage.interfaces.knowledge_entity_interface import (
+    EntityRelation,
+    KnowledgeEntityInterface,
+)
+from src.knowledge_storage.schemas import (
+    EntityType,
+    CategoryDeleteSchema,
+    CategoryDetailSchema,
+    CategoryMoveSchema,
+    CategoryRenameSchema,
+    CategoryRow,
+    CategorySchema,
+    CategoryUpdateDescriptionSchema,
+    PaginatedResponse,
+    PaginationParams,
+    MoveSpec,
+    MutationResult,
+    PermissionLevel,
+)
+
+
+class CategoryInterface(KnowledgeEntityInterface, ABC):
+    """
+    Interface for managing top-level knowledge categories.
+
+    Covers creating, renaming, deleting, moving and listing categories
+    together with their tags and permissions. Every method forwards to
+    the ``*_entity`` methods of ``KnowledgeEntityInterface`` with
+    ``EntityType.CATEGORY``, so implementations only provide those.
+    """
+
+    async def create_category(
+        self, storage_name: str, name: str, description: Optional[str] = None
+    ) -> CategorySchema:
+        """
+        Create a new category within a storage.
+
+        Args:
+            storage_name: Name of the parent storage where the category
+                          will be created
+            name: Unique name for the category.
+                  Must not contain special characters
+            description: Optional description of the category's purpose
+                         and contents
+
+        Returns:
+            CategorySchema containing the created category's details
+
+        Raises:
+            ValueError: If category name is invalid or already exists
+            StorageNotFoundError: If parent storage does not exist
+        """
+        (category,) = await self.create_categories(
+            storage_name, [(name, description)]
+        )
+        return category
+
+    async def create_categories(
+        self, storage_name: str, entries: List[Tuple[str, Optional[str]]]
+    ) -> List[CategorySchema]:
+        """
+        Create multiple categories within a storage in one operation.
+
+        Implementations must issue a single backend write for the whole
+        batch rather than one per entry.
+
+        Args:
+            storage_name: Name of the parent storage where the categories
+                          will be created
+            entries: List of (name, description) tuples to create
+
+        Returns:
+            List of CategorySchema in the same order as ``entries``
+
+        Raises:
+            ValueError: If any category name is invalid or already exists
+            StorageNotFoundError: If parent storage does not exist
+        """
+        return await self.create_entities(
+            storage_name, None, entries, entity_type=EntityType.CATEGORY
+        )
+
+    async def rename_category(
+        self,
+        storage_name: str,
+        old_name: str,
+        new_name: str,
+        expected_version: Optional[int] = None,
+    ) -> CategoryRenameSchema:
+        """
+        Rename an existing category.
+
+        Args:
+            storage_name: Name of the parent storage containing the category
+            old_name: Current name of the category to rename
+            new_name: New name for the category.
+                      Must be unique within the storage
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            CategoryRenameSchema with details of the rename operation
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+            ValueError: If new name is invalid or already exists
+            CategoryNotFoundError: If category does not exist
+        """
+        return await self.rename_entity(
+            storage_name,
+            None,
+            old_name,
+            new_name,
+            entity_type=EntityType.CATEGORY,
+            expected_version=expected_version,
+        )
+
+    async def delete_category(
+        self, storage_name: str, name: str
+    ) -> CategoryDeleteSchema:
+        """
+        Delete a category and all its contents.
+
+        Args:
+            storage_name: Name of the parent storage containing the category
+            name: Name of the category to delete
+
+        Returns:
+            CategoryDeleteSchema with details of the deletion operation
+
+        Raises:
+            CategoryNotFoundError: If category does not exist
+            PermissionError: If user lacks delete permissions
+        """
+        (deleted,) = await self.delete_categories(storage_name, [name])
+        return deleted
+
+    async def delete_category_if_empty(
+        self, storage_name: str, name: str
+    ) -> CategoryDeleteSchema:
+        """
+        Delete a category only if it has no subcategories or items.
+
+        Cheaper than ``delete_category`` since nothing has to cascade.
+
+        Args:
+            storage_name: Name of the parent storage containing the category
+            name: Name of the category to delete
+
+        Returns:
+            CategoryDeleteSchema with details of the deletion operation
+
+        Raises:
+            CategoryNotFoundError: If category does not exist
+            EntityNotEmptyError: If the category has contents
+            PermissionError: If user lacks delete permissions
+        """
+        (deleted,) = await self.delete_empty_entities(
+            storage_name, None, [name], entity_type=EntityType.CATEGORY
+        )
+        return deleted
+
+    async def delete_categories(
+        self, storage_name: str, names: List[str]
+    ) -> List[CategoryDeleteSchema]:
+        """
+        Delete multiple categories and all their contents in one operation.
+
+        Args:
+            storage_name: Name of the parent storage containing the categories
+            names: Names of the categories to delete
+
+        Returns:
+            List of CategoryDeleteSchema in the same order as ``names``
+
+        Raises:
+            CategoryNotFoundError: If any category does not exist
+            PermissionError: If user lacks delete permissions
+        """
+        return await self.delete_entities(
+            storage_name, None, names, entity_type=EntityType.CATEGORY
+        )
+
+    async def get_category(
+        self, storage_name: str, name: str
+    ) -> CategorySchema:
+        """
+        Retrieve a category by name.
+
+        Args:
+            storage_name: Name of the parent storage containing the category
+            name: Name of the category to retrieve
+
+        Returns:
+            Category information
+
+        Raises:
+            CategoryNotFoundError: If category does not exist
+            PermissionError: If user lacks read permissions
+        """
+        return await self.get_entity(
+            storage_name, None, name, entity_type=EntityType.CATEGORY
+        )
+
+    async def get_category_detail(
+        self,
+        storage_name: str,
+        name: str,
+        include: Optional[FrozenSet[EntityRelation]] = None,
+    ) -> CategoryDetailSchema:
+        """
+        Retrieve a category by name with its contents and metadata.
+
+        Args:
+            storage_name: Name of the parent storage containing the category
+            name: Name of the category to retrieve
+            include: Relations to load, e.g. ``frozenset({"tags"})``;
+                     None loads all of them
+
+        Returns:
+            Category information with subcategories and items
+
+        Raises:
+            CategoryNotFoundError: If category does not exist
+            PermissionError: If user lacks read permissions
+        """
+        return await self.get_entity_detail(
+            storage_name,
+            None,
+            name,
+            entity_type=EntityType.CATEGORY,
+            include=include,
+        )
+
+    async def list_categories(
+        self,
+        storage_name: str,
+        pagination: Optional[PaginationParams] = None,
+        changed_since: Optional[datetime] = None,
+    ) -> PaginatedResponse[CategorySchema]:
+        """
+        List all categories in a storage.
+
+        With ``changed_since`` only categories whose ``update_time`` is
+        later are returned, ordered by ``update_time``, so clients can sync
+        deltas instead of re-listing everything. Every mutating call must
+        bump ``update_time``; clients pass the largest ``update_time`` they
+        received as the next ``changed_since``.
+
+        Args:
+            storage_name: Name of the storage to list categories from
+            pagination: Optional parameters for paginated results
+            changed_since: Optional lower bound (exclusive) on update_time
+
+        Returns:
+            Paginated response with the categories
+
+        Raises:
+            StorageNotFoundError: If storage does not exist
+            PermissionError: If user lacks list permissions
+        """
+        return await self.list_entities(
+            storage_name,
+            None,
+            pagination,
+            changed_since,
+            entity_type=EntityType.CATEGORY,
+        )
+
+    def iter_categories(
+        self,
+        storage_name: str,
+        changed_since: Optional[datetime] = None,
+    ) -> AsyncIterator[CategorySchema]:
+        """
+        Stream all categories in a storage one at a time.
+
+        Prefer this over ``list_categories`` for exports and other callers
+        that consume the whole listing.
+
+        Args:
+            storage_name: Name of the storage to list categories from
+            changed_since: Optional lower bound (exclusive) on update_time
+
+        Returns:
+            AsyncIterator[CategorySchema]: Categories in listing order
+        """
+        return self.iter_entities(
+            storage_name,
+            None,
+            changed_since,
+            entity_type=EntityType.CATEGORY,
+        )
+
+    def iter_category_rows(
+        self,
+        storage_name: str,
+        changed_since: Optional[datetime] = None,
+    ) -> AsyncIterator[CategoryRow]:
+        """
+        Stream categories as lightweight ``CategoryRow`` tuples.
+
+        Cheaper than ``iter_categories`` when rows are consumed in
+        process; call ``CategoryRow.to_schema`` only for rows that are
+        returned to clients.
+
+        Args:
+            storage_name: Name of the storage to list categories from
+            changed_since: Optional lower bound (exclusive) on update_time
+
+        Returns:
+            AsyncIterator[CategoryRow]: Categories in listing order
+        """
+        return cast(
+            AsyncIterator[CategoryRow],
+            self.iter_entity_rows(
+                storage_name,
+                None,
+                changed_since,
+                entity_type=EntityType.CATEGORY,
+            ),
+        )
+
+    async def update_category_description(
+        self,
+        storage_name: str,
+        name: str,
+        description: str,
+        expected_version: Optional[int] = None,
+    ) -> CategoryUpdateDescriptionSchema:
+        """
+        Update the description of a category.
+
+        Args:
+            storage_name: Name of the parent storage containing the category
+            name: Name of the category to update
+            description: New description text
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            CategoryUpdateDescriptionSchema with update details
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+            CategoryNotFoundError: If category does not exist
+            PermissionError: If user lacks update permissions
+        """
+        return cast(
+            CategoryUpdateDescriptionSchema,
+            await self.update_entity_description(
+                storage_name,
+                None,
+                name,
+                description,
+                entity_type=EntityType.CATEGORY,
+                expected_version=expected_version,
+            ),
+        )
+
+    async def move_category(
+        self,
+        storage_name: str,
+        name: str,
+        new_storage_name: str,
+        expected_version: Optional[int] = None,
+    ) -> CategoryMoveSchema:
+        """
+        Move a category to a different storage.
+
+        A move only updates the category's parent reference; the content
+        of its items must not be re-read or re-written.
+
+        Args:
+            storage_name: Current parent storage name
+            name: Name of the category to move
+            new_storage_name: Target storage name
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            CategoryMoveSchema with move operation details
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+            CategoryNotFoundError: If category does not exist
+            StorageNotFoundError: If target storage does not exist
+            PermissionError: If user lacks move permissions
+        """
+        return cast(
+            CategoryMoveSchema,
+            await self.move_entity(
+                storage_name,
+                None,
+                name,
+                new_storage_name,
+                entity_type=EntityType.CATEGORY,
+                expected_version=expected_version,
+            ),
+        )
+
+    async def move_categories(
+        self, storage_name: str, moves: List[MoveSpec]
+    ) -> List[CategoryMoveSchema]:
+        """
+        Move several categories of a storage in one operation.
+
+        Args:
+            storage_name: Current parent storage name
+            moves: Category name, target storage and optional expected
+                   version for each move
+
+        Returns:
+            List of CategoryMoveSchema in the same order as ``moves``
+
+        Raises:
+            CategoryNotFoundError: If any category does not exist
+            StorageNotFoundError: If any target storage does not exist
+            VersionConflictError: If any ``expected_version`` is stale
+        """
+        return cast(
+            List[CategoryMoveSchema],
+            await self.move_entities(
+                storage_name, None, moves, entity_type=EntityType.CATEGORY
+            ),
+        )
+
+    async def set_category_permission(
+        self,
+        storage_name: str,
+        name: str,
+        user_id: str,
+        permission: PermissionLevel,
+        expected_version: Optional[int] = None,
+    ) -> MutationResult:
+        """
+        Set the permission level for a user on a category.
+
+        Args:
+            storage_name: Name of the parent storage containing the category
+            name: Name of the category
+            user_id: ID of the user to set permissions for
+            permission: Permission level to set (READ, WRITE, ADMIN)
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Version and update time of the category after the change
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+            CategoryNotFoundError: If category does not exist
+            UserNotFoundError: If user does not exist
+            PermissionError: If current user lacks permission management rights
+        """
+        (result,) = await self.set_category_permissions(
+            storage_name,
+            [(name, user_id, permission)],
+            expected_versions=[expected_version],
+        )
+        return result
+
+    async def set_category_permissions(
+        self,
+        storage_name: str,
+        assignments: List[Tuple[str, str, PermissionLevel]],
+        expected_versions: Optional[List[Optional[int]]] = None,
+    ) -> List[MutationResult]:
+        """
+        Set permission levels on several categories in one operation.
+
+        Args:
+            storage_name: Name of the parent storage containing the categories
+            assignments: List of (category name, user ID, permission)
+                         tuples to apply
+            expected_versions: Versions the caller last read, aligned with
+                               ``assignments``
+
+        Returns:
+            Version and update time of each category, in input order
+
+        Raises:
+            CategoryNotFoundError: If any category does not exist
+            UserNotFoundError: If any user does not exist
+            PermissionError: If current user lacks permission management rights
+        """
+        return await self.set_entity_permissions(
+            storage_name,
+            None,
+            assignments,
+            entity_type=EntityType.CATEGORY,
+            expected_versions=expected_versions,
+        )
+
+    async def remove_category_permission(
+        self,
+        storage_name: str,
+        name: str,
+        user_id: str,
+        expected_version: Optional[int] = None,
+    ) -> MutationResult:
+        """
+        Remove user permissions from a category.
+
+        Args:
+            storage_name: Name of the parent storage containing the category
+            name: Name of the category
+            user_id: ID of the user to remove permissions from
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Version and update time of the category after the change
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+            CategoryNotFoundError: If category does not exist
+            UserNotFoundError: If user does not exist
+            PermissionError: If current user lacks permission management rights
+        """
+        return await self.remove_entity_permission(
+            storage_name,
+            None,
+            name,
+            user_id,
+            entity_type=EntityType.CATEGORY,
+            expected_version=expected_version,
+        )
+
+    async def add_category_tag(
+        self,
+        storage_name: str,
+        name: str,
+        tag: str,
+        expected_version: Optional[int] = None,
+    ) -> MutationResult:
+        """
+        Add a tag to a category.
+
+        Args:
+            storage_name: Name of the parent storage containing the category
+            name: Name of the category
+            tag: Tag to add. Must be alphanumeric with optional underscores
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Version and update time of the category after the change
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+            CategoryNotFoundError: If category does not exist
+            ValueError: If tag format is invalid
+            PermissionError: If user lacks update permissions
+        """
+        (result,) = await self.add_category_tags(
+            storage_name, [(name, tag)], expected_versions=[expected_version]
+        )
+        return result
+
+    async def add_category_tags(
+        self,
+        storage_name: str,
+        assignments: List[Tuple[str, str]],
+        expected_versions: Optional[List[Optional[int]]] = None,
+    ) -> List[MutationResult]:
+        """
+        Add tags to several categories in one operation.
+
+        Args:
+            storage_name: Name of the parent storage containing the categories
+            assignments: List of (category name, tag) tuples to apply
+            expected_versions: Versions the caller last read, aligned with
+                               ``assignments``
+
+        Returns:
+            Version and update time of each category, in input order
+
+        Raises:
+            CategoryNotFoundError: If any category does not exist
+            ValueError: If any tag format is invalid
+            PermissionError: If user lacks update permissions
+        """
+        return await self.add_entity_tags(
+            storage_name,
+            None,
+            assignments,
+            entity_type=EntityType.CATEGORY,
+            expected_versions=expected_versions,
+        )
+
+    async def remove_category_tag(
+        self, storage_name: str, name: str, tag: str
+    ) -> MutationResult:
+        """
+        Remove a tag from a category.
+
+        Args:
+            storage_name: Name of the parent storage containing the category
+            name: Name of the category
+            tag: Tag to remove
+
+        Returns:
+            Version and update time of the category after the change
+
+        Raises:
+            CategoryNotFoundError: If category does not exist
+            ValueError: If tag does not exist
+            PermissionError: If user lacks update permissions
+        """
+        category = await self.get_category(storage_name, name)
+        if tag not in category.tags:
+            raise ValueError(f"Tag '{tag}' not found on category '{name}'")
+        return await self.set_category_tags(
+            storage_name,
+            name,
+            category.tags - {tag},
+            expected_version=category.version,
+        )
+
+    async def set_category_tags(
+        self,
+        storage_name: str,
+        name: str,
+        tags: Set[str],
+        expected_version: Optional[int] = None,
+    ) -> MutationResult:
+        """
+        Replace the tags of a category with ``tags``.
+
+        Implementations must apply the difference against the stored tags
+        in one backend statement (delete the missing tags, insert the new
+        ones) instead of one call per tag.
+
+        Args:
+            storage_name: Name of the parent storage containing the category
+            name: Name of the category
+            tags: Complete new set of tags
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Version and update time of the category after the change
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+            CategoryNotFoundError: If category does not exist
+            ValueError: If any tag format is invalid
+            PermissionError: If user lacks update permissions
+        """
+        return await self.set_entity_tags(
+            storage_name,
+            None,
+            name,
+            tags,
+            entity_type=EntityType.CATEGORY,
+            expected_version=expected_version,
+        )
+
+    async def patch_category_tags(
+        self,
+        storage_name: str,
+        name: str,
+        add: Set[str],
+        remove: Set[str],
+    ) -> MutationResult:
+        """
+        Add and remove tags of a category in one operation.
+
+        Args:
+            storage_name: Name of the parent storage containing the category
+            name: Name of the category
+            add: Tags to add
+            remove: Tags to remove; tags that are not set are ignored
+
+        Returns:
+            Version and update time of the category after the change
+
+        Raises:
+            CategoryNotFoundError: If category does not exist
+            ValueError: If any tag format is invalid
+            PermissionError: If user lacks update permissions
+        """
+        return await self.patch_entity_tags(
+            storage_name,
+            None,
+            name,
+            add,
+            remove,
+            entity_type=EntityType.CATEGORY,
+        )
@@ -0,0 +1,90 @@
+from datetime import datetime
+from typing import FrozenSet, Optional, Protocol
+
+from src.knowledge_storage.interfaces.knowledge_entity_interface import (
+    EntityRelation,
+)
+from src.knowledge_storage.schemas import (
+    CategoryDetailSchema,
+    CategorySchema,
+    EntityType,
+    PaginatedResponse,
+    PaginationParams,
+    PermissionLevel,
+    SubCategoryDetailSchema,
+    SubCategorySchema,
+)
+
+
+class KnowledgeCategoryReader(Protocol):
+    """
+    Read-only view of a category storage for consumers.
+
+    Services that only look categories up should type-hint this protocol
+    instead of ``KnowledgeCategoryInterface``. Any implementation of the
+    interface satisfies it structurally, and tests can pass small fakes
+    that implement just these methods. It is deliberately not
+    ``runtime_checkable``, so it adds nothing at call time.
+
+    Implementations that declare ``__slots__`` must keep ``"__dict__"``
+    in them: the interface mixins keep their per-instance caches there.
+    """
+
+    async def get_category(
+        self, storage_name: str, name: str
+    ) -> CategorySchema:
+        pass
+
+    async def get_category_detail(
+        self,
+        storage_name: str,
+        name: str,
+        include: Optional[FrozenSet[EntityRelation]] = None,
+    ) -> CategoryDetailSchema:
+        pass
+
+    async def list_categories(
+        self,
+        storage_name: str,
+        pagination: Optional[PaginationParams] = None,
+        changed_since: Optional[datetime] = None,
+    ) -> PaginatedResponse[CategorySchema]:
+        pass
+
+    async def get_subcategory(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+    ) -> SubCategorySchema:
+        pass
+
+    async def get_subcategory_detail(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+        include: Optional[FrozenSet[EntityRelation]] = None,
+    ) -> SubCategoryDetailSchema:
+        pass
+
+    async def list_subcategories(
+        self,
+        storage_name: str,
+        category_name: str,
+        pagination: Optional[PaginationParams] = None,
+        changed_since: Optional[datetime] = None,
+    ) -> PaginatedResponse[SubCategorySchema]:
+        pass
+
+    async def check_entity_permission(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        user_id: str,
+        permission: PermissionLevel,
+        *,
+        entity_type: EntityType,
+    ) -> bool:
+        pass
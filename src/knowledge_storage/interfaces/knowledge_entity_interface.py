@@ -0,0 +1,989 @@
+import logging
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    overload,
+)
+
+from src.knowledge_storage.cache import MISSING, LRUCache
+from src.knowledge_storage.schemas import (
+    CategoryDeleteSchema,
+    CategoryDetailSchema,
+    CategoryRenameSchema,
+    CategoryRow,
+    CategorySchema,
+    EntityOp,
+    EntityOpResult,
+    EntityType,
+    InvalidationEvent,
+    LockToken,
+    MaterializedPath,
+    MoveSchema,
+    MoveSpec,
+    MutationResult,
+    PaginatedResponse,
+    PaginationParams,
+    PermissionLevel,
+    SubCategoryDetailSchema,
+    SubCategoryRow,
+    SubCategorySchema,
+    UpdateDescriptionSchema,
+    materialized_path,
+)
+
+logger = logging.getLogger(__name__)
+
+EntityRelation = Literal["tags", "permissions", "subcategories", "items"]
+
+
+class KnowledgeEntityInterface(ABC):
+    """
+    Unified interface for categories and subcategories.
+
+    Categories and subcategories support the same operations and differ
+    only in their parent: a category lives in a storage, a subcategory in
+    a category. Implementations provide these ``*_entity`` methods once,
+    parametrized by ``entity_type``, and ``CategoryInterface`` and
+    ``SubCategoryInterface`` forward to them.
+
+    ``parent_name`` is None for categories and the category name for
+    subcategories. Bulk methods must reach the backend as one batched
+    statement, e.g. ``asyncpg.Connection.executemany`` or a multi-row
+    query for PostgreSQL, never a Python loop over single-row queries.
+    """
+
+    _PERMISSION_BOUNDARIES_TTL = 300.0
+    _PERMISSION_BOUNDARIES_MAXSIZE = 50_000
+    # Operations that can neither grant nor revoke access anywhere in the
+    # hierarchy; every other op resets the permission boundaries.
+    _BOUNDARY_NEUTRAL_OPS = frozenset({"update_description", "add_tag"})
+
+    def register_invalidation_listener(
+        self, listener: Callable[[InvalidationEvent], Awaitable[None]]
+    ) -> None:
+        """
+        Subscribe to changes of categories and subcategories.
+
+        Listeners are awaited after every successful mutation, so caller
+        side caches can drop exactly the affected entries. Deployments
+        with several workers should register a listener that republishes
+        events to a shared channel.
+
+        Args:
+            listener: Coroutine function receiving each InvalidationEvent
+        """
+        self.__dict__.setdefault("_invalidation_listeners", []).append(
+            listener
+        )
+
+    async def _emit_invalidation(self, event: InvalidationEvent) -> None:
+        """
+        Notify listeners of a change.
+
+        Implementations call this from every mutating method once the
+        change is committed. Any op except a description or tag change
+        also resets the cached permission boundaries: a deleted entity
+        recreated under the same path must not inherit the old grant.
+
+        The change is already committed, so a failing listener is logged
+        and does not stop the others or reach the caller.
+        """
+        if event.op not in self._BOUNDARY_NEUTRAL_OPS:
+            self._forget_permission_boundaries()
+        for listener in self.__dict__.get("_invalidation_listeners", ()):
+            try:
+                await listener(event)
+            except Exception:
+                logger.exception(
+                    f"Invalidation listener failed for {event.op} of "
+                    f"{event.storage_name}/{event.name}"
+                )
+
+    @abstractmethod
+    async def create_entities(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        entries: List[Tuple[str, Optional[str]]],
+        *,
+        entity_type: EntityType,
+    ) -> List[CategorySchema]:
+        """
+        Create multiple entities under one parent.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            entries: List of (name, description) tuples to create
+            entity_type: Kind of entity to create
+
+        Returns:
+            Created entities in the same order as ``entries``
+        """
+        pass
+
+    @abstractmethod
+    async def delete_entities(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        names: List[str],
+        *,
+        entity_type: EntityType,
+    ) -> List[CategoryDeleteSchema]:
+        """
+        Delete multiple entities and all their contents.
+
+        This is the slow path. Contents should be removed by the backend,
+        e.g. ``ON DELETE CASCADE`` foreign keys, rather than by deleting
+        child rows one by one from Python. Prefer
+        ``delete_empty_entities`` when the entities are known to be empty.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            names: Names of the entities to delete
+            entity_type: Kind of entity to delete
+
+        Returns:
+            Deletion details in the same order as ``names``
+        """
+        pass
+
+    @abstractmethod
+    async def delete_empty_entities(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        names: List[str],
+        *,
+        entity_type: EntityType,
+    ) -> List[CategoryDeleteSchema]:
+        """
+        Delete entities that have no subcategories or items.
+
+        The emptiness check is part of the delete statement itself, e.g.
+        ``DELETE ... WHERE NOT EXISTS (SELECT 1 FROM children ...)``, so
+        no cascade runs and no separate count query is needed. Nothing
+        is deleted if any of the entities is not empty.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            names: Names of the entities to delete
+            entity_type: Kind of entity to delete
+
+        Returns:
+            Deletion details in the same order as ``names``
+
+        Raises:
+            EntityNotEmptyError: If any entity still has contents
+        """
+        pass
+
+    @abstractmethod
+    async def rename_entity(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        old_name: str,
+        new_name: str,
+        *,
+        entity_type: EntityType,
+        expected_version: Optional[int] = None,
+    ) -> CategoryRenameSchema:
+        """
+        Rename an entity.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            old_name: Current name of the entity
+            new_name: New name, unique within the parent
+            entity_type: Kind of entity to rename
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Rename operation details
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+        """
+        pass
+
+    @overload
+    async def get_entity(
+        self,
+        storage_name: str,
+        parent_name: None,
+        name: str,
+        *,
+        entity_type: Literal[EntityType.CATEGORY],
+    ) -> CategorySchema:
+        pass
+
+    @overload
+    async def get_entity(
+        self,
+        storage_name: str,
+        parent_name: str,
+        name: str,
+        *,
+        entity_type: Literal[EntityType.SUBCATEGORY],
+    ) -> SubCategorySchema:
+        pass
+
+    @abstractmethod
+    async def get_entity(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        *,
+        entity_type: EntityType,
+    ) -> CategorySchema:
+        """
+        Retrieve an entity by name.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            name: Name of the entity
+            entity_type: Kind of entity to retrieve
+
+        Returns:
+            Entity information
+        """
+        pass
+
+    @abstractmethod
+    async def get_entity_by_path(
+        self, path: MaterializedPath
+    ) -> CategorySchema:
+        """
+        Retrieve a category or subcategory by its materialized path.
+
+        Implementations store the path, as built by ``materialized_path``,
+        in an indexed column, so this is a single index probe instead of
+        resolving the storage, category and subcategory one after another.
+        The entity type follows from the number of path segments.
+
+        Args:
+            path: ``storage/category`` or ``storage/category/subcategory``
+
+        Returns:
+            CategorySchema or SubCategorySchema of the entity
+        """
+        pass
+
+    @overload
+    async def get_entity_detail(
+        self,
+        storage_name: str,
+        parent_name: None,
+        name: str,
+        *,
+        entity_type: Literal[EntityType.CATEGORY],
+        include: Optional[FrozenSet[EntityRelation]] = None,
+    ) -> CategoryDetailSchema:
+        pass
+
+    @overload
+    async def get_entity_detail(
+        self,
+        storage_name: str,
+        parent_name: str,
+        name: str,
+        *,
+        entity_type: Literal[EntityType.SUBCATEGORY],
+        include: Optional[FrozenSet[EntityRelation]] = None,
+    ) -> SubCategoryDetailSchema:
+        pass
+
+    @abstractmethod
+    async def get_entity_detail(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        *,
+        entity_type: EntityType,
+        include: Optional[FrozenSet[EntityRelation]] = None,
+    ) -> CategorySchema:
+        """
+        Retrieve an entity by name with its contents.
+
+        Only the relations in ``include`` are loaded, each with one query
+        (or one lateral join) for the whole entity, never per child row.
+        Relations that are not requested are left empty on the returned
+        schema. Implementations can key prepared statements by the
+        ``include`` set, since it is hashable.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            name: Name of the entity
+            entity_type: Kind of entity to retrieve
+            include: Relations to load; None loads all of them
+
+        Returns:
+            The detail schema matching ``entity_type``
+        """
+        pass
+
+    @abstractmethod
+    async def list_entities(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        pagination: Optional[PaginationParams] = None,
+        changed_since: Optional[datetime] = None,
+        *,
+        entity_type: EntityType,
+    ) -> PaginatedResponse[CategorySchema]:
+        """
+        List the entities under a parent.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            pagination: Optional pagination parameters
+            changed_since: Only return entities whose update_time is later,
+                           ordered by update_time
+            entity_type: Kind of entity to list
+
+        Returns:
+            Paginated response with the entities
+        """
+        pass
+
+    @abstractmethod
+    def iter_entities(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        changed_since: Optional[datetime] = None,
+        *,
+        entity_type: EntityType,
+    ) -> AsyncIterator[CategorySchema]:
+        """
+        Iterate over all entities under a parent without paging.
+
+        Implementations are async generators that yield each row as it is
+        read from a server-side cursor, so the full result set is never
+        held in memory.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            changed_since: Only yield entities updated after this time
+            entity_type: Kind of entity to list
+
+        Returns:
+            AsyncIterator[CategorySchema]: Entities in listing order
+        """
+        pass
+
+    @abstractmethod
+    def iter_entity_rows(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        changed_since: Optional[datetime] = None,
+        *,
+        entity_type: EntityType,
+    ) -> AsyncIterator[Union[CategoryRow, SubCategoryRow]]:
+        """
+        Like ``iter_entities``, but yields unvalidated row tuples.
+
+        Implementations build each row directly from the backend record,
+        without a dict or pydantic model in between.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            changed_since: Only yield entities updated after this time
+            entity_type: Kind of entity to list
+
+        Returns:
+            AsyncIterator: CategoryRow or SubCategoryRow per entity
+        """
+        pass
+
+    @abstractmethod
+    async def update_entity_description(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        description: str,
+        *,
+        entity_type: EntityType,
+        expected_version: Optional[int] = None,
+    ) -> UpdateDescriptionSchema:
+        """
+        Update the description of an entity.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            name: Name of the entity
+            description: New description text
+            entity_type: Kind of entity to update
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Update details
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+        """
+        pass
+
+    async def move_entity(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        new_parent_name: str,
+        *,
+        entity_type: EntityType,
+        expected_version: Optional[int] = None,
+    ) -> MoveSchema:
+        """
+        Move an entity to a new parent.
+
+        A move only updates the parent reference; the content of the
+        entity's items must not be re-read or re-written.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            name: Name of the entity
+            new_parent_name: Target storage for categories, target
+                             category for subcategories
+            entity_type: Kind of entity to move
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Move operation details
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+        """
+        (moved,) = await self.move_entities(
+            storage_name,
+            parent_name,
+            [MoveSpec(name, new_parent_name, expected_version)],
+            entity_type=entity_type,
+        )
+        return moved
+
+    @abstractmethod
+    async def move_entities(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        moves: List[MoveSpec],
+        *,
+        entity_type: EntityType,
+    ) -> List[MoveSchema]:
+        """
+        Move several entities of one parent in a single operation.
+
+        All target parents are validated with one lookup before anything
+        is written, and the moves are applied as one multi-row update,
+        e.g. ``UPDATE ... FROM (VALUES ...)``. The hierarchy has a fixed
+        depth (storage, category, subcategory), so a move cannot create
+        a cycle and no ancestor walk is needed. Either every move is
+        applied or none is.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            moves: Entity name, target parent and optional expected
+                   version for each move
+            entity_type: Kind of entity to move
+
+        Returns:
+            Move operation details in the same order as ``moves``
+
+        Raises:
+            VersionConflictError: If any ``expected_version`` is stale
+        """
+        pass
+
+    @abstractmethod
+    async def set_entity_permissions(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        assignments: List[Tuple[str, str, PermissionLevel]],
+        *,
+        entity_type: EntityType,
+        expected_versions: Optional[List[Optional[int]]] = None,
+    ) -> List[MutationResult]:
+        """
+        Set permission levels on several entities.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            assignments: List of (entity name, user ID, permission) tuples
+            entity_type: Kind of entity to update
+            expected_versions: Versions the caller last read, aligned
+                               with ``assignments``; None entries skip
+                               the check
+
+        Returns:
+            Version and update time of each entity, in input order
+
+        Raises:
+            VersionConflictError: If any expected version is stale
+        """
+        pass
+
+    @abstractmethod
+    async def remove_entity_permission(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        user_id: str,
+        *,
+        entity_type: EntityType,
+        expected_version: Optional[int] = None,
+    ) -> MutationResult:
+        """
+        Remove user permissions from an entity.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            name: Name of the entity
+            user_id: ID of the user
+            entity_type: Kind of entity to update
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Version and update time of the entity after the change
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+        """
+        pass
+
+    async def check_entity_permission(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        user_id: str,
+        permission: PermissionLevel,
+        *,
+        entity_type: EntityType,
+    ) -> bool:
+        """
+        Check whether a user holds at least ``permission`` on an entity.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            name: Name of the entity
+            user_id: ID of the user
+            permission: Required permission level
+            entity_type: Kind of entity to check
+
+        Returns:
+            True if the permission is granted directly or inherited
+        """
+        (allowed,) = await self.check_entity_permissions(
+            storage_name,
+            parent_name,
+            [(name, user_id, permission)],
+            entity_type=entity_type,
+        )
+        return allowed
+
+    @abstractmethod
+    async def check_entity_permissions(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        checks: List[Tuple[str, str, PermissionLevel]],
+        *,
+        entity_type: EntityType,
+    ) -> List[bool]:
+        """
+        Check several (entity, user, permission) triples at once.
+
+        Grants inherited from the storage or parent category are resolved
+        once per batch and shared by every check in it, instead of being
+        looked up again for each entity. Implementations are expected to
+        cache results in process with a short TTL, and in a shared cache
+        when running several workers. Both caches must be invalidated by
+        ``set_entity_permissions`` and ``remove_entity_permission``.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            checks: List of (entity name, user ID, required permission)
+            entity_type: Kind of entity to check
+
+        Returns:
+            One result per check, in the same order as ``checks``
+        """
+        pass
+
+    @abstractmethod
+    async def batch_ops(
+        self,
+        storage_name: str,
+        ops: List[EntityOp],
+        *,
+        atomic: bool = True,
+    ) -> List[EntityOpResult]:
+        """
+        Apply several entity operations in one round trip.
+
+        Operations run in order. Implementations should group consecutive
+        operations of the same kind on the same entity, e.g. several
+        ``add_tag`` ops become one tags update, and reuse prepared
+        statements across the batch.
+
+        Args:
+            storage_name: Name of the storage all operations target
+            ops: Operations to apply
+            atomic: If True, run everything in one transaction and roll
+                    back on the first failure; otherwise failed operations
+                    are reported and the rest still run
+
+        Returns:
+            One result per operation, in the same order as ``ops``
+        """
+        pass
+
+    @abstractmethod
+    async def get_permission_boundary(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        user_id: str,
+        permission: PermissionLevel,
+        *,
+        entity_type: EntityType,
+    ) -> Optional[MaterializedPath]:
+        """
+        Find the nearest path that grants ``permission`` on an entity.
+
+        Walks ``storage -> category -> subcategory`` from the entity
+        upwards and stops at the first level with an explicit grant for
+        the user. Callers should go through ``resolve_permission_boundary``
+        so the walk happens once per entity rather than on every check.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            name: Name of the entity
+            user_id: ID of the user
+            permission: Required permission level
+            entity_type: Kind of entity to check
+
+        Returns:
+            Path of the level holding the grant, or None if nothing grants
+            the permission
+        """
+        pass
+
+    async def resolve_permission_boundary(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        user_id: str,
+        permission: PermissionLevel,
+        *,
+        entity_type: EntityType,
+    ) -> Optional[MaterializedPath]:
+        """
+        Cached ``get_permission_boundary``.
+
+        Boundaries, including the absence of one, are kept in process for
+        ``_PERMISSION_BOUNDARIES_TTL`` seconds. They are dropped by
+        ``_emit_invalidation`` whenever permissions change or an entity
+        moves.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            name: Name of the entity
+            user_id: ID of the user
+            permission: Required permission level
+            entity_type: Kind of entity to check
+
+        Returns:
+            Path of the level holding the grant, or None
+        """
+        key = (
+            user_id,
+            permission,
+            materialized_path(storage_name, parent_name, name),
+        )
+        cache: Optional[
+            LRUCache[
+                Tuple[str, PermissionLevel, MaterializedPath],
+                Optional[MaterializedPath],
+            ]
+        ] = self.__dict__.get("_permission_boundaries")
+        if cache is None:
+            cache = self.__dict__["_permission_boundaries"] = LRUCache(
+                self._PERMISSION_BOUNDARIES_MAXSIZE,
+                ttl=self._PERMISSION_BOUNDARIES_TTL,
+            )
+        boundary = cache.get(key)
+        if boundary is MISSING:
+            generation = self.__dict__.get("_permission_generation", 0)
+            boundary = await self.get_permission_boundary(
+                storage_name,
+                parent_name,
+                name,
+                user_id,
+                permission,
+                entity_type=entity_type,
+            )
+            # A change during the lookup may have revoked this boundary.
+            if generation == self.__dict__.get("_permission_generation", 0):
+                cache.set(key, boundary)
+        return boundary
+
+    def _forget_permission_boundaries(self) -> None:
+        """
+        Drop every cached permission boundary.
+
+        A grant on a storage or category moves the boundary of all its
+        descendants, so the whole cache is cleared on any change. The
+        generation is bumped as well so lookups still in flight do not
+        store their pre-change result.
+        """
+        self.__dict__["_permission_generation"] = (
+            self.__dict__.get("_permission_generation", 0) + 1
+        )
+        cache = self.__dict__.get("_permission_boundaries")
+        if cache is not None:
+            cache.clear()
+
+    @abstractmethod
+    async def try_acquire_entity_lock(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        *,
+        entity_type: EntityType,
+        exclusive: bool = True,
+    ) -> Optional[LockToken]:
+        """
+        Try to lock an entity without waiting.
+
+        Must not block the event loop, e.g. ``pg_try_advisory_lock`` or
+        Redis ``SET NX PX`` with an expiry, never a blocking row lock.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            name: Name of the entity
+            entity_type: Kind of entity to lock
+            exclusive: False for a shared lock
+
+        Returns:
+            LockToken if the lock was taken, None if it is held elsewhere
+        """
+        pass
+
+    @abstractmethod
+    async def wait_entity_lock(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        *,
+        entity_type: EntityType,
+    ) -> None:
+        """
+        Wait until the lock on an entity is released.
+
+        Implementations wait on a release notification (e.g. pub/sub)
+        rather than polling.
+        """
+        pass
+
+    @abstractmethod
+    async def release_entity_lock(self, token: LockToken) -> None:
+        """
+        Release a lock taken with ``try_acquire_entity_lock``.
+
+        Args:
+            token: Token returned when the lock was taken
+        """
+        pass
+
+    @asynccontextmanager
+    async def entity_lock(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        *,
+        entity_type: EntityType,
+        exclusive: bool = True,
+    ) -> AsyncIterator[LockToken]:
+        """
+        Hold a lock on an entity for the duration of the block.
+
+        Retries ``try_acquire_entity_lock`` after each release
+        notification, so waiting never blocks the event loop. When taking
+        several locks, acquire them in ``materialized_path`` order to
+        avoid deadlocks.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            name: Name of the entity
+            entity_type: Kind of entity to lock
+            exclusive: False for a shared lock
+
+        Yields:
+            LockToken of the held lock
+        """
+        while True:
+            token = await self.try_acquire_entity_lock(
+                storage_name,
+                parent_name,
+                name,
+                entity_type=entity_type,
+                exclusive=exclusive,
+            )
+            if token is not None:
+                break
+            await self.wait_entity_lock(
+                storage_name, parent_name, name, entity_type=entity_type
+            )
+        try:
+            yield token
+        finally:
+            await self.release_entity_lock(token)
+
+    @abstractmethod
+    async def add_entity_tags(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        assignments: List[Tuple[str, str]],
+        *,
+        entity_type: EntityType,
+        expected_versions: Optional[List[Optional[int]]] = None,
+    ) -> List[MutationResult]:
+        """
+        Add tags to several entities.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            assignments: List of (entity name, tag) tuples
+            entity_type: Kind of entity to update
+            expected_versions: Versions the caller last read, aligned
+                               with ``assignments``; None entries skip
+                               the check
+
+        Returns:
+            Version and update time of each entity, in input order
+
+        Raises:
+            VersionConflictError: If any expected version is stale
+        """
+        pass
+
+    @abstractmethod
+    async def set_entity_tags(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        tags: Set[str],
+        *,
+        entity_type: EntityType,
+        expected_version: Optional[int] = None,
+    ) -> MutationResult:
+        """
+        Replace the tags of an entity with ``tags``.
+
+        The difference against the stored tags must be applied in one
+        backend statement, not one call per added or removed tag. Tags
+        should be stored sorted so equal sets always produce the same
+        stored value.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            name: Name of the entity
+            tags: Complete new set of tags
+            entity_type: Kind of entity to update
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Version and update time of the entity after the change
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+        """
+        pass
+
+    @abstractmethod
+    async def patch_entity_tags(
+        self,
+        storage_name: str,
+        parent_name: Optional[str],
+        name: str,
+        add: Set[str],
+        remove: Set[str],
+        *,
+        entity_type: EntityType,
+    ) -> MutationResult:
+        """
+        Add and remove tags of an entity in one statement.
+
+        The diff is applied by the backend against the stored tags, e.g.
+        ``SET tags = array(SELECT unnest(tags || $1) EXCEPT SELECT
+        unnest($2))``, so concurrent patches do not overwrite each other
+        and no prior read is needed. Tags in ``remove`` that are not set
+        are ignored.
+
+        Args:
+            storage_name: Name of the parent storage
+            parent_name: Name of the parent category, None for categories
+            name: Name of the entity
+            add: Tags to add
+            remove: Tags to remove
+            entity_type: Kind of entity to update
+
+        Returns:
+            Version and update time of the entity after the change
+        """
+        pass
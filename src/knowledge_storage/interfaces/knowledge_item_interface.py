@@ -1,38 +1,82 @@
+import asyncio
+import logging
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union, Dict, Any, Set, Tuple
-
-from fastapi import UploadFile
-from pydantic import HttpUrl
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
-from src.knowledge_storage.interfaces import (
+from src.knowledge_storage.cache import MISSING, LRUCache
+from src.knowledge_storage.interfaces.base_entity_interface import (
     BaseEntityInterface,
-    TaggableInterface,
+)
+from src.knowledge_storage.interfaces.permission_interface import (
     PermissionInterface,
+)
+from src.knowledge_storage.interfaces.searchable_interface import (
     SearchableInterface,
+)
+from src.knowledge_storage.interfaces.session_interface import (
+    SessionInterface,
+)
+from src.knowledge_storage.interfaces.taggable_interface import (
+    TaggableInterface,
+)
+from src.knowledge_storage.interfaces.versionable_interface import (
     VersionableInterface,
 )
 from src.knowledge_storage.schemas import (
+    BulkOptions,
     ItemCreateSchema,
     ItemDeleteSchema,
     ItemRenameSchema,
     ItemDetailSchema,
+    ItemPath,
     ItemSchema,
     SmartSearchResponseSchema,
+    SmartSearchSchema,
     ItemUpdateDescriptionSchema,
     ItemMoveSchema,
     ItemVersionSchema,
+    ItemSource,
     PaginationParams,
     PaginatedResponse,
     PermissionLevel,
 )
 
+logger = logging.getLogger(__name__)
+
+RelatedField = Literal["tags", "permissions", "versions"]
+StoreResult = TypeVar("StoreResult")
+
+
+def _consume_task_result(task: "asyncio.Task[Any]") -> None:
+    """Mark a prefetch result as retrieved even if nobody awaits it."""
+    if not task.cancelled():
+        task.exception()
+
 
 class KnowledgeItemInterface(
-    BaseEntityInterface[Tuple[str, str], str, ItemSchema],
-    TaggableInterface[str, ItemSchema],
-    PermissionInterface[str, ItemSchema],
-    VersionableInterface[str],
+    BaseEntityInterface[Tuple[str, str], ItemPath, ItemSchema],
+    TaggableInterface[ItemPath, ItemSchema],
+    PermissionInterface[ItemPath, ItemSchema],
+    VersionableInterface[ItemPath],
     SearchableInterface[str],
+    SessionInterface[Any],
     ABC,
 ):
     """
@@ -50,18 +94,99 @@ class KnowledgeItemInterface(
 
     Items are organized in a hierarchical structure:
     Storage -> Category -> Subcategory -> Item
+
+    Bulk methods (``create_items``, ``delete_items``, ``move_items``, ...)
+    must reach the backend as one batched statement, e.g.
+    ``asyncpg.Connection.executemany`` or a multi-row query for
+    PostgreSQL; looping single-row queries in Python is not acceptable.
     """
 
+    _QUERY_EMBEDDINGS_MAXSIZE = 4096
+    _ITEM_IDS_CACHE_TTL = 60.0
+    _ITEM_IDS_MAXSIZE = 10_000
+    _PREFETCH_TTL = 30.0
+    _MERGED_PAGE_TTL = 2.0
+    _PREFETCH_MAXSIZE = 256
+    _PREFETCH_CONCURRENCY = 4
+    _UPLOAD_CONCURRENCY = min((os.cpu_count() or 1) * 4, 16)
+
+    async def resolve_item_id(
+        self,
+        storage_name: str,
+        category_name: str,
+        item_name: str,
+        subcategory_name: Optional[str] = None,
+    ) -> int:
+        """
+        Resolve an item's name path to its internal ID.
+
+        Resolved IDs are cached per instance for ``_ITEM_IDS_CACHE_TTL``
+        seconds, so repeated operations on the same item skip the
+        storage -> category -> subcategory lookup. Implementations should
+        route their per-item operations through this method and call
+        ``_forget_item_ids`` from ``rename_item``, ``delete_items`` and
+        ``move_items``.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            item_name: Name of the item
+            subcategory_name: Optional parent subcategory name
+
+        Returns:
+            Internal ID of the item
+
+        Raises:
+            ItemNotFoundError: If item does not exist
+        """
+        key = ItemPath.of(
+            storage_name, category_name, item_name, subcategory_name
+        )
+        cache: Optional[LRUCache[ItemPath, int]] = self.__dict__.get(
+            "_item_ids"
+        )
+        if cache is None:
+            cache = self.__dict__["_item_ids"] = LRUCache(
+                self._ITEM_IDS_MAXSIZE, ttl=self._ITEM_IDS_CACHE_TTL
+            )
+        item_id = cache.get(key)
+        if item_id is MISSING:
+            item_id = await self._resolve_item_id(key)
+            cache.set(key, item_id)
+        return item_id
+
+    def _forget_item_ids(self, keys: List[ItemPath]) -> None:
+        """Drop cached IDs for items that were renamed, moved or deleted."""
+        cache = self.__dict__.get("_item_ids")
+        if cache is not None:
+            for key in keys:
+                cache.pop(key)
+
     @abstractmethod
+    async def _resolve_item_id(self, key: ItemPath) -> int:
+        """
+        Look up an item's internal ID in the backing store.
+
+        Args:
+            key: Path of the item
+
+        Returns:
+            Internal ID of the item
+
+        Raises:
+            ItemNotFoundError: If item does not exist
+        """
+        pass
+
     async def create_item(
         self,
         storage_name: str,
         category_name: str,
         item_name: str,
-        item: Union[HttpUrl, str, UploadFile],
+        item: ItemSource,
         subcategory_name: Optional[str] = None,
         description: Optional[str] = None,
-        tags: Optional[Set[str]] = None,
+        tags: Optional[FrozenSet[str]] = None,
     ) -> ItemCreateSchema:
         """
         Create a new item (document or URL) in a category or subcategory.
@@ -70,10 +195,11 @@ class KnowledgeItemInterface(
             storage_name: Name of the parent storage
             category_name: Name of the parent category
             item_name: Unique name for the item
-            item: Content to store (URL, file path, or file object)
+            item: Content to store, tagged by kind (URL, file path, or upload)
             subcategory_name: Optional parent subcategory name
             description: Optional description of the item
-            tags: Optional set of tags for the item
+            tags: Optional tags for the item; implementations canonicalize
+                  them with ``intern_tags`` before persisting
 
         Returns:
             ItemCreateSchema containing item details
@@ -84,36 +210,126 @@ class KnowledgeItemInterface(
             ValueError: If item name is invalid or already exists
             PermissionError: If user lacks create permissions
         """
-        pass
+        (created,) = await self.create_items(
+            storage_name,
+            category_name,
+            [(item_name, item)],
+            subcategory_name,
+            descriptions=[description],
+            tags=[tags],
+        )
+        return created
 
     @abstractmethod
     async def create_items(
         self,
         storage_name: str,
         category_name: str,
-        items: List[tuple[str, Union[HttpUrl, str, UploadFile]]],
+        items: List[tuple[str, ItemSource]],
         subcategory_name: Optional[str] = None,
+        *,
+        descriptions: Optional[List[Optional[str]]] = None,
+        tags: Optional[List[Optional[FrozenSet[str]]]] = None,
+        options: Optional[BulkOptions] = None,
     ) -> List[ItemCreateSchema]:
         """
         Create multiple items in a category or subcategory.
 
+        Metadata rows must reach the backend as one bulk write per
+        ``options.batch_size`` chunk (``executemany``, ``COPY`` or
+        ``insert_many(ordered=False)``); implementations must not call
+        ``create_item`` in a loop, since it forwards here.
+
+        A FileSource must be streamed to the storage driver from
+        ``item.file`` in chunks of about 1 MiB, e.g. with
+        ``shutil.copyfileobj`` or an upload-from-file API. It must never
+        be read into a single ``bytes`` object. When ``content_hash`` is
+        given, compute the SHA-256 incrementally while streaming and
+        reject mismatches. Content uploads go through ``_store_contents``
+        so they overlap instead of running one after another, with a
+        ``discard`` callback that deletes uploads of a failed batch.
+
         Args:
             storage_name: Name of the parent storage
             category_name: Name of the parent category
-            items: List of (name, content) tuples to create
+            items: List of (name, ItemSource) tuples to create
             subcategory_name: Optional parent subcategory name
+            descriptions: Optional descriptions aligned with ``items``
+            tags: Optional tag sets aligned with ``items``; implementations
+                  canonicalize them with ``intern_tags`` before persisting
+            options: Optional batching options
 
         Returns:
-            List of ItemCreateSchema containing created items details
+            List of ItemCreateSchema in the same order as ``items``
 
         Raises:
             CategoryNotFoundError: If parent category does not exist
             SubCategoryNotFoundError: If specified subcategory does not exist
-            ValueError: If any item name is invalid or already exists
+            ValueError: If any item name is invalid or already exists, or
+                        ``descriptions``/``tags`` do not match ``items``
+                        in length
             PermissionError: If user lacks create permissions
         """
         pass
 
+    async def _store_contents(
+        self,
+        items: List[tuple[str, ItemSource]],
+        store: Callable[[str, ItemSource], Awaitable[StoreResult]],
+        discard: Optional[Callable[[StoreResult], Awaitable[None]]] = None,
+    ) -> List[StoreResult]:
+        """
+        Run ``store`` for every item, at most ``_UPLOAD_CONCURRENCY`` at
+        a time.
+
+        Object stores such as GCS or S3 are latency bound per upload, so
+        overlapping them makes a batch take about as long as its slowest
+        file. Results keep the order of ``items``.
+
+        If any upload fails, the ones still running are cancelled and
+        ``discard`` is awaited for every upload that already finished, so
+        no object is left without a metadata row. The first failure is
+        then re-raised. Implementations should pass a ``discard`` that
+        deletes the stored object.
+        """
+        slots = asyncio.Semaphore(self._UPLOAD_CONCURRENCY)
+
+        async def store_one(name: str, source: ItemSource) -> StoreResult:
+            async with slots:
+                return await store(name, source)
+
+        tasks: List[asyncio.Task[StoreResult]] = []
+        try:
+            async with asyncio.TaskGroup() as group:
+                for name, source in items:
+                    tasks.append(group.create_task(store_one(name, source)))
+        except BaseExceptionGroup as error:
+            if discard is not None:
+                await self._discard_stored(tasks, discard)
+            raise error.exceptions[0] from None
+        return [task.result() for task in tasks]
+
+    @staticmethod
+    async def _discard_stored(
+        tasks: List[asyncio.Task[StoreResult]],
+        discard: Callable[[StoreResult], Awaitable[None]],
+    ) -> None:
+        """Undo the uploads of a failed batch that did complete."""
+        stored = [
+            task.result()
+            for task in tasks
+            if task.done() and not task.cancelled() and not task.exception()
+        ]
+        outcomes = await asyncio.gather(
+            *(discard(result) for result in stored), return_exceptions=True
+        )
+        for result, outcome in zip(stored, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    f"Failed to discard orphaned upload {result!r}: "
+                    f"{outcome!r}"
+                )
+
     @abstractmethod
     async def rename_item(
         self,
@@ -143,7 +359,6 @@ class KnowledgeItemInterface(
         """
         pass
 
-    @abstractmethod
     async def delete_item(
         self,
         storage_name: str,
@@ -167,6 +382,35 @@ class KnowledgeItemInterface(
             ItemNotFoundError: If item does not exist
             PermissionError: If user lacks delete permissions
         """
+        (deleted,) = await self.delete_items(
+            storage_name, category_name, [item_name], subcategory_name
+        )
+        return deleted
+
+    @abstractmethod
+    async def delete_items(
+        self,
+        storage_name: str,
+        category_name: str,
+        item_names: List[str],
+        subcategory_name: Optional[str] = None,
+    ) -> List[ItemDeleteSchema]:
+        """
+        Delete multiple items in one operation.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            item_names: Names of the items to delete
+            subcategory_name: Optional parent subcategory name
+
+        Returns:
+            List of ItemDeleteSchema in the same order as ``item_names``
+
+        Raises:
+            ItemNotFoundError: If any item does not exist
+            PermissionError: If user lacks delete permissions
+        """
         pass
 
     @abstractmethod
@@ -175,9 +419,8 @@ class KnowledgeItemInterface(
         storage_name: str,
         category_name: str,
         item_name: str,
-        is_detail: bool = False,
         subcategory_name: Optional[str] = None,
-    ) -> Union[ItemSchema, ItemDetailSchema]:
+    ) -> ItemSchema:
         """
         Retrieve an item by name.
 
@@ -185,11 +428,36 @@ class KnowledgeItemInterface(
             storage_name: Name of the parent storage
             category_name: Name of the parent category
             item_name: Name of the item to retrieve
-            is_detail: If True, returns detailed information
             subcategory_name: Optional parent subcategory name
 
         Returns:
-            Item information, optionally with detailed contents
+            Item information
+
+        Raises:
+            ItemNotFoundError: If item does not exist
+            PermissionError: If user lacks read permissions
+        """
+        pass
+
+    @abstractmethod
+    async def get_item_detail(
+        self,
+        storage_name: str,
+        category_name: str,
+        item_name: str,
+        subcategory_name: Optional[str] = None,
+    ) -> ItemDetailSchema:
+        """
+        Retrieve an item by name with its size, type and versions.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            item_name: Name of the item to retrieve
+            subcategory_name: Optional parent subcategory name
+
+        Returns:
+            Detailed item information
 
         Raises:
             ItemNotFoundError: If item does not exist
@@ -204,18 +472,30 @@ class KnowledgeItemInterface(
         category_name: str,
         subcategory_name: Optional[str] = None,
         pagination: Optional[PaginationParams] = None,
-    ) -> Union[List[ItemDetailSchema], PaginatedResponse]:
+        changed_since: Optional[datetime] = None,
+        include: Optional[FrozenSet[RelatedField]] = None,
+    ) -> PaginatedResponse[ItemDetailSchema]:
         """
         List all items in a category or subcategory.
 
+        The relations in ``include`` must be loaded for the whole page at
+        once, one batched query per relation (``selectinload``,
+        ``prefetch_related`` or a single ``$lookup``) or one query with
+        LEFT JOINs aggregated per item. Fetching related data lazily per
+        item on the return path is not allowed.
+
         Args:
             storage_name: Name of the parent storage
             category_name: Name of the parent category
             subcategory_name: Optional parent subcategory name
             pagination: Optional pagination parameters
+            changed_since: Only return items whose update_time is later,
+                           ordered by update_time, for delta sync
+            include: Related fields to load; None loads all of them and
+                     omitted ones keep their empty defaults
 
         Returns:
-            List of items or paginated response
+            Paginated response with the items
 
         Raises:
             CategoryNotFoundError: If category does not exist
@@ -224,6 +504,279 @@ class KnowledgeItemInterface(
         """
         pass
 
+    async def list_items_ahead(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: Optional[str] = None,
+        pagination: Optional[PaginationParams] = None,
+        include: Optional[FrozenSet[RelatedField]] = None,
+    ) -> PaginatedResponse[ItemDetailSchema]:
+        """
+        ``list_items`` that loads the following page in the background.
+
+        Meant for clients scrolling page by page: the request for page
+        N+1 is usually answered by the prefetch started with page N.
+        With offset paging, odd pages are read together with the next
+        page in a single query of twice the page size.
+        Implementations call ``_forget_prefetched_pages`` after any item
+        write so no stale page is served.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Optional parent subcategory name
+            pagination: Optional pagination parameters
+            include: Related fields to load; None loads all of them
+
+        Returns:
+            Paginated response with the items
+        """
+
+        async def fetch(
+            page: Optional[PaginationParams],
+        ) -> PaginatedResponse[ItemDetailSchema]:
+            return await self.list_items(
+                storage_name,
+                category_name,
+                subcategory_name,
+                pagination=page,
+                include=include,
+            )
+
+        scope = ("list", storage_name, category_name, subcategory_name)
+        return await self._page_ahead((scope, include), pagination, fetch)
+
+    async def _page_ahead(
+        self,
+        scope: Hashable,
+        pagination: Optional[PaginationParams],
+        fetch: Callable[
+            [Optional[PaginationParams]],
+            Awaitable[PaginatedResponse[ItemDetailSchema]],
+        ],
+    ) -> PaginatedResponse[ItemDetailSchema]:
+        """
+        Serve a page from a pending fetch and start the next one.
+
+        Concurrent requests for the same page share one query. At most
+        ``_PREFETCH_CONCURRENCY`` prefetches run at a time; when all
+        slots are busy the next page is simply not prefetched. A failed
+        prefetch is retried as a regular fetch.
+        """
+        if pagination is None:
+            return await fetch(None)
+
+        cache: Optional[
+            LRUCache[Hashable, asyncio.Future[PaginatedResponse[Any]]]
+        ] = self.__dict__.get("_prefetched_pages")
+        if cache is None:
+            cache = self.__dict__["_prefetched_pages"] = LRUCache(
+                self._PREFETCH_MAXSIZE, ttl=self._PREFETCH_TTL
+            )
+        key = self._page_cache_key(scope, pagination)
+        pending = cache.get(key)
+        if pending is MISSING:
+            pending = asyncio.ensure_future(
+                self._fetch_pages(scope, pagination, fetch, cache)
+            )
+            cache.set(key, pending)
+            try:
+                page = await asyncio.shield(pending)
+            finally:
+                cache.pop(key)
+        else:
+            cache.pop(key)
+            try:
+                page = await pending
+            except Exception:
+                page = await fetch(pagination)
+
+        next_pagination = self._next_pagination(page, pagination)
+        if next_pagination is None:
+            return page
+        next_key = self._page_cache_key(scope, next_pagination)
+        slots: Optional[asyncio.Semaphore] = self.__dict__.get(
+            "_prefetch_slots"
+        )
+        if slots is None:
+            slots = self.__dict__["_prefetch_slots"] = asyncio.Semaphore(
+                self._PREFETCH_CONCURRENCY
+            )
+        if cache.get(next_key) is MISSING and not slots.locked():
+
+            async def prefetch() -> PaginatedResponse[ItemDetailSchema]:
+                async with slots:
+                    return await self._fetch_pages(
+                        scope, next_pagination, fetch, cache
+                    )
+
+            next_task = asyncio.create_task(prefetch())
+            next_task.add_done_callback(_consume_task_result)
+            cache.set(next_key, next_task)
+        return page
+
+    async def _fetch_pages(
+        self,
+        scope: Hashable,
+        pagination: PaginationParams,
+        fetch: Callable[
+            [Optional[PaginationParams]],
+            Awaitable[PaginatedResponse[ItemDetailSchema]],
+        ],
+        cache: LRUCache[Hashable, asyncio.Future[PaginatedResponse[Any]]],
+    ) -> PaginatedResponse[ItemDetailSchema]:
+        """
+        Fetch a page, merging odd offset pages with the one after them.
+
+        Page N (odd) and N+1 of size S are exactly page (N+1)/2 of size
+        2S, so both are read with one sorted query and the second half
+        is stored as already prefetched for ``_MERGED_PAGE_TTL`` seconds.
+        It is not stored if items were written while the query ran.
+        Keyset pages are fetched as is, since the cursor in the middle of
+        a merged page is unknown.
+        """
+        if pagination.cursor is not None or pagination.page % 2 == 0:
+            return await fetch(pagination)
+
+        size = pagination.page_size
+        generation = self.__dict__.get("_prefetch_generation", 0)
+        merged = await fetch(
+            PaginationParams(
+                page=(pagination.page + 1) // 2, page_size=size * 2
+            )
+        )
+        total_pages = (
+            -(-merged.total // size) if merged.total is not None else None
+        )
+        # A write during the fetch makes the second half unreliable.
+        stale = generation != self.__dict__.get("_prefetch_generation", 0)
+        if len(merged.items) > size and not stale:
+            second: asyncio.Future[PaginatedResponse[Any]] = (
+                asyncio.get_running_loop().create_future()
+            )
+            second.set_result(
+                merged.model_copy(
+                    update={
+                        "items": merged.items[size:],
+                        "page": pagination.page + 1,
+                        "page_size": size,
+                        "total_pages": total_pages,
+                    }
+                )
+            )
+            next_pagination = PaginationParams(
+                page=pagination.page + 1, page_size=size
+            )
+            cache.set(
+                self._page_cache_key(scope, next_pagination),
+                second,
+                ttl=self._MERGED_PAGE_TTL,
+            )
+        return merged.model_copy(
+            update={
+                "items": merged.items[:size],
+                "page": pagination.page,
+                "page_size": size,
+                "total_pages": total_pages,
+            }
+        )
+
+    @staticmethod
+    def _page_cache_key(
+        scope: Hashable, pagination: PaginationParams
+    ) -> Tuple[Hashable, int, int, Optional[str]]:
+        return (
+            scope,
+            pagination.page,
+            pagination.page_size,
+            pagination.cursor,
+        )
+
+    @staticmethod
+    def _next_pagination(
+        page: PaginatedResponse[Any], pagination: PaginationParams
+    ) -> Optional[PaginationParams]:
+        """Parameters of the page after ``page``, None on the last one."""
+        if page.next_cursor is not None:
+            return PaginationParams(
+                page_size=pagination.page_size, cursor=page.next_cursor
+            )
+        if (
+            pagination.cursor is None
+            and page.total_pages is not None
+            and pagination.page < page.total_pages
+        ):
+            return PaginationParams(
+                page=pagination.page + 1, page_size=pagination.page_size
+            )
+        return None
+
+    def _forget_prefetched_pages(self) -> None:
+        """Drop every prefetched page after items were changed."""
+        self.__dict__["_prefetch_generation"] = (
+            self.__dict__.get("_prefetch_generation", 0) + 1
+        )
+        cache = self.__dict__.get("_prefetched_pages")
+        if cache is not None:
+            cache.clear()
+
+    @abstractmethod
+    def iter_items(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: Optional[str] = None,
+        changed_since: Optional[datetime] = None,
+    ) -> AsyncIterator[ItemDetailSchema]:
+        """
+        Stream all items of a category or subcategory.
+
+        Implementations are async generators over a driver-side cursor
+        with a bounded fetch size, so peak memory does not grow with the
+        number of items. Rows are populated the same way as in
+        ``list_items``.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Optional parent subcategory name
+            changed_since: Only yield items updated after this time
+
+        Returns:
+            AsyncIterator[ItemDetailSchema]: Items in listing order
+        """
+        pass
+
+    @abstractmethod
+    async def prefetch_related(
+        self,
+        storage_name: str,
+        category_name: str,
+        item_names: List[str],
+        include: Set[RelatedField],
+        subcategory_name: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Load related data for several items in one backend call.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            item_names: Names of the items to load related data for
+            include: Related fields to load ("tags", "permissions",
+                     "versions")
+            subcategory_name: Optional parent subcategory name
+
+        Returns:
+            Mapping of item name to a dict of the requested related fields
+
+        Raises:
+            CategoryNotFoundError: If category does not exist
+            SubCategoryNotFoundError: If subcategory does not exist
+        """
+        pass
+
     @abstractmethod
     async def update_item_description(
         self,
@@ -252,7 +805,6 @@ class KnowledgeItemInterface(
         """
         pass
 
-    @abstractmethod
     async def move_item(
         self,
         storage_name: str,
@@ -265,6 +817,9 @@ class KnowledgeItemInterface(
         """
         Move an item to a different category or subcategory.
 
+        A move only updates the item's parent reference; the item content
+        must not be re-read or re-written.
+
         Args:
             storage_name: Name of the parent storage
             category_name: Current parent category name
@@ -282,9 +837,53 @@ class KnowledgeItemInterface(
             SubCategoryNotFoundError: If target subcategory does not exist
             PermissionError: If user lacks move permissions
         """
-        pass
+        (moved,) = await self.move_items(
+            storage_name,
+            category_name,
+            [item_name],
+            new_category_name,
+            new_subcategory_name,
+            subcategory_name,
+        )
+        return moved
 
     @abstractmethod
+    async def move_items(
+        self,
+        storage_name: str,
+        category_name: str,
+        item_names: List[str],
+        new_category_name: str,
+        new_subcategory_name: Optional[str] = None,
+        subcategory_name: Optional[str] = None,
+    ) -> List[ItemMoveSchema]:
+        """
+        Move several items to a different category or subcategory.
+
+        Implementations must perform a single update of the parent
+        reference for all items, e.g.
+        ``UPDATE items SET category = ..., subcategory = ...
+        WHERE name = ANY(...)``, without touching item content.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Current parent category name
+            item_names: Names of the items to move
+            new_category_name: Target category name
+            new_subcategory_name: Optional target subcategory name
+            subcategory_name: Optional current parent subcategory name
+
+        Returns:
+            List of ItemMoveSchema in the same order as ``item_names``
+
+        Raises:
+            ItemNotFoundError: If any item does not exist
+            CategoryNotFoundError: If target category does not exist
+            SubCategoryNotFoundError: If target subcategory does not exist
+            PermissionError: If user lacks move permissions
+        """
+        pass
+
     async def set_item_permission(
         self,
         storage_name: str,
@@ -313,6 +912,40 @@ class KnowledgeItemInterface(
             UserNotFoundError: If user does not exist
             PermissionError: If current user lacks permission management rights
         """
+        (updated,) = await self.set_item_permissions(
+            storage_name,
+            category_name,
+            [(item_name, user_id, permission)],
+            subcategory_name,
+        )
+        return updated
+
+    @abstractmethod
+    async def set_item_permissions(
+        self,
+        storage_name: str,
+        category_name: str,
+        assignments: List[Tuple[str, str, PermissionLevel]],
+        subcategory_name: Optional[str] = None,
+    ) -> List[ItemSchema]:
+        """
+        Set permission levels on several items in one operation.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            assignments: List of (item name, user ID, permission) tuples
+                         to apply
+            subcategory_name: Optional parent subcategory name
+
+        Returns:
+            Updated item information in the same order as ``assignments``
+
+        Raises:
+            ItemNotFoundError: If any item does not exist
+            UserNotFoundError: If any user does not exist
+            PermissionError: If current user lacks permission management rights
+        """
         pass
 
     @abstractmethod
@@ -344,7 +977,6 @@ class KnowledgeItemInterface(
         """
         pass
 
-    @abstractmethod
     async def add_item_tag(
         self,
         storage_name: str,
@@ -371,9 +1003,38 @@ class KnowledgeItemInterface(
             ValueError: If tag format is invalid
             PermissionError: If user lacks update permissions
         """
-        pass
+        (updated,) = await self.add_item_tags(
+            storage_name, category_name, [(item_name, tag)], subcategory_name
+        )
+        return updated
 
     @abstractmethod
+    async def add_item_tags(
+        self,
+        storage_name: str,
+        category_name: str,
+        assignments: List[Tuple[str, str]],
+        subcategory_name: Optional[str] = None,
+    ) -> List[ItemSchema]:
+        """
+        Add tags to several items in one operation.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            assignments: List of (item name, tag) tuples to apply
+            subcategory_name: Optional parent subcategory name
+
+        Returns:
+            Updated item information in the same order as ``assignments``
+
+        Raises:
+            ItemNotFoundError: If any item does not exist
+            ValueError: If any tag format is invalid
+            PermissionError: If user lacks update permissions
+        """
+        pass
+
     async def remove_item_tag(
         self,
         storage_name: str,
@@ -385,6 +1046,9 @@ class KnowledgeItemInterface(
         """
         Remove a tag from an item.
 
+        Only the tag set is read to check membership, not the whole item
+        record.
+
         Args:
             storage_name: Name of the parent storage
             category_name: Name of the parent category
@@ -400,6 +1064,51 @@ class KnowledgeItemInterface(
             ValueError: If tag does not exist
             PermissionError: If user lacks update permissions
         """
+        tags = await self.get_tags(
+            ItemPath.of(
+                storage_name, category_name, item_name, subcategory_name
+            )
+        )
+        if tag not in tags:
+            raise ValueError(f"Tag '{tag}' not found on item '{item_name}'")
+        return await self.set_item_tags(
+            storage_name,
+            category_name,
+            item_name,
+            tags - {tag},
+            subcategory_name,
+        )
+
+    @abstractmethod
+    async def set_item_tags(
+        self,
+        storage_name: str,
+        category_name: str,
+        item_name: str,
+        tags: Set[str],
+        subcategory_name: Optional[str] = None,
+    ) -> ItemSchema:
+        """
+        Replace the tags of an item with ``tags``.
+
+        The difference against the stored tags must be applied in one
+        backend statement, not one call per added or removed tag.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            item_name: Name of the item
+            tags: Complete new set of tags
+            subcategory_name: Optional parent subcategory name
+
+        Returns:
+            Updated item information
+
+        Raises:
+            ItemNotFoundError: If item does not exist
+            ValueError: If any tag format is invalid
+            PermissionError: If user lacks update permissions
+        """
         pass
 
     @abstractmethod
@@ -408,12 +1117,15 @@ class KnowledgeItemInterface(
         storage_name: str,
         category_name: str,
         item_name: str,
-        new_version: Union[HttpUrl, str, UploadFile],
+        new_version: ItemSource,
         subcategory_name: Optional[str] = None,
     ) -> ItemVersionSchema:
         """
         Create a new version of an item.
 
+        File content is streamed to storage in chunks, as in
+        ``create_item``; it is never buffered whole in memory.
+
         Args:
             storage_name: Name of the parent storage
             category_name: Name of the parent category
@@ -466,10 +1178,20 @@ class KnowledgeItemInterface(
         case_sensitive: bool = False,
         subcategory_name: Optional[str] = None,
         pagination: Optional[PaginationParams] = None,
-    ) -> Union[List[ItemDetailSchema], PaginatedResponse]:
+        include: Optional[FrozenSet[RelatedField]] = None,
+    ) -> PaginatedResponse[ItemDetailSchema]:
         """
         Search for items by name.
 
+        Implementations must apply the name filter in the storage layer,
+        e.g. LIKE/ILIKE or a full-text index depending on
+        ``case_sensitive``. A ``'%query%'`` pattern cannot use a B-tree
+        index, so back it with a trigram index (``pg_trgm`` GIN on the
+        name, or on a stored ``casefold()`` copy of it for
+        case-insensitive search). Loading all items and filtering them in
+        Python is not allowed. Related fields are loaded as in
+        ``list_items``.
+
         Args:
             storage_name: Name of the parent storage
             category_name: Name of the parent category
@@ -477,9 +1199,10 @@ class KnowledgeItemInterface(
             case_sensitive: Whether to perform case-sensitive search
             subcategory_name: Optional parent subcategory name
             pagination: Optional pagination parameters
+            include: Related fields to load; None loads all of them
 
         Returns:
-            List of matching items or paginated response
+            Paginated response with the matching items
 
         Raises:
             CategoryNotFoundError: If category does not exist
@@ -488,7 +1211,57 @@ class KnowledgeItemInterface(
         """
         pass
 
-    @abstractmethod
+    async def search_items_ahead(
+        self,
+        storage_name: str,
+        category_name: str,
+        query: str,
+        case_sensitive: bool = False,
+        subcategory_name: Optional[str] = None,
+        pagination: Optional[PaginationParams] = None,
+        include: Optional[FrozenSet[RelatedField]] = None,
+    ) -> PaginatedResponse[ItemDetailSchema]:
+        """
+        ``search_items`` that loads the following page in the background.
+
+        See ``list_items_ahead``.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            query: Search query
+            case_sensitive: Whether to perform case-sensitive search
+            subcategory_name: Optional parent subcategory name
+            pagination: Optional pagination parameters
+            include: Related fields to load; None loads all of them
+
+        Returns:
+            Paginated response with the matching items
+        """
+
+        async def fetch(
+            page: Optional[PaginationParams],
+        ) -> PaginatedResponse[ItemDetailSchema]:
+            return await self.search_items(
+                storage_name,
+                category_name,
+                query,
+                case_sensitive,
+                subcategory_name,
+                pagination=page,
+                include=include,
+            )
+
+        scope = (
+            "search",
+            storage_name,
+            category_name,
+            subcategory_name,
+            query,
+            case_sensitive,
+        )
+        return await self._page_ahead((scope, include), pagination, fetch)
+
     async def smart_search(
         self,
         storage_name: str,
@@ -500,6 +1273,11 @@ class KnowledgeItemInterface(
         """
         Perform semantic search across items.
 
+        The query embedding is cached per instance, so repeated queries do
+        not call the embedding model again. Retrieval is delegated to
+        ``_ann_search``, which must use an approximate nearest neighbour
+        index rather than scanning every stored vector.
+
         Args:
             storage_name: Name of the parent storage
             query: Search query
@@ -514,4 +1292,73 @@ class KnowledgeItemInterface(
             CategoryNotFoundError: If specified category does not exist
             PermissionError: If user lacks search permissions
         """
+        started = time.perf_counter()
+        vector = await self._embed_query(query)
+        results = await self._ann_search(
+            storage_name, vector, num_results, category_name, filters
+        )
+        # Every field is built here and the results are already
+        # SmartSearchSchema instances, so validation is skipped.
+        return SmartSearchResponseSchema.model_construct(
+            query=query,
+            results=results,
+            total_results=len(results),
+            execution_time=time.perf_counter() - started,
+        )
+
+    async def _embed_query(self, query: str) -> Tuple[float, ...]:
+        """Return the embedding of ``query``, reusing cached vectors."""
+        cache: Optional[LRUCache[str, Tuple[float, ...]]] = self.__dict__.get(
+            "_query_embeddings"
+        )
+        if cache is None:
+            cache = self.__dict__["_query_embeddings"] = LRUCache(
+                self._QUERY_EMBEDDINGS_MAXSIZE
+            )
+        vector = cache.get(query)
+        if vector is MISSING:
+            (embedding,) = await self._embed([query])
+            vector = tuple(embedding)
+            cache.set(query, vector)
+        return vector
+
+    @abstractmethod
+    async def _embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several texts in one call to the embedding model.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding vector per text, in the same order
+        """
+        pass
+
+    @abstractmethod
+    async def _ann_search(
+        self,
+        storage_name: str,
+        vector: Tuple[float, ...],
+        num_results: int,
+        category_name: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[SmartSearchSchema]:
+        """
+        Find the items nearest to ``vector`` using an ANN index.
+
+        Implementations must query an approximate nearest neighbour index
+        (HNSW/IVF in the vector store); brute-force scans over all stored
+        vectors are not allowed.
+
+        Args:
+            storage_name: Name of the parent storage
+            vector: Query embedding
+            num_results: Maximum number of results to return
+            category_name: Optional category to limit search to
+            filters: Optional search filters
+
+        Returns:
+            Matching results ordered by relevance
+        """
         pass
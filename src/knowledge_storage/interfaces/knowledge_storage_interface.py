@@ -1,11 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import List, Union, Optional
+from typing import Any, AsyncIterator, FrozenSet, Literal, Optional
 
-from src.knowledge_storage.interfaces import (
+from src.knowledge_storage.interfaces.base_entity_interface import (
     BaseEntityInterface,
-    TaggableInterface,
+)
+from src.knowledge_storage.interfaces.permission_interface import (
     PermissionInterface,
 )
+from src.knowledge_storage.interfaces.session_interface import (
+    SessionInterface,
+)
+from src.knowledge_storage.interfaces.taggable_interface import (
+    TaggableInterface,
+)
 from src.knowledge_storage.schemas import (
     KnowledgeSchema,
     KnowledgeRenameSchema,
@@ -17,11 +24,14 @@ from src.knowledge_storage.schemas import (
     PermissionLevel,
 )
 
+StorageRelation = Literal["categories", "subcategories", "items"]
+
 
 class KnowledgeStorageInterface(
     BaseEntityInterface[str, str, KnowledgeSchema],
     TaggableInterface[str, KnowledgeSchema],
     PermissionInterface[str, KnowledgeSchema],
+    SessionInterface[Any],
     ABC,
 ):
     """
@@ -79,38 +89,79 @@ class KnowledgeStorageInterface(
         pass
 
     @abstractmethod
-    async def get_storage(
-        self, name: str, is_detail: bool = False
-    ) -> Union[KnowledgeSchema, KnowledgeDetailSchema]:
+    async def get_storage(self, name: str) -> KnowledgeSchema:
         """
         Retrieve a knowledge storage by name.
 
+        Only the storage row itself is read; use ``get_storage_detail``
+        when the contents are needed.
+
         Args:
             name: Name of the storage to retrieve
-            is_detail: If True, returns detailed information including contents
 
         Returns:
-            Storage information, optionally with detailed contents
+            Storage information
+        """
+        pass
+
+    @abstractmethod
+    async def get_storage_detail(self, name: str) -> KnowledgeDetailSchema:
+        """
+        Retrieve a knowledge storage together with its contents.
+
+        Args:
+            name: Name of the storage to retrieve
+
+        Returns:
+            Detailed storage information including contents
         """
         pass
 
     @abstractmethod
     async def list_storages(
         self,
-        is_detail: bool = False,
         pagination: Optional[PaginationParams] = None,
-    ) -> Union[
-        List[Union[KnowledgeSchema, KnowledgeDetailSchema]], PaginatedResponse
-    ]:
+    ) -> PaginatedResponse[KnowledgeSchema]:
         """
         List all knowledge storages.
 
         Args:
-            is_detail: If True, returns detailed information for each storage
             pagination: Optional pagination parameters
 
         Returns:
-            List of storages or paginated response
+            Paginated response with the storages
+        """
+        pass
+
+    @abstractmethod
+    def iter_storages(self) -> AsyncIterator[KnowledgeSchema]:
+        """
+        Stream all knowledge storages without paging.
+
+        Returns:
+            AsyncIterator[KnowledgeSchema]: Storages in listing order
+        """
+        pass
+
+    @abstractmethod
+    async def list_storages_detail(
+        self,
+        pagination: Optional[PaginationParams] = None,
+        include: Optional[FrozenSet[StorageRelation]] = None,
+    ) -> PaginatedResponse[KnowledgeDetailSchema]:
+        """
+        List all knowledge storages with their contents.
+
+        Each relation in ``include`` is loaded for the whole page with one
+        batched query keyed on the storage names, never per storage.
+        Relations left out are returned as None.
+
+        Args:
+            pagination: Optional pagination parameters
+            include: Contents to load; None loads all of them
+
+        Returns:
+            Paginated response with detailed storages
         """
         pass
 
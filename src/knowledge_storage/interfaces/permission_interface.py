@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
+from src.knowledge_storage.cache import MISSING, LRUCache
 from src.knowledge_storage.schemas import PermissionLevel
 
 EntityPath = TypeVar("EntityPath")
@@ -14,6 +15,9 @@ class PermissionInterface(ABC, Generic[EntityPath, EntityResult]):
     on entities in the knowledge storage system.
     """
 
+    _PERMISSIONS_TTL = 5.0
+    _PERMISSIONS_MAXSIZE = 4096
+
     @abstractmethod
     async def set_permission(
         self, path: EntityPath, user_id: str, permission: PermissionLevel
@@ -58,3 +62,52 @@ class PermissionInterface(ABC, Generic[EntityPath, EntityResult]):
             Dictionary mapping user IDs to their permission levels
         """
         pass
+
+    async def get_cached_permissions(
+        self, path: EntityPath
+    ) -> dict[str, PermissionLevel]:
+        """Read-through ``get_permissions`` for authorization checks.
+
+        Every mutating call authorizes the caller first, so a single
+        request often asks for the same permissions several times. The
+        result is kept for ``_PERMISSIONS_TTL`` seconds; implementations
+        drop it with ``_forget_permissions`` after changing permissions.
+
+        Args:
+            path: Path to the entity
+
+        Returns:
+            Dictionary mapping user IDs to their permission levels
+        """
+        cache: Optional[LRUCache[EntityPath, dict[str, PermissionLevel]]] = (
+            self.__dict__.get("_permissions_cache")
+        )
+        if cache is None:
+            cache = self.__dict__["_permissions_cache"] = LRUCache(
+                self._PERMISSIONS_MAXSIZE, ttl=self._PERMISSIONS_TTL
+            )
+        permissions = cache.get(path)
+        if permissions is MISSING:
+            generation = self.__dict__.get("_permissions_generation", 0)
+            permissions = await self.get_permissions(path)
+            # A change during the read may have made it stale.
+            if generation == self.__dict__.get("_permissions_generation", 0):
+                cache.set(path, permissions)
+        return dict(permissions)
+
+    def _forget_permissions(self, path: Optional[EntityPath] = None) -> None:
+        """Drop cached permissions of one entity, or all of them.
+
+        The generation is bumped as well so reads still in flight do not
+        store their pre-change result.
+        """
+        self.__dict__["_permissions_generation"] = (
+            self.__dict__.get("_permissions_generation", 0) + 1
+        )
+        cache = self.__dict__.get("_permissions_cache")
+        if cache is None:
+            return
+        if path is None:
+            cache.clear()
+        else:
+            cache.pop(path)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Optional, Dict, Any, Union
+from typing import Any, AsyncIterator, Dict, Generic, Optional, TypeVar
 
 from src.knowledge_storage.schemas import (
     PaginationParams,
@@ -25,10 +25,13 @@ class SearchableInterface(ABC, Generic[EntityPath]):
         query: str,
         case_sensitive: bool = False,
         pagination: Optional[PaginationParams] = None,
-    ) -> Union[List[ItemDetailSchema], PaginatedResponse]:
+    ) -> PaginatedResponse[ItemDetailSchema]:
         """
         Search for entities by name.
 
+        The filter must be evaluated by the backing store, not by loading
+        all entities and filtering them in Python.
+
         Args:
             path: Path to search within
             query: Search query
@@ -36,7 +39,28 @@ class SearchableInterface(ABC, Generic[EntityPath]):
             pagination: Optional pagination parameters
 
         Returns:
-            List of matching entities or paginated response
+            Paginated response with the matching entities
+        """
+        pass
+
+    @abstractmethod
+    def iter_search(
+        self,
+        path: EntityPath,
+        query: str,
+        case_sensitive: bool = False,
+    ) -> AsyncIterator[ItemDetailSchema]:
+        """
+        Stream every match of ``search`` without paging.
+
+        Args:
+            path: Path to search within
+            query: Search query
+            case_sensitive: Whether to perform case-sensitive search
+
+        Returns:
+            AsyncIterator[ItemDetailSchema]: Matches as the store yields
+                                             them
         """
         pass
 
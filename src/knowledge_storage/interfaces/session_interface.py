@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, Generic, TypeVar
+
+Connection = TypeVar("Connection")
+
+
+class SessionInterface(ABC, Generic[Connection]):
+    """Interface for storages backed by a pooled database connection.
+
+    Each request should acquire one connection from the pool and reuse it
+    for every call it makes, instead of each call acquiring its own.
+    Batched methods can then share a transaction, and concurrent
+    requests do not exhaust the pool.
+    """
+
+    @abstractmethod
+    def session(self) -> AsyncContextManager[Connection]:
+        """Acquire a pooled connection for the duration of a request.
+
+        Interface methods awaited inside ``async with storage.session():``
+        must run on the yielded connection (implementations typically keep
+        it in a ``ContextVar``) rather than acquiring a new one. Nested
+        ``session()`` calls reuse the outer connection. The pool size is
+        configured by the implementation and should stay bounded
+        (around 10-25 connections per worker) rather than one per request.
+
+        Returns:
+            Async context manager yielding the shared connection
+        """
+        pass
@@ -0,0 +1,716 @@
+from abc import ABC
+from datetime import datetime
+from typing import (
+    AsyncIterator,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
+
+from src.knowledge_storage.interfaces.knowledge_entity_interface import (
+    EntityRelation,
+    KnowledgeEntityInterface,
+)
+from src.knowledge_storage.schemas import (
+    EntityType,
+    PaginatedResponse,
+    PaginationParams,
+    MoveSpec,
+    MutationResult,
+    PermissionLevel,
+    SubCategoryDeleteSchema,
+    SubCategoryDetailSchema,
+    SubCategoryMoveSchema,
+    SubCategoryRenameSchema,
+    SubCategoryRow,
+    SubCategorySchema,
+    SubCategoryUpdateDescriptionSchema,
+)
+
+
+class SubCategoryInterface(KnowledgeEntityInterface, ABC):
+    """
+    Interface for managing subcategories within a knowledge category.
+
+    Covers creating, renaming, deleting, moving and listing subcategories
+    together with their tags and permissions. Methods forward to
+    ``KnowledgeEntityInterface`` with ``EntityType.SUBCATEGORY`` and the
+    category as the parent.
+    """
+
+    async def create_subcategory(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+        description: Optional[str] = None,
+    ) -> SubCategorySchema:
+        """
+        Create a new subcategory within a category.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Unique name for the subcategory
+            description: Optional description of the subcategory
+
+        Returns:
+            SubCategorySchema containing subcategory details
+
+        Raises:
+            CategoryNotFoundError: If parent category does not exist
+            ValueError: If subcategory name is invalid or already exists
+            PermissionError: If user lacks create permissions
+        """
+        (subcategory,) = await self.create_subcategories(
+            storage_name, category_name, [(subcategory_name, description)]
+        )
+        return subcategory
+
+    async def create_subcategories(
+        self,
+        storage_name: str,
+        category_name: str,
+        entries: List[Tuple[str, Optional[str]]],
+    ) -> List[SubCategorySchema]:
+        """
+        Create multiple subcategories within a category in one operation.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            entries: List of (name, description) tuples to create
+
+        Returns:
+            List of SubCategorySchema in the same order as ``entries``
+
+        Raises:
+            CategoryNotFoundError: If parent category does not exist
+            ValueError: If any subcategory name is invalid or already exists
+            PermissionError: If user lacks create permissions
+        """
+        return cast(
+            List[SubCategorySchema],
+            await self.create_entities(
+                storage_name,
+                category_name,
+                entries,
+                entity_type=EntityType.SUBCATEGORY,
+            ),
+        )
+
+    async def delete_subcategory(
+        self, storage_name: str, category_name: str, subcategory_name: str
+    ) -> SubCategoryDeleteSchema:
+        """
+        Delete a subcategory and all its contents.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Name of the subcategory to delete
+
+        Returns:
+            SubCategoryDeleteSchema with deletion details
+
+        Raises:
+            SubCategoryNotFoundError: If subcategory does not exist
+            PermissionError: If user lacks delete permissions
+        """
+        (deleted,) = await self.delete_subcategories(
+            storage_name, category_name, [subcategory_name]
+        )
+        return deleted
+
+    async def delete_subcategory_if_empty(
+        self, storage_name: str, category_name: str, subcategory_name: str
+    ) -> SubCategoryDeleteSchema:
+        """
+        Delete a subcategory only if it has no items.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Name of the subcategory to delete
+
+        Returns:
+            SubCategoryDeleteSchema with deletion details
+
+        Raises:
+            SubCategoryNotFoundError: If subcategory does not exist
+            EntityNotEmptyError: If the subcategory has items
+            PermissionError: If user lacks delete permissions
+        """
+        (deleted,) = await self.delete_empty_entities(
+            storage_name,
+            category_name,
+            [subcategory_name],
+            entity_type=EntityType.SUBCATEGORY,
+        )
+        return cast(SubCategoryDeleteSchema, deleted)
+
+    async def delete_subcategories(
+        self, storage_name: str, category_name: str, names: List[str]
+    ) -> List[SubCategoryDeleteSchema]:
+        """
+        Delete multiple subcategories and all their contents in one operation.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            names: Names of the subcategories to delete
+
+        Returns:
+            List of SubCategoryDeleteSchema in the same order as ``names``
+
+        Raises:
+            SubCategoryNotFoundError: If any subcategory does not exist
+            PermissionError: If user lacks delete permissions
+        """
+        return cast(
+            List[SubCategoryDeleteSchema],
+            await self.delete_entities(
+                storage_name,
+                category_name,
+                names,
+                entity_type=EntityType.SUBCATEGORY,
+            ),
+        )
+
+    async def rename_subcategory(
+        self,
+        storage_name: str,
+        category_name: str,
+        old_subcategory_name: str,
+        new_subcategory_name: str,
+        expected_version: Optional[int] = None,
+    ) -> SubCategoryRenameSchema:
+        """
+        Rename an existing subcategory.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            old_subcategory_name: Current name of the subcategory
+            new_subcategory_name: New name for the subcategory
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            SubCategoryRenameSchema with rename operation details
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+        """
+        return cast(
+            SubCategoryRenameSchema,
+            await self.rename_entity(
+                storage_name,
+                category_name,
+                old_subcategory_name,
+                new_subcategory_name,
+                entity_type=EntityType.SUBCATEGORY,
+                expected_version=expected_version,
+            ),
+        )
+
+    async def get_subcategory(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+    ) -> SubCategorySchema:
+        """
+        Retrieve a subcategory by name.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Name of the subcategory to retrieve
+
+        Returns:
+            Subcategory information
+        """
+        return await self.get_entity(
+            storage_name,
+            category_name,
+            subcategory_name,
+            entity_type=EntityType.SUBCATEGORY,
+        )
+
+    async def get_subcategory_detail(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+        include: Optional[FrozenSet[EntityRelation]] = None,
+    ) -> SubCategoryDetailSchema:
+        """
+        Retrieve a subcategory by name with its contents.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Name of the subcategory to retrieve
+            include: Relations to load; None loads all of them
+
+        Returns:
+            Subcategory information with its items
+        """
+        return await self.get_entity_detail(
+            storage_name,
+            category_name,
+            subcategory_name,
+            entity_type=EntityType.SUBCATEGORY,
+            include=include,
+        )
+
+    async def list_subcategories(
+        self,
+        storage_name: str,
+        category_name: str,
+        pagination: Optional[PaginationParams] = None,
+        changed_since: Optional[datetime] = None,
+    ) -> PaginatedResponse[SubCategorySchema]:
+        """
+        List all subcategories in a category.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            pagination: Optional pagination parameters
+            changed_since: Only return subcategories updated after this
+                           time, as described in ``list_categories``
+
+        Returns:
+            Paginated response with the subcategories
+        """
+        return cast(
+            PaginatedResponse[SubCategorySchema],
+            await self.list_entities(
+                storage_name,
+                category_name,
+                pagination,
+                changed_since,
+                entity_type=EntityType.SUBCATEGORY,
+            ),
+        )
+
+    def iter_subcategories(
+        self,
+        storage_name: str,
+        category_name: str,
+        changed_since: Optional[datetime] = None,
+    ) -> AsyncIterator[SubCategorySchema]:
+        """
+        Stream all subcategories in a category one at a time.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            changed_since: Optional lower bound (exclusive) on update_time
+
+        Returns:
+            AsyncIterator[SubCategorySchema]: Subcategories in listing order
+        """
+        return cast(
+            AsyncIterator[SubCategorySchema],
+            self.iter_entities(
+                storage_name,
+                category_name,
+                changed_since,
+                entity_type=EntityType.SUBCATEGORY,
+            ),
+        )
+
+    def iter_subcategory_rows(
+        self,
+        storage_name: str,
+        category_name: str,
+        changed_since: Optional[datetime] = None,
+    ) -> AsyncIterator[SubCategoryRow]:
+        """
+        Stream subcategories as lightweight ``SubCategoryRow`` tuples.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            changed_since: Optional lower bound (exclusive) on update_time
+
+        Returns:
+            AsyncIterator[SubCategoryRow]: Subcategories in listing order
+        """
+        return cast(
+            AsyncIterator[SubCategoryRow],
+            self.iter_entity_rows(
+                storage_name,
+                category_name,
+                changed_since,
+                entity_type=EntityType.SUBCATEGORY,
+            ),
+        )
+
+    async def update_subcategory_description(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+        description: str,
+        expected_version: Optional[int] = None,
+    ) -> SubCategoryUpdateDescriptionSchema:
+        """
+        Update the description of a subcategory.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Name of the subcategory to update
+            description: New description text
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            SubCategoryUpdateDescriptionSchema with update details
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+        """
+        return cast(
+            SubCategoryUpdateDescriptionSchema,
+            await self.update_entity_description(
+                storage_name,
+                category_name,
+                subcategory_name,
+                description,
+                entity_type=EntityType.SUBCATEGORY,
+                expected_version=expected_version,
+            ),
+        )
+
+    async def move_subcategory(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+        new_category_name: str,
+        expected_version: Optional[int] = None,
+    ) -> SubCategoryMoveSchema:
+        """
+        Move a subcategory to a different category.
+
+        A move only updates the subcategory's parent reference; the
+        content of its items must not be re-read or re-written.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Current parent category name
+            subcategory_name: Name of the subcategory to move
+            new_category_name: Target category name
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            SubCategoryMoveSchema with move operation details
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+        """
+        return cast(
+            SubCategoryMoveSchema,
+            await self.move_entity(
+                storage_name,
+                category_name,
+                subcategory_name,
+                new_category_name,
+                entity_type=EntityType.SUBCATEGORY,
+                expected_version=expected_version,
+            ),
+        )
+
+    async def move_subcategories(
+        self, storage_name: str, category_name: str, moves: List[MoveSpec]
+    ) -> List[SubCategoryMoveSchema]:
+        """
+        Move several subcategories of a category in one operation.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Current parent category name
+            moves: Subcategory name, target category and optional expected
+                   version for each move
+
+        Returns:
+            List of SubCategoryMoveSchema in the same order as ``moves``
+        """
+        return cast(
+            List[SubCategoryMoveSchema],
+            await self.move_entities(
+                storage_name,
+                category_name,
+                moves,
+                entity_type=EntityType.SUBCATEGORY,
+            ),
+        )
+
+    async def set_subcategory_permission(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+        user_id: str,
+        permission: PermissionLevel,
+        expected_version: Optional[int] = None,
+    ) -> MutationResult:
+        """
+        Set the permission level for a user on a subcategory.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Name of the subcategory
+            user_id: ID of the user
+            permission: Permission level to set
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Version and update time of the subcategory after the change
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+        """
+        (result,) = await self.set_subcategory_permissions(
+            storage_name,
+            category_name,
+            [(subcategory_name, user_id, permission)],
+            expected_versions=[expected_version],
+        )
+        return result
+
+    async def set_subcategory_permissions(
+        self,
+        storage_name: str,
+        category_name: str,
+        assignments: List[Tuple[str, str, PermissionLevel]],
+        expected_versions: Optional[List[Optional[int]]] = None,
+    ) -> List[MutationResult]:
+        """
+        Set permission levels on several subcategories in one operation.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            assignments: List of (subcategory name, user ID, permission)
+                         tuples to apply
+            expected_versions: Versions the caller last read, aligned with
+                               ``assignments``
+
+        Returns:
+            Version and update time of each subcategory, in input order
+        """
+        return await self.set_entity_permissions(
+            storage_name,
+            category_name,
+            assignments,
+            entity_type=EntityType.SUBCATEGORY,
+            expected_versions=expected_versions,
+        )
+
+    async def remove_subcategory_permission(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+        user_id: str,
+        expected_version: Optional[int] = None,
+    ) -> MutationResult:
+        """
+        Remove user permissions from a subcategory.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Name of the subcategory
+            user_id: ID of the user
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Version and update time of the subcategory after the change
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+        """
+        return await self.remove_entity_permission(
+            storage_name,
+            category_name,
+            subcategory_name,
+            user_id,
+            entity_type=EntityType.SUBCATEGORY,
+            expected_version=expected_version,
+        )
+
+    async def add_subcategory_tag(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+        tag: str,
+        expected_version: Optional[int] = None,
+    ) -> MutationResult:
+        """
+        Add a tag to a subcategory.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Name of the subcategory
+            tag: Tag to add
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Version and update time of the subcategory after the change
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+        """
+        (result,) = await self.add_subcategory_tags(
+            storage_name,
+            category_name,
+            [(subcategory_name, tag)],
+            expected_versions=[expected_version],
+        )
+        return result
+
+    async def add_subcategory_tags(
+        self,
+        storage_name: str,
+        category_name: str,
+        assignments: List[Tuple[str, str]],
+        expected_versions: Optional[List[Optional[int]]] = None,
+    ) -> List[MutationResult]:
+        """
+        Add tags to several subcategories in one operation.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            assignments: List of (subcategory name, tag) tuples to apply
+            expected_versions: Versions the caller last read, aligned with
+                               ``assignments``
+
+        Returns:
+            Version and update time of each subcategory, in input order
+        """
+        return await self.add_entity_tags(
+            storage_name,
+            category_name,
+            assignments,
+            entity_type=EntityType.SUBCATEGORY,
+            expected_versions=expected_versions,
+        )
+
+    async def remove_subcategory_tag(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+        tag: str,
+    ) -> MutationResult:
+        """
+        Remove a tag from a subcategory.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Name of the subcategory
+            tag: Tag to remove
+
+        Returns:
+            Version and update time of the subcategory after the change
+
+        Raises:
+            ValueError: If tag does not exist
+        """
+        subcategory = await self.get_subcategory(
+            storage_name, category_name, subcategory_name
+        )
+        if tag not in subcategory.tags:
+            raise ValueError(
+                f"Tag '{tag}' not found on subcategory '{subcategory_name}'"
+            )
+        return await self.set_subcategory_tags(
+            storage_name,
+            category_name,
+            subcategory_name,
+            subcategory.tags - {tag},
+            expected_version=subcategory.version,
+        )
+
+    async def set_subcategory_tags(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+        tags: Set[str],
+        expected_version: Optional[int] = None,
+    ) -> MutationResult:
+        """
+        Replace the tags of a subcategory with ``tags`` in one statement.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Name of the subcategory
+            tags: Complete new set of tags
+            expected_version: Version the caller last read; the change
+                              is rejected if the stored version differs
+
+        Returns:
+            Version and update time of the subcategory after the change
+
+        Raises:
+            VersionConflictError: If ``expected_version`` is stale
+        """
+        return await self.set_entity_tags(
+            storage_name,
+            category_name,
+            subcategory_name,
+            tags,
+            entity_type=EntityType.SUBCATEGORY,
+            expected_version=expected_version,
+        )
+
+    async def patch_subcategory_tags(
+        self,
+        storage_name: str,
+        category_name: str,
+        subcategory_name: str,
+        add: Set[str],
+        remove: Set[str],
+    ) -> MutationResult:
+        """
+        Add and remove tags of a subcategory in one operation.
+
+        Args:
+            storage_name: Name of the parent storage
+            category_name: Name of the parent category
+            subcategory_name: Name of the subcategory
+            add: Tags to add
+            remove: Tags to remove; tags that are not set are ignored
+
+        Returns:
+            Version and update time of the subcategory after the change
+        """
+        return await self.patch_entity_tags(
+            storage_name,
+            category_name,
+            subcategory_name,
+            add,
+            remove,
+            entity_type=EntityType.SUBCATEGORY,
+        )
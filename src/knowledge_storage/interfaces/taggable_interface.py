@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Set
+from typing import Generic, Optional, TypeVar, Set
+
+from src.knowledge_storage.cache import MISSING, LRUCache
 
 EntityPath = TypeVar("EntityPath")
 EntityResult = TypeVar("EntityResult")
@@ -12,6 +14,9 @@ class TaggableInterface(ABC, Generic[EntityPath, EntityResult]):
     in the knowledge storage system.
     """
 
+    _TAGS_TTL = 5.0
+    _TAGS_MAXSIZE = 4096
+
     @abstractmethod
     async def add_tag(self, path: EntityPath, tag: str) -> EntityResult:
         """Add a tag to an entity.
@@ -49,3 +54,48 @@ class TaggableInterface(ABC, Generic[EntityPath, EntityResult]):
             Set of tags
         """
         pass
+
+    async def get_cached_tags(self, path: EntityPath) -> Set[str]:
+        """Read-through ``get_tags``.
+
+        Tags are kept for ``_TAGS_TTL`` seconds; implementations drop
+        them with ``_forget_tags`` after adding or removing a tag.
+
+        Args:
+            path: Path to the entity
+
+        Returns:
+            Set of tags
+        """
+        cache: Optional[LRUCache[EntityPath, frozenset[str]]] = (
+            self.__dict__.get("_tags_cache")
+        )
+        if cache is None:
+            cache = self.__dict__["_tags_cache"] = LRUCache(
+                self._TAGS_MAXSIZE, ttl=self._TAGS_TTL
+            )
+        tags = cache.get(path)
+        if tags is MISSING:
+            generation = self.__dict__.get("_tags_generation", 0)
+            tags = frozenset(await self.get_tags(path))
+            # A change during the read may have made it stale.
+            if generation == self.__dict__.get("_tags_generation", 0):
+                cache.set(path, tags)
+        return set(tags)
+
+    def _forget_tags(self, path: Optional[EntityPath] = None) -> None:
+        """Drop cached tags of one entity, or all of them.
+
+        Also bumps the generation, so a ``get_tags`` call that started
+        before the change does not cache the old tags once it returns.
+        """
+        self.__dict__["_tags_generation"] = (
+            self.__dict__.get("_tags_generation", 0) + 1
+        )
+        cache = self.__dict__.get("_tags_cache")
+        if cache is None:
+            return
+        if path is None:
+            cache.clear()
+        else:
+            cache.pop(path)
@@ -1,10 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Union
+from typing import Generic, TypeVar, List
 
-from fastapi import UploadFile
-from pydantic import HttpUrl
-
-from src.knowledge_storage.schemas import ItemVersionSchema
+from src.knowledge_storage.schemas import ItemSource, ItemVersionSchema
 
 EntityPath = TypeVar("EntityPath")
 
@@ -19,7 +16,7 @@ class VersionableInterface(ABC, Generic[EntityPath]):
 
     @abstractmethod
     async def create_version(
-        self, path: EntityPath, content: Union[HttpUrl, str, UploadFile]
+        self, path: EntityPath, content: ItemSource
     ) -> ItemVersionSchema:
         """Create a new version of an entity.
 
@@ -1,10 +1,64 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+import sys
 from datetime import datetime
-from enum import Enum
-from typing import Optional, List, Any, Dict, Set
+from enum import Enum, StrEnum
+from types import MappingProxyType
+from typing import (
+    Annotated,
+    Optional,
+    List,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Set,
+    Generic,
+    Literal,
+    Mapping,
+    NamedTuple,
+    NewType,
+    TypeVar,
+    Union,
+)
+
+from fastapi import UploadFile
+from pydantic import BaseModel, Field, HttpUrl, field_serializer
+
+T = TypeVar("T")
+
+MaterializedPath = NewType("MaterializedPath", str)
+
+
+def intern_tags(tags: Iterable[str]) -> FrozenSet[str]:
+    """Deduplicate tags into a frozenset of interned strings.
+
+    Tag vocabularies are small and repeat across many items, so interning
+    lets identical tags share one string object in memory.
+    """
+    return frozenset(map(sys.intern, tags))
+
+
+def materialized_path(
+    storage_name: str, *names: Optional[str]
+) -> MaterializedPath:
+    """Build the canonical ``storage/category/subcategory`` path.
 
-from pydantic import BaseModel, Field
+    None parts are skipped, so ``materialized_path(storage, parent, name)``
+    works for categories (``parent`` is None) and subcategories alike.
+
+    Raises:
+        ValueError: If a part is empty or contains ``/``, since the path
+            would then collide with the one of a different entity
+    """
+    parts = [storage_name, *(name for name in names if name is not None)]
+    for part in parts:
+        if not part or "/" in part:
+            raise ValueError(f"Invalid path segment: {part!r}")
+    return MaterializedPath("/".join(parts))
 
 
 class PermissionLevel(str, Enum):
@@ -20,6 +74,20 @@ class PermissionLevel(str, Enum):
     ADMIN = "admin"
 
 
+class EntityType(StrEnum):
+    """Kinds of entities handled by the unified category entity methods.
+
+    Members are singletons, so implementations should dispatch with
+    ``entity_type is EntityType.CATEGORY`` rather than ``==``.
+
+    CATEGORY: Top-level category, whose parent is a storage
+    SUBCATEGORY: Subcategory, whose parent is a category
+    """
+
+    CATEGORY = "category"
+    SUBCATEGORY = "subcategory"
+
+
 class CreateSchema(BaseModel):
     """Base schema for creating new resources.
 
@@ -28,6 +96,8 @@ class CreateSchema(BaseModel):
         description: Optional description
         tags: Set of tags for categorization
         permissions: Dictionary of user permissions
+        version: Row version, incremented on every change; pass it back
+                 as ``expected_version`` to detect concurrent updates
         create_time: Creation timestamp
         update_time: Last update timestamp
     """
@@ -36,10 +106,15 @@ class CreateSchema(BaseModel):
     description: Optional[str] = None
     tags: Set[str] = Field(default_factory=set)
     permissions: Dict[str, PermissionLevel] = Field(default_factory=dict)
+    version: int = 1
 
     create_time: Optional[datetime] = None
     update_time: Optional[datetime] = None
 
+    @field_serializer("tags")
+    def _serialize_tags(self, tags: Set[str]) -> List[str]:
+        return sorted(tags)
+
 
 class DeleteSchema(BaseModel):
     """Base schema for deleted resources.
@@ -84,17 +159,73 @@ class MoveSchema(BaseModel):
 class PaginationParams(BaseModel):
     """Parameters for paginated requests.
 
+    When ``cursor`` is set, implementations must page by keyset
+    (``WHERE (create_time, name) > cursor ORDER BY create_time, name``)
+    and ignore ``page``. Keyset pages leave ``total`` and
+    ``total_pages`` as None so no ``COUNT(*)`` is run. Offset paging by
+    ``page`` makes the store skip every earlier row, so use it only for
+    shallow page jumps (below page 100).
+
+    Cursors are built with ``encode_cursor`` and read back with
+    ``decode_cursor``; clients must treat them as opaque.
+
     Attributes:
-        page: Page number (1-based)
+        page: Page number (1-based), used when no cursor is given
         page_size: Number of items per page
+        cursor: Opaque cursor returned as ``next_cursor`` by the previous
+                page
     """
 
     page: int = 1
     page_size: int = 10
+    cursor: Optional[str] = None
+
+
+def encode_cursor(*key: Any) -> str:
+    """Encode the sort key of the last row of a page as a cursor.
+
+    Values that are not JSON types, such as datetimes, are stored as
+    their ``str()`` form.
+    """
+    payload = json.dumps(key, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """Decode a cursor built by ``encode_cursor`` back into its key.
+
+    Raises:
+        ValueError: If the cursor was not produced by ``encode_cursor``
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+    if not isinstance(key, list):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return key
 
 
-class PaginatedResponse(BaseModel):
-    """Response schema for paginated results.
+class BulkOptions(BaseModel):
+    """Options controlling how bulk operations are executed.
+
+    Attributes:
+        batch_size: Maximum number of rows sent to the backend per
+                    statement; larger inputs are split into chunks
+        continue_on_error: If True, keep processing later chunks after a
+                           chunk fails instead of aborting the operation
+    """
+
+    batch_size: int = Field(default=1000, gt=0)
+    continue_on_error: bool = False
+
+
+class PaginatedResponse(BaseModel, Generic[T]):
+    """Response schema for list results, paginated or not.
+
+    List operations always return this single typed model so responses
+    are validated without a union. Pagination fields are left as None
+    when the listing was not paginated.
 
     Attributes:
         items: List of items on the current page
@@ -102,13 +233,15 @@ class PaginatedResponse(BaseModel):
         page: Current page number
         page_size: Number of items per page
         total_pages: Total number of pages
+        next_cursor: Cursor for the next page, None on the last page
     """
 
-    items: List[Any]
-    total: int
-    page: int
-    page_size: int
-    total_pages: int
+    items: List[T]
+    total: Optional[int] = None
+    page: Optional[int] = None
+    page_size: Optional[int] = None
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class KnowledgeSchema(CreateSchema):
@@ -270,6 +403,343 @@ class SubCategoryMoveSchema(MoveSchema):
     category: str
 
 
+class ItemPath(NamedTuple):
+    """Location of an item, built once per request and reused.
+
+    Being an immutable tuple of interned strings, it is hashed cheaply and
+    can key caches directly.
+
+    Attributes:
+        storage: Name of the parent storage
+        category: Name of the parent category
+        item: Name of the item
+        subcategory: Name of the parent subcategory, if any
+    """
+
+    storage: str
+    category: str
+    item: str
+    subcategory: Optional[str] = None
+
+    @classmethod
+    def of(
+        cls,
+        storage: str,
+        category: str,
+        item: str,
+        subcategory: Optional[str] = None,
+    ) -> ItemPath:
+        """Build a path with its parts interned."""
+        return cls(
+            sys.intern(storage),
+            sys.intern(category),
+            sys.intern(item),
+            sys.intern(subcategory) if subcategory is not None else None,
+        )
+
+    @property
+    def materialized(self) -> MaterializedPath:
+        return materialized_path(
+            self.storage, self.category, self.subcategory, self.item
+        )
+
+
+class MoveSpec(NamedTuple):
+    """One move of a ``move_entities`` batch.
+
+    Attributes:
+        name: Name of the entity to move
+        new_parent_name: Target storage for categories, target category
+                         for subcategories
+        expected_version: Optional version the entity must still have
+    """
+
+    name: str
+    new_parent_name: str
+    expected_version: Optional[int] = None
+
+
+class LockToken(NamedTuple):
+    """Handle of a held entity lock.
+
+    Attributes:
+        path: Materialized path of the locked entity
+        token: Backend specific lock identifier
+        exclusive: Whether the lock excludes shared holders
+    """
+
+    path: MaterializedPath
+    token: str
+    exclusive: bool = True
+
+
+class MutationResult(NamedTuple):
+    """Outcome of a tag or permission change.
+
+    Attributes:
+        version: Version of the entity after the change
+        update_time: Time of the change
+    """
+
+    version: int
+    update_time: datetime
+
+
+class CategoryRow(NamedTuple):
+    """Unvalidated category record for streaming listings.
+
+    Built straight from a backend row, e.g. ``CategoryRow(*record)``,
+    without the per-field validation of ``CategorySchema``. Convert with
+    ``to_schema`` at the API edge.
+    """
+
+    name: str
+    knowledge_storage: str
+    version: int
+    description: Optional[str] = None
+    tags: FrozenSet[str] = frozenset()
+    permissions: Mapping[str, PermissionLevel] = MappingProxyType({})
+    create_time: Optional[datetime] = None
+    update_time: Optional[datetime] = None
+
+    def to_schema(self) -> CategorySchema:
+        return CategorySchema.model_construct(
+            **{**self._asdict(), "permissions": dict(self.permissions)}
+        )
+
+
+class SubCategoryRow(NamedTuple):
+    """Unvalidated subcategory record, see ``CategoryRow``."""
+
+    name: str
+    knowledge_storage: str
+    category: str
+    version: int
+    description: Optional[str] = None
+    tags: FrozenSet[str] = frozenset()
+    permissions: Mapping[str, PermissionLevel] = MappingProxyType({})
+    create_time: Optional[datetime] = None
+    update_time: Optional[datetime] = None
+
+    def to_schema(self) -> SubCategorySchema:
+        return SubCategorySchema.model_construct(
+            **{**self._asdict(), "permissions": dict(self.permissions)}
+        )
+
+
+class EntityOpBase(BaseModel):
+    """Common fields of an operation sent through ``batch_ops``.
+
+    Attributes:
+        entity_type: Kind of entity the operation targets
+        parent_name: Name of the parent category, None for categories
+        name: Name of the target entity
+        expected_version: Reject the operation if the entity's stored
+                          version differs
+    """
+
+    entity_type: EntityType
+    parent_name: Optional[str] = None
+    name: str
+    expected_version: Optional[int] = None
+
+
+class CreateEntityOp(EntityOpBase):
+    """Create an entity.
+
+    Attributes:
+        op: Operation discriminator, always "create"
+        description: Optional description of the new entity
+    """
+
+    op: Literal["create"] = "create"
+    description: Optional[str] = None
+
+
+class RenameEntityOp(EntityOpBase):
+    """Rename an entity.
+
+    Attributes:
+        op: Operation discriminator, always "rename"
+        new_name: New name for the entity
+    """
+
+    op: Literal["rename"] = "rename"
+    new_name: str
+
+
+class DeleteEntityOp(EntityOpBase):
+    """Delete an entity.
+
+    Attributes:
+        op: Operation discriminator, always "delete"
+    """
+
+    op: Literal["delete"] = "delete"
+
+
+class UpdateDescriptionEntityOp(EntityOpBase):
+    """Replace the description of an entity.
+
+    Attributes:
+        op: Operation discriminator, always "update_description"
+        description: New description
+    """
+
+    op: Literal["update_description"] = "update_description"
+    description: str
+
+
+class MoveEntityOp(EntityOpBase):
+    """Move an entity to another parent.
+
+    Attributes:
+        op: Operation discriminator, always "move"
+        new_parent_name: Storage name for categories, category name for
+                         subcategories
+    """
+
+    op: Literal["move"] = "move"
+    new_parent_name: str
+
+
+class AddTagEntityOp(EntityOpBase):
+    """Add a tag to an entity.
+
+    Attributes:
+        op: Operation discriminator, always "add_tag"
+        tag: Tag to add
+    """
+
+    op: Literal["add_tag"] = "add_tag"
+    tag: str
+
+
+class SetPermissionEntityOp(EntityOpBase):
+    """Grant a permission on an entity.
+
+    Attributes:
+        op: Operation discriminator, always "set_permission"
+        user_id: ID of the user
+        permission: Permission level to grant
+    """
+
+    op: Literal["set_permission"] = "set_permission"
+    user_id: str
+    permission: PermissionLevel
+
+
+class RemovePermissionEntityOp(EntityOpBase):
+    """Revoke a user's permission on an entity.
+
+    Attributes:
+        op: Operation discriminator, always "remove_permission"
+        user_id: ID of the user
+    """
+
+    op: Literal["remove_permission"] = "remove_permission"
+    user_id: str
+
+
+EntityOp = Annotated[
+    Union[
+        CreateEntityOp,
+        RenameEntityOp,
+        DeleteEntityOp,
+        UpdateDescriptionEntityOp,
+        MoveEntityOp,
+        AddTagEntityOp,
+        SetPermissionEntityOp,
+        RemovePermissionEntityOp,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class EntityOpResult(BaseModel):
+    """Outcome of one operation of a ``batch_ops`` call.
+
+    Attributes:
+        op: Discriminator of the operation this result belongs to
+        success: Whether the operation was applied
+        entity: Entity state after the operation, None for deletes and
+                failed operations
+        error: Error message when the operation failed
+    """
+
+    op: str
+    success: bool
+    entity: Optional[CategorySchema] = None
+    error: Optional[str] = None
+
+
+class InvalidationEvent(BaseModel):
+    """Notification that a category or subcategory has changed.
+
+    Attributes:
+        entity_type: Kind of entity that changed
+        storage_name: Name of the parent storage
+        parent_name: Name of the parent category, None for categories
+        name: Name of the entity before the change
+        op: Operation that caused the change, using the ``EntityOp``
+            discriminator values
+        version: Version of the entity after the change, None when it
+                 was deleted
+    """
+
+    entity_type: EntityType
+    storage_name: str
+    parent_name: Optional[str] = None
+    name: str
+    op: str
+    version: Optional[int] = None
+
+
+class UrlSource(BaseModel):
+    """Item content referenced by a URL.
+
+    Attributes:
+        kind: Source discriminator, always "url"
+        url: URL of the content
+    """
+
+    kind: Literal["url"] = "url"
+    url: HttpUrl
+
+
+class PathSource(BaseModel):
+    """Item content referenced by a file path.
+
+    Attributes:
+        kind: Source discriminator, always "path"
+        path: Path to the file with the content
+    """
+
+    kind: Literal["path"] = "path"
+    path: str
+
+
+class FileSource(BaseModel):
+    """Item content uploaded as a file.
+
+    Attributes:
+        kind: Source discriminator, always "file"
+        file: Uploaded file object
+        content_length: Size of the upload in bytes, when known up front
+        content_hash: Expected hex SHA-256 of the upload, when known
+    """
+
+    kind: Literal["file"] = "file"
+    file: UploadFile
+    content_length: Optional[int] = None
+    content_hash: Optional[str] = None
+
+
+ItemSource = Annotated[
+    Union[UrlSource, PathSource, FileSource], Field(discriminator="kind")
+]
+
+
 class ItemSchema(BaseModel):
     """Base schema for knowledge items (documents or URLs).
 
@@ -292,6 +762,10 @@ class ItemSchema(BaseModel):
     create_time: Optional[datetime] = None
     update_time: Optional[datetime] = None
 
+    @field_serializer("tags")
+    def _serialize_tags(self, tags: Set[str]) -> List[str]:
+        return sorted(tags)
+
 
 class ItemCreateSchema(ItemSchema):
     """Schema for creating new items.
@@ -417,3 +891,14 @@ class SmartSearchResponseSchema(BaseModel):
     results: List[SmartSearchSchema]
     total_results: int
     execution_time: float
+
+
+# Detail schemas reference models declared later in this module, so
+# pydantic leaves them incomplete. Rebuild them here so the validators
+# are built at import instead of on the first request.
+for _schema in (
+    KnowledgeDetailSchema,
+    CategoryDetailSchema,
+    SubCategoryDetailSchema,
+):
+    _schema.model_rebuild()
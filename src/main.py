@@ -1,4 +1,5 @@
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
@@ -6,12 +7,26 @@ from fastapi.staticfiles import StaticFiles
 from starlette.responses import HTMLResponse
 from starlette.templating import Jinja2Templates
 
+from src.api.responses import PydanticJSONResponse
 from src.api.v1.data_for_rag import router as router_cloud_storage
 from src.core.config import settings
+from src.services.storage.implementations import close_shared_http_session
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Divorce Lawyer Assistant API", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    yield
+    close_shared_http_session()
+
+
+app = FastAPI(
+    title="Divorce Lawyer Assistant API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=PydanticJSONResponse,
+)
 
 app.include_router(router_cloud_storage)
 
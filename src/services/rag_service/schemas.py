@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import heapq
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 
 from src.core.config import settings
 
@@ -72,12 +74,104 @@ class QueryResultSchema(BaseModel):
     file_path: str
 
 
+class SearchResultsBatch:
+    """
+    Column-oriented buffer of vector search hits.
+
+    Scores are kept in their own list so the best hits are selected by
+    index with a bounded heap; QueryResultSchema objects are only built
+    for the rows that survive the slice.
+    """
+
+    __slots__ = ("ids", "texts", "metadatas", "file_paths", "_scores")
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.texts: List[str] = []
+        self.metadatas: List[Dict[str, Any]] = []
+        self.file_paths: List[str] = []
+        self._scores: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def append(
+        self,
+        id_: str,
+        text: str,
+        metadata: Dict[str, Any],
+        score: float,
+        file_path: str,
+    ) -> None:
+        self.ids.append(id_)
+        self.texts.append(text)
+        self.metadatas.append(metadata)
+        self.file_paths.append(file_path)
+        self._scores.append(score)
+
+    def top_k(self, k: int) -> List[QueryResultSchema]:
+        """
+        Returns the k best-scoring hits ordered by descending score.
+
+        Hits with equal scores keep the order in which they were appended.
+        """
+        size = len(self)
+        if k <= 0 or size == 0:
+            return []
+
+        # nlargest is stable, so ties keep their append order.
+        indices = heapq.nlargest(k, range(size), key=self._scores.__getitem__)
+
+        return [
+            QueryResultSchema(
+                id=self.ids[i],
+                text=self.texts[i],
+                metadata=self.metadatas[i],
+                score=self._scores[i],
+                file_path=self.file_paths[i],
+            )
+            for i in indices
+        ]
+
+
 class SearchResponseSchema(BaseModel):
     query: str
     results: List[QueryResultSchema]
     total: int
 
 
+def build_search_response_bytes(
+    query: str, results: Iterable[QueryResultSchema], total: int
+) -> bytes:
+    """
+    Serializes a search response straight to JSON bytes.
+
+    Produces the same document as SearchResponseSchema.model_dump_json()
+    without building the response model, encoding one result at a time.
+    """
+    chunks = [
+        b'{"query":',
+        to_json(query),
+        b',"results":[',
+    ]
+    for position, result in enumerate(results):
+        if position:
+            chunks.append(b",")
+        chunks.append(
+            to_json(
+                {
+                    "id": result.id,
+                    "text": result.text,
+                    "metadata": result.metadata,
+                    "score": result.score,
+                    "file_path": result.file_path,
+                }
+            )
+        )
+    chunks.append(b'],"total":%d}' % total)
+    return b"".join(chunks)
+
+
 class ProcessingStatusSchema(BaseModel):
     index_name: str
     namespace: str
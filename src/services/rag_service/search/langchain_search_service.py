@@ -9,7 +9,10 @@ from src.services.rag_service.factory.vector_store_factory import (
     VectorStoreFactory,
 )
 from src.services.rag_service.interfaces import SearchServiceInterface
-from src.services.rag_service.schemas import QueryResultSchema
+from src.services.rag_service.schemas import (
+    QueryResultSchema,
+    SearchResultsBatch,
+)
 from src.services.rag_service.vector_stores.pinecone_factory import (
     PineconeVectorStoreFactory,
 )
@@ -49,16 +52,13 @@ class LangChainSearchService(SearchServiceInterface):
             filter=filters,
         )
 
-        # Format results
-        search_results_format: List[QueryResultSchema] = []
-        search_results_format.extend(
-            QueryResultSchema(
-                id=doc.metadata.get("chunk_id", ""),
-                text=doc.page_content,
-                metadata=doc.metadata,
-                score=float(score),
-                file_path=doc.metadata.get("source", ""),
+        batch = SearchResultsBatch()
+        for doc, score in search_results:
+            batch.append(
+                doc.metadata.get("chunk_id", ""),
+                doc.page_content,
+                doc.metadata,
+                float(score),
+                doc.metadata.get("source", ""),
             )
-            for doc, score in search_results
-        )
-        return search_results_format
+        return batch.top_k(top_k)
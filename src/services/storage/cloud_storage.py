@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import List, Optional, Union, Set, Tuple
+from typing import AsyncIterator, List, Optional, Union, Set, Tuple
 
 from fastapi import UploadFile, Request, status, HTTPException
 from google.cloud.storage import Blob  # type: ignore
@@ -214,6 +214,13 @@ class CloudStorage(BaseStorageInterface):
             case_sensitive=case_sensitive,
         )
 
+    def iter_files(
+        self,
+        prefix: Optional[str] = "",
+        request: Optional[Request] = None,
+    ) -> AsyncIterator[FileSchema]:
+        return self._cloud_storage.iter_blobs(prefix=prefix)
+
     async def list_folders(
         self,
         prefix: Optional[str] = None,
@@ -1,3 +1,3 @@
-from .google_storage import GoogleCloudStorage
+from .google_storage import GoogleCloudStorage, close_shared_http_session
 
-__all__ = ["GoogleCloudStorage"]
+__all__ = ["GoogleCloudStorage", "close_shared_http_session"]
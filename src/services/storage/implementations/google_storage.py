@@ -1,8 +1,30 @@
 import asyncio
+import functools
+import io
 import logging
-from typing import List, Optional, Union, Type
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from urllib.parse import quote
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    Type,
+    TypeVar,
+)
 
+import google.auth
 from dotenv import load_dotenv
+from google.api_core.page_iterator import Page
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage  # type: ignore
 from google.cloud.storage import Blob, Bucket  # type: ignore
 from google.cloud.storage_control_v2 import (
@@ -13,10 +35,12 @@ from google.cloud.storage_control_v2 import (
     ListFoldersRequest,
     GetFolderRequest,
 )  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
 
 from src.services.storage.decorators import (
-    handle_cloud_storage_exceptions,
+    async_cloud_storage_errors,
     async_handle_cloud_storage_exceptions,
+    cloud_storage_errors,
 )
 from src.services.storage.interfaces.cloud_storage_interface import (
     CloudStorageInterface,
@@ -34,9 +58,93 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_HTTP_POOL_CONNECTIONS = 32
+_HTTP_POOL_MAXSIZE = 128
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_http_session() -> AuthorizedSession:
+    """
+    Get the HTTP session shared by all storage clients of the process.
+
+    Every storage.Client otherwise opens its own connection pool, so each
+    GoogleCloudStorage instance would pay for fresh TCP and TLS handshakes.
+    The session is created on first use; call close_shared_http_session()
+    on application shutdown.
+    """
+    credentials, _ = google.auth.default(scopes=storage.Client.SCOPE)
+    session = AuthorizedSession(credentials)
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=_HTTP_POOL_CONNECTIONS,
+            pool_maxsize=_HTTP_POOL_MAXSIZE,
+            pool_block=False,
+        ),
+    )
+    return session
+
+
+def close_shared_http_session() -> None:
+    """Close the shared HTTP session if it has been created."""
+    if get_shared_http_session.cache_info().currsize:
+        get_shared_http_session().close()
+        get_shared_http_session.cache_clear()
+
+
+# Resource-name templates of the Storage Control API are static helpers,
+# bound once here instead of being resolved through a client instance.
+_format_project_path = StorageControlClient.common_project_path
+_format_folder_path = StorageControlClient.folder_path
+_format_common_folder_path = StorageControlClient.common_folder_path
+
+
+@functools.lru_cache(maxsize=1024)
+def _folder_resource_name(bucket_name: str, folder_path: str) -> str:
+    return _format_folder_path(
+        project="_", bucket=bucket_name, folder=folder_path
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _common_folder_path(folder_name: str) -> str:
+    folder_path = _format_common_folder_path(folder_name).split("folders/")[-1]
+    return folder_path if folder_path.endswith("/") else f"{folder_path}/"
+
+
+def _folder_depth(folder_path: str) -> int:
+    return folder_path.count("/")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(project_id: str) -> storage.Client:
+    return storage.Client(project=project_id, _http=get_shared_http_session())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_storage_control() -> StorageControlClient:
+    return StorageControlClient()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_bucket(project_id: str, bucket_name: str) -> Bucket:
+    return _get_client(project_id).get_bucket(bucket_or_name=bucket_name)
+
 
 class GoogleCloudStorage(CloudStorageInterface):
     _BASE_STORAGE_CLOUD_URL = "https://storage.googleapis.com"
+    _MAX_CONCURRENT_FOLDER_DELETES = 16
+    _MAX_SDK_WORKERS = 32
+    _DELETE_BATCH_SIZE = 100
+    _RESUMABLE_UPLOAD_THRESHOLD = 8 * 1024 * 1024
+    _LIST_BLOBS_FIELDS = "items(name,size,contentType),nextPageToken"
+    _LIST_BLOB_NAMES_FIELDS = "items(name),nextPageToken"
+    _LIST_PAGE_SIZE = 1000
+    _FOLDERS_CACHE_TTL = 30.0
+    _FOLDERS_CACHE_MAX_STALE = 300.0
+    _FOLDERS_CACHE_MAXSIZE = 256
 
     def __init__(self, bucket_name: str, project_id: str) -> None:
         self.bucket_name = bucket_name
@@ -44,13 +152,21 @@ class GoogleCloudStorage(CloudStorageInterface):
         self._client: Optional[storage.Client] = None
         self._storage_control: Optional[StorageControlClient] = None
         self._bucket: Optional[Bucket] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._MAX_SDK_WORKERS,
+            thread_name_prefix="gcs-sdk",
+        )
+        self._folders_cache: Dict[
+            str, Tuple[float, List[FolderDataSchema]]
+        ] = {}
+        self._folders_refresh_tasks: Dict[str, asyncio.Task] = {}
+        self._folders_cache_generation = 0
 
     @property
     def base_url(self) -> str:
         return f"{self._BASE_STORAGE_CLOUD_URL}/{self.bucket_name}"
 
     @property
-    @handle_cloud_storage_exceptions
     def client(self) -> storage.Client:
         """
         Get cloud storage client instance.
@@ -60,15 +176,18 @@ class GoogleCloudStorage(CloudStorageInterface):
         The client is initialized with the project ID specified during
         class initialization.
 
+        Clients are cached per project at module level, so every instance
+        working with the same project shares one client.
+
         Returns:
             storage.Client: Google Cloud Storage client instance
         """
         if self._client is None:
-            self._client = storage.Client(project=self.project_id)
+            with cloud_storage_errors:
+                self._client = _get_client(self.project_id)
         return self._client
 
     @property
-    @handle_cloud_storage_exceptions
     def storage_control(self) -> StorageControlClient:
         """
         Get storage control client instance.
@@ -80,11 +199,11 @@ class GoogleCloudStorage(CloudStorageInterface):
             StorageControlClient: Storage control client instance.
         """
         if self._storage_control is None:
-            self._storage_control = StorageControlClient()
+            with cloud_storage_errors:
+                self._storage_control = _get_storage_control()
         return self._storage_control
 
     @property
-    @handle_cloud_storage_exceptions
     def bucket(self) -> Bucket:
         """
         Get the cloud storage bucket instance.
@@ -92,15 +211,15 @@ class GoogleCloudStorage(CloudStorageInterface):
         This property returns a Bucket instance for the bucket specified during
         class initialization.
         The bucket is used for all blob (file) operations.
-        The bucket is lazily initialized on first access.
+        The bucket is lazily initialized on first access and cached per
+        (project, bucket) pair at module level.
 
         Returns:
             Bucket: Google Cloud Storage bucket instance
         """
         if self._bucket is None:
-            self._bucket = self.client.get_bucket(
-                bucket_or_name=self.bucket_name
-            )
+            with cloud_storage_errors:
+                self._bucket = _get_bucket(self.project_id, self.bucket_name)
         return self._bucket
 
     @async_handle_cloud_storage_exceptions
@@ -118,69 +237,62 @@ class GoogleCloudStorage(CloudStorageInterface):
         if isinstance(content, str):
             content = content.encode("utf-8")
 
-        blob.upload_from_string(content, content_type=content_type)
+        if len(content) > self._RESUMABLE_UPLOAD_THRESHOLD:
+            # Large payloads go through a chunked resumable session, so a
+            # failed request only resends the current chunk.
+            blob.chunk_size = self._RESUMABLE_UPLOAD_THRESHOLD
+            await self._run_blocking(
+                blob.upload_from_file,
+                io.BytesIO(content),
+                size=len(content),
+                content_type=content_type,
+            )
+        else:
+            await self._run_blocking(
+                blob.upload_from_string, content, content_type=content_type
+            )
 
-        return FileSchema(
-            filename=self._get_blob_name(blob.name),
-            path=self._get_blob_path(blob.name),
-            url=blob.public_url,
-            size=blob.size,
-            content_type=blob.content_type,
-        )
+        return self._file_from_blob(blob)
 
     @async_handle_cloud_storage_exceptions
     async def get_blob(self, file_path: str) -> FileSchema:
         """Get blob (file) by path"""
-        blob: Blob = self.bucket.get_blob(self._normalize_file_path(file_path))
-
-        return FileSchema(
-            filename=self._get_blob_name(blob.name),
-            path=self._get_blob_path(blob.name),
-            url=blob.public_url,
-            size=blob.size,
-            content_type=blob.content_type,
+        blob: Blob = await self._run_blocking(
+            self.bucket.get_blob, self._normalize_file_path(file_path)
         )
 
+        return self._file_from_blob(blob)
+
     @async_handle_cloud_storage_exceptions
     async def delete_blob(self, file_path: str) -> FileDeleteSchema:
         blob: Blob = self.bucket.blob(self._normalize_file_path(file_path))
-        blob.delete()
+        await self._run_blocking(blob.delete)
 
         return FileDeleteSchema(file=file_path)
 
     @async_handle_cloud_storage_exceptions
     async def copy_blob(self, source_blob: Blob, new_name: str) -> FileSchema:
-        new_blob = self.bucket.copy_blob(source_blob, self.bucket, new_name)
-
-        return FileSchema(
-            filename=self._get_blob_name(new_blob.name),
-            path=self._get_blob_path(new_blob.name),
-            url=new_blob.public_url,
-            size=new_blob.size,
-            content_type=new_blob.content_type,
+        new_blob = await self._run_blocking(
+            self.bucket.copy_blob, source_blob, self.bucket, new_name
         )
 
+        return self._file_from_blob(new_blob)
+
     @async_handle_cloud_storage_exceptions
     async def rename_blob(
         self, source_blob_path: str, new_name: str
     ) -> FileSchema:
 
-        source_blob = self.bucket.get_blob(
-            self._normalize_file_path(source_blob_path)
-        )
+        normalized_path = self._normalize_file_path(source_blob_path)
+        folder_prefix = normalized_path.rpartition("/")[0]
+        new_path = f"{folder_prefix}/{new_name}" if folder_prefix else new_name
 
-        folder_ = self._normalize_file_path(source_blob_path).split("/")[:-1]
-        new_blob = self.bucket.rename_blob(
-            source_blob, f"{folder_}/{new_name}"
+        source_blob: Blob = self.bucket.blob(normalized_path)
+        new_blob = await self._run_blocking(
+            self.bucket.rename_blob, source_blob, new_path
         )
 
-        return FileSchema(
-            filename=self._get_blob_name(new_blob.name),
-            path=self._get_blob_path(new_blob.name),
-            url=new_blob.public_url,
-            size=new_blob.size,
-            content_type=new_blob.content_type,
-        )
+        return self._file_from_blob(new_blob)
 
     @async_handle_cloud_storage_exceptions
     async def list_blobs(
@@ -189,28 +301,48 @@ class GoogleCloudStorage(CloudStorageInterface):
         search_query: Optional[str] = None,
         case_sensitive: Optional[bool] = False,
     ) -> List[FileSchema]:
-        blobs: List[Blob] = list(
-            self.bucket.list_blobs(
+        if search_query and not case_sensitive:
+            search_query = search_query.lower()
+
+        if not search_query:
+            return [file async for file in self.iter_blobs(prefix)]
+
+        def collect() -> List[FileSchema]:
+            # Pages are fetched lazily while iterating, so filtering and
+            # conversion happen in the same pass as the download.
+            blobs: Iterable[Blob] = self.bucket.list_blobs(
                 prefix=self._normalize_file_path(prefix),
+                fields=self._LIST_BLOBS_FIELDS,
+                page_size=self._LIST_PAGE_SIZE,
             )
-        )
-
-        if search_query:
-            if not case_sensitive:
-                search_query = search_query.lower()
             return self._search_blobs(blobs, search_query, case_sensitive)
 
-        return [
-            FileSchema(
-                filename=self._get_blob_name(blob.name),
-                path=self._get_blob_path(blob.name),
-                url=blob.public_url,
-                size=blob.size,
-                content_type=blob.content_type,
+        return await self._run_blocking(collect)
+
+    async def iter_blobs(
+        self, prefix: Optional[str] = ""
+    ) -> AsyncIterator[FileSchema]:
+        """
+        Iterate over files under the prefix one listing page at a time.
+
+        Each page is fetched and converted in the worker pool, and its files
+        are yielded before the next page is requested, so consumers can start
+        processing after the first page instead of the whole listing.
+        """
+        with async_cloud_storage_errors:
+            pages = await self._run_blocking(
+                lambda: self.bucket.list_blobs(
+                    prefix=self._normalize_file_path(prefix),
+                    fields=self._LIST_BLOBS_FIELDS,
+                    page_size=self._LIST_PAGE_SIZE,
+                ).pages
             )
-            for blob in blobs
-            if not blob.name.endswith("/")
-        ]
+            while True:
+                files = await self._run_blocking(self._next_page_files, pages)
+                if files is None:
+                    return
+                for file in files:
+                    yield file
 
     @async_handle_cloud_storage_exceptions
     async def create_folder(
@@ -240,14 +372,17 @@ class GoogleCloudStorage(CloudStorageInterface):
         Raises:
             Exception: If folder creation fails (handled by decorator)
         """
-        response = self.storage_control.create_folder(
+        response = await self._run_blocking(
+            self.storage_control.create_folder,
             request=create_request(
-                parent=self._get_bucket_path(),
+                parent=self._bucket_path,
                 folder_id=folder_name,
                 recursive=False,
-            )
+            ),
         )
 
+        self._invalidate_folders_cache()
+
         return FolderDataSchema(
             folder_name=self._get_folder_name(response.name),
             folder_path=self._get_common_folder_path(folder_name),
@@ -262,8 +397,9 @@ class GoogleCloudStorage(CloudStorageInterface):
 
         This method gets folder information from Google Cloud Storage
         """
-        folder = self.storage_control.get_folder(
-            request=GetFolderRequest(name=self._get_folder_path(folder_path))
+        folder = await self._run_blocking(
+            self.storage_control.get_folder,
+            request=GetFolderRequest(name=self._get_folder_path(folder_path)),
         )
 
         return FolderDataSchema(
@@ -304,6 +440,8 @@ class GoogleCloudStorage(CloudStorageInterface):
         else:
             await self._delete_folder(folder_path)
 
+        self._invalidate_folders_cache()
+
         return FolderDeleteSchema(folder_name=folder_path)
 
     @async_handle_cloud_storage_exceptions
@@ -333,13 +471,16 @@ class GoogleCloudStorage(CloudStorageInterface):
         Raises:
             Exception: If folder renaming fails (handled by decorator)
         """
-        self.storage_control.rename_folder(
+        await self._run_blocking(
+            self.storage_control.rename_folder,
             request=rename_request(
                 name=self._get_folder_path(old_name),
                 destination_folder_id=new_name,
-            )
+            ),
         )
 
+        self._invalidate_folders_cache()
+
         folder_path = self._get_common_folder_path(new_name)
 
         return FolderRenameSchema(
@@ -361,6 +502,12 @@ class GoogleCloudStorage(CloudStorageInterface):
         It constructs the necessary request with the parent bucket path and
         optional prefix.
 
+        Listings are cached per prefix with stale-while-revalidate semantics:
+        an entry younger than _FOLDERS_CACHE_TTL is returned as is, an older
+        one (up to _FOLDERS_CACHE_MAX_STALE) is returned immediately while a
+        background task refreshes it. Folder writes through this instance
+        invalidate the cache.
+
         Args:
             prefix: Optional prefix to filter results
 
@@ -368,50 +515,146 @@ class GoogleCloudStorage(CloudStorageInterface):
             List[FolderDataSchema]: List of folder schemas representing
                                     the matching folders
         """
+        key = self._normalize_file_path(prefix)
+        cached = self._folders_cache.get(key)
+        if cached is not None:
+            cached_at, folders = cached
+            age = time.monotonic() - cached_at
+            if age < self._FOLDERS_CACHE_MAX_STALE:
+                if age >= self._FOLDERS_CACHE_TTL:
+                    self._schedule_folders_refresh(key)
+                return list(folders)
+
+        return list(await self._refresh_folders(key))
+
+    async def _fetch_folders(
+        self, prefix: Optional[str] = None
+    ) -> List[FolderDataSchema]:
+        """List managed folders directly from the Storage Control API."""
         list_folders_request = ListFoldersRequest(
-            parent=self._get_bucket_path(),
+            parent=self._bucket_path,
             prefix=self._normalize_file_path(prefix) if prefix else "",
+            page_size=self._LIST_PAGE_SIZE,
         )
-        folders_raw = self.storage_control.list_folders(
-            request=list_folders_request
+        folders_raw = await self._run_blocking(
+            lambda: list(
+                self.storage_control.list_folders(request=list_folders_request)
+            )
         )
 
-        folders: List[FolderDataSchema] = []
-
-        folders.extend(
+        get_folder_name = self._get_folder_name
+        get_common_folder_path = self._get_common_folder_path
+        return [
             FolderDataSchema(
-                folder_name=self._get_folder_name(folder.name),
-                folder_path=self._get_common_folder_path(folder.name),
+                folder_name=get_folder_name(folder.name),
+                folder_path=get_common_folder_path(folder.name),
                 create_time=folder.create_time.replace(microsecond=0),
                 update_time=folder.update_time.replace(microsecond=0),
             )
             for folder in folders_raw
-        )
+        ]
+
+    async def _refresh_folders(self, key: str) -> List[FolderDataSchema]:
+        generation = self._folders_cache_generation
+        folders = await self._fetch_folders(key)
+
+        # A write during the fetch makes the result unreliable.
+        if generation == self._folders_cache_generation:
+            self._folders_cache.pop(key, None)
+            if len(self._folders_cache) >= self._FOLDERS_CACHE_MAXSIZE:
+                self._folders_cache.pop(next(iter(self._folders_cache)))
+            self._folders_cache[key] = (time.monotonic(), folders)
+
         return folders
 
-    def _get_bucket_path(self) -> str:
+    def _schedule_folders_refresh(self, key: str) -> None:
+        if key in self._folders_refresh_tasks:
+            return
+
+        task = asyncio.create_task(self._refresh_folders(key))
+        self._folders_refresh_tasks[key] = task
+        task.add_done_callback(
+            lambda done: self._on_folders_refreshed(key, done)
+        )
+
+    def _on_folders_refreshed(self, key: str, task: asyncio.Task) -> None:
+        self._folders_refresh_tasks.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                f"Background refresh of folders under '{key}' failed: "
+                f"{task.exception()}"
+            )
+
+    def _invalidate_folders_cache(self) -> None:
+        self._folders_cache_generation += 1
+        self._folders_cache.clear()
+
+    async def aclose(self) -> None:
+        """
+        Release the worker threads used for blocking SDK calls.
+
+        Already submitted calls are allowed to finish; the instance must not
+        be used afterwards.
+        """
+        self._executor.shutdown(wait=False)
+
+    async def _run_blocking(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Run a blocking google-cloud-storage call in the SDK thread pool.
+
+        The SDK performs network I/O synchronously, so calling it directly
+        from a coroutine would stall the event loop for the whole round-trip.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    @functools.cached_property
+    def _bucket_path(self) -> str:
         """
         Get the full path to the bucket in Google Cloud Storage.
 
-        This method constructs the full path to the bucket using
+        This property constructs the full path to the bucket using
         the project path and bucket name. The path is used for operations that
-        require the full bucket path, such as folder creation.
+        require the full bucket path, such as folder creation. It is computed
+        once per instance.
 
         Returns:
             str: The full path to the bucket in the format
                  "projects/{project_id}/buckets/{bucket_name}"
         """
-        project_path = self.storage_control.common_project_path("_")
+        project_path = _format_project_path("_")
 
         return f"{project_path}/buckets/{self.bucket_name}"
 
+    def _file_from_blob(self, blob: Blob) -> FileSchema:
+        return FileSchema(
+            filename=self._get_blob_name(blob.name),
+            path=self._get_blob_path(blob.name),
+            url=self._get_public_url(blob.name),
+            size=blob.size,
+            content_type=blob.content_type,
+        )
+
+    def _get_public_url(self, blob_name: str) -> str:
+        """
+        Build the public URL of a blob without touching the Blob object.
+
+        Matches Blob.public_url, which only depends on the bucket and the
+        blob name, so listings can request partial responses.
+        """
+        return f"{self.base_url}/{quote(blob_name, safe='/~')}"
+
     @staticmethod
     def _get_blob_path(blob_name: str) -> str:
         return f"/{blob_name}"
 
     @staticmethod
     def _get_blob_name(blob_path: str) -> str:
-        return blob_path.split("/")[-1]
+        return blob_path.rpartition("/")[2]
 
     @staticmethod
     def _get_folder_name(folder_path: str) -> str:
@@ -427,8 +670,9 @@ class GoogleCloudStorage(CloudStorageInterface):
         Get the full path to a folder in Google Cloud Storage.
 
         This method constructs the full path to a folder using the storage
-        control client's folder_path method. The path is used for operations
+        control client's folder_path template. The path is used for operations
         that require the full folder path, such as folder deletion or renaming.
+        Results are memoized per (bucket, folder).
 
         Args:
             folder_path: Folder path (format: "folders/{folder_id}/")
@@ -437,9 +681,8 @@ class GoogleCloudStorage(CloudStorageInterface):
             str: The full path to the folder in the format required by the
                  Storage Control API
         """
-        folder_path = folder_path.removeprefix("/")
-        return self.storage_control.folder_path(
-            project="_", bucket=self.bucket_name, folder=folder_path
+        return _folder_resource_name(
+            self.bucket_name, folder_path.removeprefix("/")
         )
 
     def _get_common_folder_path(self, folder_name: str) -> str:
@@ -450,7 +693,7 @@ class GoogleCloudStorage(CloudStorageInterface):
         format by extracting the relevant part from the common_folder_path
         and ensuring it ends with a trailing slash. This standardized format
         is used for consistent folder path representation across
-        the application.
+        the application. Results are memoized per folder name.
 
         Args:
             folder_name: Name of the folder to get the standardized path for
@@ -458,53 +701,120 @@ class GoogleCloudStorage(CloudStorageInterface):
         Returns:
             str: The standardized folder path with a trailing slash
         """
-        folder_path = self.storage_control.common_folder_path(
-            folder_name
-        ).split("folders/")[-1]
-
-        return folder_path if folder_path.endswith("/") else f"{folder_path}/"
+        return _common_folder_path(folder_name)
 
     @staticmethod
     def _normalize_file_path(file_path: Optional[str] = None) -> str:
-        if file_path:
-            return file_path[1:] if file_path.startswith("/") else file_path
-
-        return ""
+        return file_path.removeprefix("/") if file_path else ""
 
     async def _delete_subfolders(self, folder_path: str) -> bool:
-        subfolders: List[FolderDataSchema] = await self.list_folders(
+        """
+        Delete all managed subfolders of the given folder.
+
+        A managed folder can only be deleted once it has no children, so
+        subfolder paths are sorted by depth, deepest first, and deleted one
+        level at a time. Folders of the same depth are independent and are
+        deleted concurrently.
+        """
+        subfolders: List[FolderDataSchema] = await self._fetch_folders(
             prefix=folder_path
         )
-        if subfolders:
-            subfolders.reverse()
-            for subfolder in subfolders:
-                await self._delete_folder(subfolder.folder_path)
+        paths = sorted(
+            (subfolder.folder_path for subfolder in subfolders),
+            key=_folder_depth,
+            reverse=True,
+        )
+
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_FOLDER_DELETES)
+
+        async def delete_with_limit(path: str) -> bool:
+            async with semaphore:
+                return await self._delete_folder(path)
+
+        for _, level in groupby(paths, key=_folder_depth):
+            await asyncio.gather(*(delete_with_limit(path) for path in level))
 
         return True
 
     async def _delete_all_files_in_folder(self, folder_path: str) -> bool:
-        files: List[FileSchema] = await self.list_blobs(prefix=folder_path)
-        delete_tasks = [self.delete_blob(file.path) for file in files]
+        """
+        Delete every file under the folder using batched requests.
 
-        await asyncio.gather(*delete_tasks)
+        Blob names are streamed one listing page at a time, so memory use
+        is bounded by the page size rather than the folder size. Each page
+        is split into JSON API batch requests of up to _DELETE_BATCH_SIZE
+        operations, which are sent concurrently.
+        """
+        prefix = self._normalize_file_path(folder_path)
+        pages = await self._run_blocking(
+            lambda: self.bucket.list_blobs(
+                prefix=prefix,
+                fields=self._LIST_BLOB_NAMES_FIELDS,
+                page_size=self._LIST_PAGE_SIZE,
+            ).pages
+        )
+        batch_size = self._DELETE_BATCH_SIZE
+
+        while True:
+            blob_names = await self._run_blocking(
+                self._next_page_blob_names, pages
+            )
+            if blob_names is None:
+                break
+
+            await asyncio.gather(
+                *(
+                    self._run_blocking(
+                        self._delete_blob_batch,
+                        blob_names[start : start + batch_size],
+                    )
+                    for start in range(0, len(blob_names), batch_size)
+                )
+            )
 
         return True
 
+    def _next_page_files(
+        self, pages: Iterator[Page]
+    ) -> Optional[List[FileSchema]]:
+        page = next(pages, None)
+        if page is None:
+            return None
+        file_from_blob = self._file_from_blob
+        return [
+            file_from_blob(blob)
+            for blob in page
+            if not blob.name.endswith("/")
+        ]
+
+    @staticmethod
+    def _next_page_blob_names(pages: Iterator[Page]) -> Optional[List[str]]:
+        page = next(pages, None)
+        if page is None:
+            return None
+        return [blob.name for blob in page if not blob.name.endswith("/")]
+
+    def _delete_blob_batch(self, blob_names: List[str]) -> None:
+        bucket = self.bucket
+        with self.client.batch():
+            bucket.delete_blobs([bucket.blob(name) for name in blob_names])
+
     async def _delete_folder(
         self,
         folder_path: str,
         delete_request: Type[DeleteFolderRequest] = DeleteFolderRequest,
     ) -> bool:
-        self.storage_control.delete_folder(
+        await self._run_blocking(
+            self.storage_control.delete_folder,
             request=delete_request(
                 name=self._get_folder_path(folder_path),
-            )
+            ),
         )
         return True
 
     def _search_blobs(
         self,
-        blobs: List[Blob],
+        blobs: Iterable[Blob],
         search_query: str,
         case_sensitive: Optional[bool] = False,
     ) -> List[FileSchema]:
@@ -516,8 +826,10 @@ class GoogleCloudStorage(CloudStorageInterface):
         or case-insensitive based on the provided parameter.
 
         Args:
-            blobs: List of Blob objects to search through
-            search_query: The string to search for in blob names
+            blobs: Blob objects to search through
+            search_query: The string to search for in blob names, already
+                          lowercased by the caller when the search is
+                          case-insensitive
             case_sensitive: Whether the search should be case-sensitive
                             (default: False)
 
@@ -525,27 +837,33 @@ class GoogleCloudStorage(CloudStorageInterface):
             List[FileSchema]: A list of FileSchema objects representing
                               the blobs whose names contain the search query
         """
-        if not case_sensitive:
-            search_query = search_query.lower()
-
-        matching_files: List[FileSchema] = []
-        for blob in blobs:
-            if blob.content_type != "Folder":
-                original_name = blob.name.split("/")[-1]
-
-                if (
-                    case_sensitive
-                    and search_query in original_name
-                    or not case_sensitive
-                    and search_query in original_name.lower()
-                ):
-                    matching_files.append(
-                        FileSchema(
-                            filename=original_name,
-                            path=self._get_blob_path(blob.name),
-                            url=blob.public_url,
-                            content_type=blob.content_type,
-                            size=blob.size,
-                        )
-                    )
-        return matching_files
+        named_blobs = (
+            (blob, blob.name.rpartition("/")[2])
+            for blob in blobs
+            if blob.content_type != "Folder"
+        )
+        if case_sensitive:
+            matching = [
+                (blob, name)
+                for blob, name in named_blobs
+                if search_query in name
+            ]
+        else:
+            matching = [
+                (blob, name)
+                for blob, name in named_blobs
+                if search_query in name.lower()
+            ]
+
+        get_blob_path = self._get_blob_path
+        get_public_url = self._get_public_url
+        return [
+            FileSchema(
+                filename=name,
+                path=get_blob_path(blob.name),
+                url=get_public_url(blob.name),
+                content_type=blob.content_type,
+                size=blob.size,
+            )
+            for blob, name in matching
+        ]
@@ -1,7 +1,7 @@
 import datetime
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from typing import AsyncIterator, List, Optional, Union
 
 from fastapi import UploadFile, status, HTTPException, Request
 
@@ -289,6 +289,28 @@ class BaseStorageInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_files(
+        self,
+        prefix: Optional[str] = "",
+        request: Optional[Request] = None,
+    ) -> AsyncIterator[FileSchema]:
+        """
+        Iterate over files in storage as they are discovered.
+
+        Unlike list_files, the results are not sorted and are not collected
+        into memory, so they can be streamed to the client.
+
+        Args:
+            prefix (str, optional): Optional prefix to filter files.
+                                    Defaults to "".
+            request (Request, optional): Request used to build file URLs
+
+        Returns:
+            AsyncIterator[FileSchema]: File schemas in discovery order
+        """
+        pass
+
     @abstractmethod
     async def list_folders(
         self, prefix: Optional[str] = None
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from typing import AsyncIterator, List, Optional, Union
 
 from google.cloud import storage  # type: ignore
 from google.cloud.storage import Blob, Bucket  # type: ignore
@@ -165,6 +165,22 @@ class CloudStorageInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_blobs(
+        self, prefix: Optional[str] = ""
+    ) -> AsyncIterator[FileSchema]:
+        """
+        Iterate over blobs in storage one listing page at a time.
+
+        Args:
+            prefix: Optional prefix to filter results (default: empty string)
+
+        Returns:
+            AsyncIterator[FileSchema]: File schemas yielded as each page
+                                       of the listing arrives
+        """
+        pass
+
     @abstractmethod
     async def create_folder(self, folder_name: str) -> FolderBaseSchema:
         """
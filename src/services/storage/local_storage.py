@@ -2,9 +2,24 @@ import asyncio
 import datetime
 import logging
 import os
-import urllib
+import shutil
+import sys
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from stat import S_ISREG
+from tempfile import SpooledTemporaryFile
+from typing import (
+    AsyncIterator,
+    BinaryIO,
+    Generator,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from fastapi import UploadFile, Request, status, HTTPException
 
@@ -24,6 +39,58 @@ from src.services.storage.shemas import (
 
 logger = logging.getLogger(__name__)
 
+_SEP = os.sep
+
+# sendfile(2) accepts a regular file as the destination only on Linux.
+_CAN_SENDFILE_TO_FILE = sys.platform.startswith("linux")
+
+# Same output as urllib.parse.quote(path, safe="/"), using a precomputed
+# byte-to-text table instead of quote's per-call Quoter machinery.
+_URL_SAFE_BYTES = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~/"
+)
+_QUOTE_TABLE = tuple(
+    chr(byte) if byte in _URL_SAFE_BYTES else f"%{byte:02X}"
+    for byte in range(256)
+)
+
+
+def _quote_path(path: str) -> str:
+    encoded = path.encode()
+    if not encoded.rstrip(_URL_SAFE_BYTES):
+        return path
+    return "".join([_QUOTE_TABLE[byte] for byte in encoded])
+
+
+def _raise_path_not_found(
+    path: Path,
+    entity: str,
+    error_code: int = status.HTTP_404_NOT_FOUND,
+) -> NoReturn:
+    logger.warning(f"{entity} {path} not found")
+    raise HTTPException(
+        status_code=error_code,
+        detail={
+            "error": f"{entity} not found",
+            "message": f"{path} not found",
+        },
+    )
+
+
+def _raise_path_already_exists(
+    path: Path,
+    entity: str,
+    error_code: int = status.HTTP_409_CONFLICT,
+) -> NoReturn:
+    logger.warning(f"{entity} {path} already exists")
+    raise HTTPException(
+        status_code=error_code,
+        detail={
+            "error": f"{entity} already exists",
+            "message": f"{path} already exists",
+        },
+    )
+
 
 def _validate_path_exists(
     path: Path,
@@ -32,14 +99,7 @@ def _validate_path_exists(
 ) -> None:
     """Validate that path exists"""
     if not path.exists():
-        logger.warning(f"{entity} {path} not found")
-        raise HTTPException(
-            status_code=error_code,
-            detail={
-                "error": f"{entity} not found",
-                "message": f"{path} not found",
-            },
-        )
+        _raise_path_not_found(path, entity, error_code)
 
 
 def _validate_path_not_exists(
@@ -49,21 +109,39 @@ def _validate_path_not_exists(
 ) -> None:
     """Validate that path does not exist"""
     if path.exists():
-        logger.warning(f"{entity} {path} already exists")
-        raise HTTPException(
-            status_code=error_code,
-            detail={
-                "error": f"{entity} already exists",
-                "message": f"{path} already exists",
-            },
-        )
+        _raise_path_already_exists(path, entity, error_code)
+
+
+def _scan_tree(root: str) -> Generator[os.DirEntry, None, None]:
+    """
+    Recursively yield directory entries under root, parents first.
+
+    DirEntry caches the file type from the directory listing, so callers
+    can check is_file()/is_dir() without an extra stat() per entry.
+    """
+    try:
+        entries = os.scandir(root)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+    with entries:
+        for entry in entries:
+            yield entry
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_tree(entry.path)
 
 
 class LocalStorage(BaseStorageInterface):
-    __slots__ = ("_path_to_storage",)
+    __slots__ = ("_path_to_storage", "_root", "_ensured_dirs")
+
+    _UPLOAD_CHUNK_SIZE = 1 << 20
+    _MAX_CONCURRENT_UPLOADS = 16
+    _ITER_BATCH_SIZE = 1000
 
     def __init__(self, path_to_upload_dir: str) -> None:
         self._path_to_storage = path_to_upload_dir
+        self._root = Path(path_to_upload_dir)
+        self._ensured_dirs: Set[str] = set()
 
     @handle_upload_file_exceptions
     async def upload(
@@ -73,24 +151,13 @@ class LocalStorage(BaseStorageInterface):
         *args,
         **kwargs,
     ) -> FileSchema:
-        file_object = await file.read()
-
-        file_path = os.path.join(
-            self._create_directory(request), file.filename or "file"
-        )
-
-        with open(file_path, "wb") as fh:
-            fh.write(file_object)
-        await file.close()
-
-        return FileSchema(
-            filename=file.filename or "Unknown",
-            path=file_path,
-            url=self._create_url_path(file_path, request),
-            content_type=file.content_type,
-            size=file.size,
+        return await self._upload_to(
+            self._create_directory(request),
+            file,
+            self._get_base_url(request),
         )
 
+    @handle_upload_file_exceptions
     async def multi_upload(
         self,
         files: List[UploadFile],
@@ -98,8 +165,21 @@ class LocalStorage(BaseStorageInterface):
         *args,
         **kwargs,
     ) -> List[FileSchema]:
+        if request is None:
+            raise ValueError("Request is required to resolve the user folder")
+
+        # Every file in the batch goes to the same user directory, so it is
+        # resolved once rather than per upload.
+        user_dir = self._create_directory(request)
+        base_url = self._get_base_url(request)
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_UPLOADS)
+
+        async def upload_with_limit(file: UploadFile) -> FileSchema:
+            async with semaphore:
+                return await self._upload_to(user_dir, file, base_url)
+
         uploaded = await asyncio.gather(
-            *[self.upload(file=file, request=request) for file in files]
+            *[upload_with_limit(file) for file in files]
         )
         return list(uploaded)
 
@@ -107,14 +187,9 @@ class LocalStorage(BaseStorageInterface):
     async def delete_file(
         self, file_path: str, request: Request, *args, **kwargs
     ) -> FileDeleteSchema:
-        if Path(file_path).exists():
-            os.remove(Path(file_path))
-            logger.info(f"{file_path} deleted successfully")
-
-            return FileDeleteSchema(
-                file=file_path,
-            )
-        else:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
             logger.warning(
                 f"{file_path} not found in {self._path_to_storage} "
                 f"for deletion"
@@ -127,6 +202,12 @@ class LocalStorage(BaseStorageInterface):
                 },
             )
 
+        logger.info("%s deleted successfully", file_path)
+
+        return FileDeleteSchema(
+            file=file_path,
+        )
+
     @handle_delete_file_exceptions
     async def delete_folder(
         self, folder_path: str, request: Request, *args, **kwargs
@@ -135,16 +216,10 @@ class LocalStorage(BaseStorageInterface):
         folder = Path(folder_path)
         _validate_path_exists(folder, "Folder")
 
-        deleted_files = 0
-        for root, dirs, files in os.walk(folder, topdown=False):
-            for name in files:
-                os.remove(os.path.join(root, name))
-                deleted_files += 1
-            for name in dirs:
-                os.rmdir(os.path.join(root, name))
-        os.rmdir(folder)
+        await asyncio.to_thread(shutil.rmtree, folder)
+        self._ensured_dirs.clear()
 
-        logger.info(f"{folder_path} deleted successfully")
+        logger.info("%s deleted successfully", folder_path)
         return FolderDeleteSchema(
             folder_name=folder_path,
         )
@@ -155,10 +230,11 @@ class LocalStorage(BaseStorageInterface):
     ) -> FolderDataSchema:
         """Create a new folder in storage"""
         folder = Path(folder_path)
-        _validate_path_not_exists(folder, "Folder")
-
-        folder.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Folder {folder_path} created successfully")
+        try:
+            folder.mkdir(parents=True)
+        except FileExistsError:
+            _raise_path_already_exists(folder, "Folder")
+        logger.info("Folder %s created successfully", folder_path)
 
         return FolderDataSchema(
             folder_path=str(folder),
@@ -175,11 +251,18 @@ class LocalStorage(BaseStorageInterface):
         old_folder = Path(old_path)
         new_folder = Path(new_path)
 
-        _validate_path_exists(old_folder, "Source folder")
+        # rename() silently replaces an empty directory on POSIX, so the
+        # target still needs an explicit check.
         _validate_path_not_exists(new_folder, "Target folder")
 
-        old_folder.rename(new_folder)
-        logger.info(f"Folder renamed from {old_path} to {new_path}")
+        try:
+            old_folder.rename(new_folder)
+        except FileNotFoundError:
+            if old_folder.exists():
+                raise
+            _raise_path_not_found(old_folder, "Source folder")
+        self._ensured_dirs.clear()
+        logger.info("Folder renamed from %s to %s", old_path, new_path)
 
         return FolderRenameSchema(
             folder_name=new_folder.name,
@@ -197,18 +280,17 @@ class LocalStorage(BaseStorageInterface):
         **kwargs,
     ) -> FileSchema:
         """Rename existing file"""
-        old_file = Path(old_path)
-        new_file = Path(new_file_name)
-
-        if old_file.exists():
-            if not new_file.exists():
-                old_file.rename(new_file)
-                logger.info(f"File renamed from {old_path} to {new_file_name}")
+        if os.path.exists(old_path):
+            if not os.path.exists(new_file_name):
+                os.rename(old_path, new_file_name)
+                logger.info(
+                    "File renamed from %s to %s", old_path, new_file_name
+                )
 
                 return FileSchema(
-                    filename=new_file.name,
-                    path=str(new_file),
-                    url=self._create_url_path(str(new_file), request),
+                    filename=os.path.basename(new_file_name),
+                    path=new_file_name,
+                    url=self._create_url_path(new_file_name, request),
                     content_type=None,
                     size=None,
                 )
@@ -240,16 +322,17 @@ class LocalStorage(BaseStorageInterface):
         request: Request,
     ) -> FileSchema:
         """Get file by path"""
-        file = Path(file_path)
-        if not file.exists():
+        try:
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:
             raise ErrorSavingFile(f"File {file_path} not found")
 
         return FileSchema(
-            filename=file.name,
-            path=str(file),
-            url=self._create_url_path(str(file), request),
+            filename=os.path.basename(file_path),
+            path=file_path,
+            url=self._create_url_path(file_path, request),
             content_type=None,
-            size=file.stat().st_size,
+            size=file_stat.st_size,
         )
 
     @handle_upload_file_exceptions
@@ -259,45 +342,70 @@ class LocalStorage(BaseStorageInterface):
         prefix: Optional[str] = None,
     ) -> List[FileSchema]:
         """List all files in storage"""
-        storage_path = Path(self._path_to_storage)
+        storage_path = self._root
         if prefix:
             storage_path = storage_path / prefix
 
-        files = []
-        for file_path in storage_path.rglob("*"):
-            if file_path.is_file():
-                file_data = FileSchema(
-                    filename=file_path.name,
-                    path=str(file_path),
-                    url=self._create_url_path(str(file_path), request),
-                    content_type=None,
-                    size=file_path.stat().st_size,
-                )
-                files.append(file_data)
+        return await asyncio.to_thread(
+            self._list_files_sync,
+            str(storage_path),
+            self._get_base_url(request),
+        )
 
-        return sorted(files, key=lambda x: x.filename or "")
+    async def iter_files(
+        self,
+        prefix: Optional[str] = "",
+        request: Optional[Request] = None,
+    ) -> AsyncIterator[FileSchema]:
+        """Yield files under the prefix in walk order, batch by batch"""
+        storage_path = self._root
+        if prefix:
+            storage_path = storage_path / prefix
+
+        base_url = self._get_base_url(request) if request else ""
+        entries = _scan_tree(str(storage_path))
+
+        def close_entries(task: asyncio.Future) -> None:
+            if not task.cancelled():
+                task.exception()
+            entries.close()
+
+        pending: Optional[asyncio.Future] = None
+        try:
+            while True:
+                pending = asyncio.ensure_future(
+                    asyncio.to_thread(
+                        self._next_files_batch, entries, base_url
+                    )
+                )
+                # Shielded: the worker thread keeps running on
+                # cancellation, so the task must outlive this await.
+                batch = await asyncio.shield(pending)
+                if not batch:
+                    break
+                for file in batch:
+                    yield file
+        finally:
+            # Closing the generator while a worker thread is still inside
+            # it raises "generator already executing", so wait for the
+            # batch in flight to return first.
+            if pending is not None and not pending.done():
+                pending.add_done_callback(close_entries)
+            else:
+                entries.close()
 
     @handle_upload_file_exceptions
     async def list_folders(
         self, prefix: Optional[str] = None
     ) -> List[FolderDataSchema]:
         """List all folders in storage"""
-        storage_path = Path(self._path_to_storage)
+        storage_path = self._root
         if prefix:
             storage_path = storage_path / prefix
 
-        folders = []
-        for folder_path in storage_path.rglob("*"):
-            if folder_path.is_dir():
-                folder_data = FolderDataSchema(
-                    folder_path=str(folder_path),
-                    folder_name=folder_path.name,
-                    create_time=None,
-                    update_time=None,
-                )
-                folders.append(folder_data)
-
-        return folders
+        return await asyncio.to_thread(
+            self._list_folders_sync, str(storage_path)
+        )
 
     @handle_upload_file_exceptions
     async def get_folder(self, folder_path: str) -> FolderDataSchema:
@@ -313,30 +421,97 @@ class LocalStorage(BaseStorageInterface):
     @handle_upload_file_exceptions
     async def get_folder_contents(self, folder_path: str) -> dict:
         """Get contents of a specific folder"""
+        return await asyncio.to_thread(
+            self._get_folder_contents_sync, folder_path
+        )
+
+    @handle_upload_file_exceptions
+    async def search_files_by_name(
+        self,
+        search_query: str,
+        request: Request,
+        case_sensitive: bool = False,
+    ) -> List[FileSchema]:
+        """Search files by name with optional case sensitivity"""
+        search_query = search_query if case_sensitive else search_query.lower()
+
+        return await asyncio.to_thread(
+            self._search_files_sync,
+            self._path_to_storage,
+            search_query,
+            case_sensitive,
+            self._get_base_url(request),
+        )
+
+    @classmethod
+    def _list_files_sync(cls, root: str, base_url: str) -> List[FileSchema]:
+        try:
+            root_stat = os.stat(root)
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+        # A prefix naming a single file is answered without a walk.
+        if S_ISREG(root_stat.st_mode):
+            return cls._build_file_schemas(
+                [(os.path.basename(root), root, root_stat.st_size)], base_url
+            )
+
+        found = [
+            (entry.name, entry.path, entry.stat().st_size)
+            for entry in _scan_tree(root)
+            if entry.is_file()
+        ]
+        return cls._build_file_schemas(found, base_url)
+
+    @staticmethod
+    def _list_folders_sync(root: str) -> List[FolderDataSchema]:
+        folders = []
+        for entry in _scan_tree(root):
+            if entry.is_dir():
+                folder_data = FolderDataSchema(
+                    folder_path=entry.path,
+                    folder_name=entry.name,
+                    create_time=None,
+                    update_time=None,
+                )
+                folders.append(folder_data)
+
+        return folders
+
+    @staticmethod
+    def _get_folder_contents_sync(folder_path: str) -> dict:
         folder = Path(folder_path)
-        if not folder.exists() or not folder.is_dir():
+        try:
+            entries = os.scandir(folder)
+        except (FileNotFoundError, NotADirectoryError):
             raise ErrorSavingFile(f"Folder {folder_path} not found")
 
         files = []
         folders = []
 
-        for item in folder.iterdir():
-            if item.is_file():
-                files.append(
-                    {
-                        "name": item.name,
-                        "path": str(item),
-                        "size": item.stat().st_size,
-                        "updated": datetime.datetime.fromtimestamp(
-                            item.stat().st_mtime
-                        ).isoformat(),
-                        "type": "file",
-                    }
-                )
-            else:
-                folders.append(
-                    {"name": item.name, "path": str(item), "type": "folder"}
-                )
+        with entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    files.append(
+                        {
+                            "name": entry.name,
+                            "path": entry.path,
+                            "size": stat.st_size,
+                            "updated": datetime.datetime.fromtimestamp(
+                                stat.st_mtime
+                            ).isoformat(),
+                            "type": "file",
+                        }
+                    )
+                else:
+                    folders.append(
+                        {
+                            "name": entry.name,
+                            "path": entry.path,
+                            "type": "folder",
+                        }
+                    )
 
         return {
             "current_path": str(folder),
@@ -345,36 +520,62 @@ class LocalStorage(BaseStorageInterface):
             ),
         }
 
-    @handle_upload_file_exceptions
-    async def search_files_by_name(
-        self,
+    @classmethod
+    def _search_files_sync(
+        cls,
+        root: str,
         search_query: str,
-        request: Request,
-        case_sensitive: bool = False,
+        case_sensitive: bool,
+        base_url: str,
     ) -> List[FileSchema]:
-        """Search files by name with optional case sensitivity"""
-        storage_path = Path(self._path_to_storage)
-        files = []
+        files = (entry for entry in _scan_tree(root) if entry.is_file())
+        if case_sensitive:
+            matching = (entry for entry in files if search_query in entry.name)
+        else:
+            matching = (
+                entry for entry in files if search_query in entry.name.lower()
+            )
 
-        search_query = search_query if case_sensitive else search_query.lower()
+        found = [
+            (entry.name, entry.path, entry.stat().st_size)
+            for entry in matching
+        ]
+        return cls._build_file_schemas(found, base_url)
 
-        for file_path in storage_path.rglob("*"):
-            if file_path.is_file():
-                filename = file_path.name
-                if not case_sensitive:
-                    filename = filename.lower()
-
-                if search_query in filename:
-                    file_data = FileSchema(
-                        filename=file_path.name,
-                        path=str(file_path),
-                        url=self._create_url_path(str(file_path), request),
-                        content_type=None,
-                        size=file_path.stat().st_size,
-                    )
-                    files.append(file_data)
+    @classmethod
+    def _next_files_batch(
+        cls, entries: Iterator[os.DirEntry], base_url: str
+    ) -> List[FileSchema]:
+        files = (entry for entry in entries if entry.is_file())
+        found = [
+            (entry.name, entry.path, entry.stat().st_size)
+            for entry in islice(files, cls._ITER_BATCH_SIZE)
+        ]
+        return cls._to_file_schemas(found, base_url)
+
+    @classmethod
+    def _build_file_schemas(
+        cls, found: List[Tuple[str, str, int]], base_url: str
+    ) -> List[FileSchema]:
+        """Sort (name, path, size) tuples by name and build the schemas"""
+        found.sort(key=itemgetter(0))
+        return cls._to_file_schemas(found, base_url)
 
-        return sorted(files, key=lambda x: x.filename or "")
+    @classmethod
+    def _to_file_schemas(
+        cls, found: List[Tuple[str, str, int]], base_url: str
+    ) -> List[FileSchema]:
+        build_url = cls._build_url
+        return [
+            FileSchema(
+                filename=name,
+                path=path,
+                url=build_url(base_url, path),
+                content_type=None,
+                size=size,
+            )
+            for name, path, size in found
+        ]
 
     @staticmethod
     def _get_user_identifier(request: Request) -> str:
@@ -385,18 +586,83 @@ class LocalStorage(BaseStorageInterface):
             str(user_identifier) if user_identifier is not None else "Unknown"
         )
 
-    def _create_directory(self, request: Request) -> Path:
-        storage_path = Path(self._path_to_storage) / self._get_user_identifier(
-            request
+    async def _upload_to(
+        self, directory: Path, file: UploadFile, base_url: str
+    ) -> FileSchema:
+        file_path = os.path.join(directory, file.filename or "file")
+
+        try:
+            await asyncio.to_thread(self._write_file, file.file, file_path)
+        finally:
+            await file.close()
+
+        return FileSchema(
+            filename=file.filename or "Unknown",
+            path=file_path,
+            url=self._build_url(base_url, file_path),
+            content_type=file.content_type,
+            size=file.size,
         )
 
-        storage_path.mkdir(parents=True, exist_ok=True)
+    @classmethod
+    def _write_file(cls, source: BinaryIO, file_path: str) -> None:
+        """
+        Copy a spooled upload to disk in fixed-size chunks.
+
+        The request body has already been received into the spooled file
+        by the multipart parser, so there is no network read left to
+        overlap with the disk write and a sequential copy is used. Uploads
+        that were spilled to a temporary file are copied in the kernel with
+        sendfile where the platform supports it.
+        """
+        source_fd = cls._get_disk_fileno(source)
+        with open(file_path, "wb") as fh:
+            if source_fd is None:
+                shutil.copyfileobj(source, fh, cls._UPLOAD_CHUNK_SIZE)
+                return
+
+            offset = source.tell()
+            while sent := os.sendfile(
+                fh.fileno(), source_fd, offset, cls._UPLOAD_CHUNK_SIZE
+            ):
+                offset += sent
+
+    @staticmethod
+    def _get_disk_fileno(source: BinaryIO) -> Optional[int]:
+        if not _CAN_SENDFILE_TO_FILE:
+            return None
+        # fileno() on a spool still held in memory would force it to disk.
+        if isinstance(source, SpooledTemporaryFile) and not getattr(
+            source, "_rolled", True
+        ):
+            return None
+        try:
+            return source.fileno()
+        except (AttributeError, OSError):
+            return None
+
+    def _create_directory(self, request: Request) -> Path:
+        storage_path = self._root / self._get_user_identifier(request)
+
+        # Directories removed through this instance are forgotten in
+        # delete_folder/rename_folder, so the cache only skips the mkdir.
+        key = str(storage_path)
+        if key not in self._ensured_dirs:
+            storage_path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(key)
 
         return storage_path
 
+    @classmethod
+    def _create_url_path(cls, file_path: str, request: Request) -> str:
+        return cls._build_url(cls._get_base_url(request), file_path)
+
     @staticmethod
-    def _create_url_path(file_path: str, request: Request) -> str:
-        base_url = str(request.base_url).rstrip("/")
-        url_path = urllib.parse.quote(file_path.replace(os.sep, "/"))
+    def _get_base_url(request: Request) -> str:
+        return str(request.base_url).rstrip("/")
 
-        return f"{base_url}/{url_path}"
+    @staticmethod
+    def _build_url(base_url: str, file_path: str) -> str:
+        if _SEP != "/":
+            file_path = file_path.replace(_SEP, "/")
+        return f"{base_url}/{_quote_path(file_path)}"
@@ -14,11 +14,15 @@ class FileSchema(BaseModel):
 
 
 class FileDeleteSchema(BaseModel):
-    file: Path | str
+    file: str
     date_deleted: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc)
     )
 
+    @classmethod
+    def from_path(cls, path: Path) -> "FileDeleteSchema":
+        return cls(file=str(path))
+
 
 class FolderBaseSchema(BaseModel):
     folder_name: str
@@ -0,0 +1,38 @@
+import json
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.responses import PydanticJSONResponse
+from src.knowledge_storage.schemas import PaginatedResponse
+
+
+class TestPydanticJSONResponse:
+    def test_matches_stdlib_json_rendering(self):
+        content = {"name": "Шлюб", "sizes": [1, 2.5], "empty": None}
+
+        rendered = PydanticJSONResponse(content).body
+
+        assert rendered == json.dumps(
+            content, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    def test_renders_non_finite_floats_as_null(self):
+        content = {"score": float("nan"), "limit": float("inf")}
+
+        rendered = PydanticJSONResponse(content).body
+
+        assert rendered == b'{"score":null,"limit":null}'
+
+    def test_renders_response_model(self):
+        app = FastAPI(default_response_class=PydanticJSONResponse)
+
+        @app.get("/items", response_model=PaginatedResponse[datetime])
+        async def list_items():
+            return PaginatedResponse(items=[datetime(2025, 1, 2, 3, 4, 5)])
+
+        response = TestClient(app).get("/items")
+
+        assert response.status_code == 200
+        assert response.json()["items"] == ["2025-01-02T03:04:05"]
@@ -0,0 +1,48 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import ValidationError
+
+from src.knowledge_storage.interfaces import BaseEntityInterface
+from src.knowledge_storage.schemas import BulkOptions
+
+
+@pytest.fixture
+def entity_storage():
+    return AsyncMock(spec=BaseEntityInterface)
+
+
+class TestBaseEntityInterfaceBulkDefaults:
+    @pytest.mark.asyncio
+    async def test_create_delegates_to_create_many(self, entity_storage):
+        entity_storage.create_many.return_value = ["created"]
+
+        result = await BaseEntityInterface.create(
+            entity_storage, "main", ("family", "Family law")
+        )
+
+        assert result == "created"
+        entity_storage.create_many.assert_awaited_once_with(
+            "main", [("family", "Family law")]
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_delegates_to_delete_many(self, entity_storage):
+        entity_storage.delete_many.return_value = ["deleted"]
+
+        result = await BaseEntityInterface.delete(entity_storage, "main")
+
+        assert result == "deleted"
+        entity_storage.delete_many.assert_awaited_once_with(["main"])
+
+
+class TestBulkOptions:
+    def test_defaults(self):
+        options = BulkOptions()
+
+        assert options.batch_size == 1000
+        assert options.continue_on_error is False
+
+    def test_batch_size_must_be_positive(self):
+        with pytest.raises(ValidationError):
+            BulkOptions(batch_size=0)
@@ -0,0 +1,144 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.knowledge_storage.cache import MISSING, LRUCache
+from src.knowledge_storage.interfaces.permission_interface import (
+    PermissionInterface,
+)
+from src.knowledge_storage.interfaces.taggable_interface import (
+    TaggableInterface,
+)
+from src.knowledge_storage.schemas import PermissionLevel
+
+
+class TestLRUCache:
+    def test_get_returns_missing_on_miss(self):
+        cache = LRUCache(maxsize=2)
+
+        assert cache.get("key") is MISSING
+        assert cache.get("key", None) is None
+
+    def test_none_is_a_cached_value(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("key", None)
+
+        assert cache.get("key") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+        assert len(cache) == 2
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(
+            "src.knowledge_storage.cache.time.monotonic", lambda: now[0]
+        )
+        cache = LRUCache(maxsize=2, ttl=10.0)
+        cache.set("key", 1)
+        now[0] += 10.0
+
+        assert cache.get("key") is MISSING
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_overrides_default(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(
+            "src.knowledge_storage.cache.time.monotonic", lambda: now[0]
+        )
+        cache = LRUCache(maxsize=2, ttl=10.0)
+        cache.set("short", 1, ttl=2.0)
+        cache.set("long", 2)
+
+        now[0] += 5.0
+
+        assert cache.get("short") is MISSING
+        assert cache.get("long") == 2
+
+
+class _StubPermissions(PermissionInterface[str, None]):
+    pass
+
+
+class _StubTags(TaggableInterface[str, None]):
+    pass
+
+
+_StubPermissions.__abstractmethods__ = frozenset()
+_StubTags.__abstractmethods__ = frozenset()
+
+
+class TestCachedPermissions:
+    @pytest.mark.asyncio
+    async def test_reads_through_once(self):
+        storage = _StubPermissions()
+        storage.get_permissions = AsyncMock(
+            return_value={"u1": PermissionLevel.READ}
+        )
+
+        first = await storage.get_cached_permissions("main")
+        second = await storage.get_cached_permissions("main")
+
+        assert first == second == {"u1": PermissionLevel.READ}
+        storage.get_permissions.assert_awaited_once_with("main")
+
+    @pytest.mark.asyncio
+    async def test_forget_drops_entry(self):
+        storage = _StubPermissions()
+        storage.get_permissions = AsyncMock(return_value={})
+
+        await storage.get_cached_permissions("main")
+        storage._forget_permissions("main")
+        await storage.get_cached_permissions("main")
+
+        assert storage.get_permissions.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_forget_during_read_skips_caching(self):
+        storage = _StubPermissions()
+
+        async def get_permissions(path):
+            storage._forget_permissions(path)
+            return {"u1": PermissionLevel.READ}
+
+        storage.get_permissions = AsyncMock(side_effect=get_permissions)
+
+        await storage.get_cached_permissions("main")
+        await storage.get_cached_permissions("main")
+
+        assert storage.get_permissions.await_count == 2
+
+
+class TestCachedTags:
+    @pytest.mark.asyncio
+    async def test_result_is_a_copy(self):
+        storage = _StubTags()
+        storage.get_tags = AsyncMock(return_value={"divorce"})
+
+        tags = await storage.get_cached_tags("main")
+        tags.add("custody")
+
+        assert await storage.get_cached_tags("main") == {"divorce"}
+        storage.get_tags.assert_awaited_once_with("main")
+
+    @pytest.mark.asyncio
+    async def test_forget_during_read_skips_caching(self):
+        storage = _StubTags()
+
+        async def get_tags(path):
+            storage._forget_tags()
+            return {"divorce"}
+
+        storage.get_tags = AsyncMock(side_effect=get_tags)
+
+        await storage.get_cached_tags("main")
+        await storage.get_cached_tags("main")
+
+        assert storage.get_tags.await_count == 2
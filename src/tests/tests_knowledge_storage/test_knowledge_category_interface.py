@@ -0,0 +1,581 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.knowledge_storage.interfaces import KnowledgeCategoryInterface
+from src.knowledge_storage.schemas import (
+    CategorySchema,
+    CategoryDeleteSchema,
+    EntityType,
+    InvalidationEvent,
+    LockToken,
+    MoveSpec,
+    MutationResult,
+    PermissionLevel,
+    SubCategorySchema,
+)
+
+
+@pytest.fixture
+def category_storage():
+    return AsyncMock(spec=KnowledgeCategoryInterface)
+
+
+class _StubCategoryStorage(KnowledgeCategoryInterface):
+    pass
+
+
+_StubCategoryStorage.__abstractmethods__ = frozenset()
+
+
+@pytest.fixture
+def boundary_storage():
+    storage = _StubCategoryStorage()
+    storage.get_permission_boundary = AsyncMock(return_value="main/family")
+    return storage
+
+
+@pytest.fixture
+def category_schema():
+    return CategorySchema(name="family", knowledge_storage="main")
+
+
+@pytest.fixture
+def mutation_result():
+    return MutationResult(version=2, update_time=datetime(2024, 1, 1))
+
+
+@pytest.fixture
+def subcategory_schema():
+    return SubCategorySchema(
+        name="custody", knowledge_storage="main", category="family"
+    )
+
+
+class TestKnowledgeCategoryInterfaceBulkDefaults:
+    @pytest.mark.asyncio
+    async def test_create_category_delegates_to_bulk(
+        self, category_storage, category_schema
+    ):
+        category_storage.create_categories.return_value = [category_schema]
+
+        result = await KnowledgeCategoryInterface.create_category(
+            category_storage, "main", "family", "Family law"
+        )
+
+        assert result is category_schema
+        category_storage.create_categories.assert_awaited_once_with(
+            "main", [("family", "Family law")]
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_category_delegates_to_bulk(self, category_storage):
+        deleted = CategoryDeleteSchema(name="family")
+        category_storage.delete_categories.return_value = [deleted]
+
+        result = await KnowledgeCategoryInterface.delete_category(
+            category_storage, "main", "family"
+        )
+
+        assert result is deleted
+        category_storage.delete_categories.assert_awaited_once_with(
+            "main", ["family"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_category_if_empty_uses_fast_path(
+        self, category_storage
+    ):
+        deleted = CategoryDeleteSchema(name="family")
+        category_storage.delete_empty_entities.return_value = [deleted]
+
+        result = await KnowledgeCategoryInterface.delete_category_if_empty(
+            category_storage, "main", "family"
+        )
+
+        assert result is deleted
+        category_storage.delete_empty_entities.assert_awaited_once_with(
+            "main", None, ["family"], entity_type=EntityType.CATEGORY
+        )
+        category_storage.delete_entities.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_set_category_permission_delegates_to_bulk(
+        self, category_storage, mutation_result
+    ):
+        category_storage.set_category_permissions.return_value = [
+            mutation_result
+        ]
+
+        result = await KnowledgeCategoryInterface.set_category_permission(
+            category_storage,
+            "main",
+            "family",
+            "user",
+            PermissionLevel.READ,
+            expected_version=4,
+        )
+
+        assert result is mutation_result
+        category_storage.set_category_permissions.assert_awaited_once_with(
+            "main",
+            [("family", "user", PermissionLevel.READ)],
+            expected_versions=[4],
+        )
+
+    @pytest.mark.asyncio
+    async def test_add_subcategory_tag_delegates_to_bulk(
+        self, category_storage, mutation_result
+    ):
+        category_storage.add_subcategory_tags.return_value = [mutation_result]
+
+        result = await KnowledgeCategoryInterface.add_subcategory_tag(
+            category_storage, "main", "family", "custody", "urgent"
+        )
+
+        assert result is mutation_result
+        category_storage.add_subcategory_tags.assert_awaited_once_with(
+            "main", "family", [("custody", "urgent")], expected_versions=[None]
+        )
+
+    @pytest.mark.asyncio
+    async def test_remove_category_tag_sets_remaining_tags(
+        self, category_storage, category_schema, mutation_result
+    ):
+        category_schema.tags = {"urgent", "custody"}
+        category_schema.version = 3
+        category_storage.get_category.return_value = category_schema
+        category_storage.set_category_tags.return_value = mutation_result
+
+        result = await KnowledgeCategoryInterface.remove_category_tag(
+            category_storage, "main", "family", "urgent"
+        )
+
+        assert result is mutation_result
+        category_storage.set_category_tags.assert_awaited_once_with(
+            "main", "family", {"custody"}, expected_version=3
+        )
+
+    @pytest.mark.asyncio
+    async def test_remove_missing_category_tag_raises(
+        self, category_storage, category_schema
+    ):
+        category_storage.get_category.return_value = category_schema
+
+        with pytest.raises(ValueError):
+            await KnowledgeCategoryInterface.remove_category_tag(
+                category_storage, "main", "family", "urgent"
+            )
+
+        category_storage.set_category_tags.assert_not_awaited()
+
+
+class TestKnowledgeCategoryInterfaceEntityForwarding:
+    @pytest.mark.asyncio
+    async def test_create_categories_forwards_with_category_type(
+        self, category_storage, category_schema
+    ):
+        category_storage.create_entities.return_value = [category_schema]
+
+        result = await KnowledgeCategoryInterface.create_categories(
+            category_storage, "main", [("family", None)]
+        )
+
+        assert result == [category_schema]
+        category_storage.create_entities.assert_awaited_once_with(
+            "main", None, [("family", None)], entity_type=EntityType.CATEGORY
+        )
+
+    @pytest.mark.asyncio
+    async def test_subcategory_methods_pass_category_as_parent(
+        self, category_storage, subcategory_schema
+    ):
+        category_storage.get_entity.return_value = subcategory_schema
+
+        result = await KnowledgeCategoryInterface.get_subcategory(
+            category_storage, "main", "family", "custody"
+        )
+
+        assert result is subcategory_schema
+        category_storage.get_entity.assert_awaited_once_with(
+            "main", "family", "custody", entity_type=EntityType.SUBCATEGORY
+        )
+
+    @pytest.mark.asyncio
+    async def test_move_category_targets_new_storage(self, category_storage):
+        await KnowledgeCategoryInterface.move_category(
+            category_storage, "main", "family", "archive"
+        )
+
+        category_storage.move_entity.assert_awaited_once_with(
+            "main",
+            None,
+            "family",
+            "archive",
+            entity_type=EntityType.CATEGORY,
+            expected_version=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_patch_category_tags_forwards_diff(self, category_storage):
+        await KnowledgeCategoryInterface.patch_category_tags(
+            category_storage, "main", "family", {"urgent"}, {"draft"}
+        )
+
+        category_storage.patch_entity_tags.assert_awaited_once_with(
+            "main",
+            None,
+            "family",
+            {"urgent"},
+            {"draft"},
+            entity_type=EntityType.CATEGORY,
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_category_detail_forwards_include(
+        self, category_storage
+    ):
+        await KnowledgeCategoryInterface.get_category_detail(
+            category_storage, "main", "family", frozenset({"tags"})
+        )
+
+        category_storage.get_entity_detail.assert_awaited_once_with(
+            "main",
+            None,
+            "family",
+            entity_type=EntityType.CATEGORY,
+            include=frozenset({"tags"}),
+        )
+
+    @pytest.mark.asyncio
+    async def test_move_entity_delegates_to_batch(self, category_storage):
+        moved = object()
+        category_storage.move_entities.return_value = [moved]
+
+        result = await KnowledgeCategoryInterface.move_entity(
+            category_storage,
+            "main",
+            "family",
+            "custody",
+            "children",
+            entity_type=EntityType.SUBCATEGORY,
+            expected_version=2,
+        )
+
+        assert result is moved
+        category_storage.move_entities.assert_awaited_once_with(
+            "main",
+            "family",
+            [MoveSpec("custody", "children", 2)],
+            entity_type=EntityType.SUBCATEGORY,
+        )
+
+    @pytest.mark.asyncio
+    async def test_rename_subcategory_forwards_expected_version(
+        self, category_storage
+    ):
+        await KnowledgeCategoryInterface.rename_subcategory(
+            category_storage, "main", "family", "custody", "visits", 4
+        )
+
+        category_storage.rename_entity.assert_awaited_once_with(
+            "main",
+            "family",
+            "custody",
+            "visits",
+            entity_type=EntityType.SUBCATEGORY,
+            expected_version=4,
+        )
+
+    @pytest.mark.asyncio
+    async def test_check_entity_permission_delegates_to_batch(
+        self, category_storage
+    ):
+        category_storage.check_entity_permissions.return_value = [True]
+
+        result = await KnowledgeCategoryInterface.check_entity_permission(
+            category_storage,
+            "main",
+            None,
+            "family",
+            "user",
+            PermissionLevel.WRITE,
+            entity_type=EntityType.CATEGORY,
+        )
+
+        assert result is True
+        category_storage.check_entity_permissions.assert_awaited_once_with(
+            "main",
+            None,
+            [("family", "user", PermissionLevel.WRITE)],
+            entity_type=EntityType.CATEGORY,
+        )
+
+    @pytest.mark.asyncio
+    async def test_iter_subcategories_streams_entities(
+        self, boundary_storage, subcategory_schema
+    ):
+        async def iter_entities(*args, **kwargs):
+            yield subcategory_schema
+
+        boundary_storage.iter_entities = MagicMock(side_effect=iter_entities)
+
+        result = [
+            subcategory
+            async for subcategory in boundary_storage.iter_subcategories(
+                "main", "family"
+            )
+        ]
+
+        assert result == [subcategory_schema]
+        boundary_storage.iter_entities.assert_called_once_with(
+            "main", "family", None, entity_type=EntityType.SUBCATEGORY
+        )
+
+
+class TestKnowledgeCategoryInterfacePermissionBoundary:
+    @pytest.mark.asyncio
+    async def test_boundary_is_cached(self, boundary_storage):
+        for _ in range(2):
+            boundary = await boundary_storage.resolve_permission_boundary(
+                "main",
+                "family",
+                "custody",
+                "user",
+                PermissionLevel.READ,
+                entity_type=EntityType.SUBCATEGORY,
+            )
+
+        assert boundary == "main/family"
+        boundary_storage.get_permission_boundary.assert_awaited_once_with(
+            "main",
+            "family",
+            "custody",
+            "user",
+            PermissionLevel.READ,
+            entity_type=EntityType.SUBCATEGORY,
+        )
+
+    @pytest.mark.asyncio
+    async def test_missing_boundary_is_cached(self, boundary_storage):
+        boundary_storage.get_permission_boundary.return_value = None
+
+        for _ in range(2):
+            boundary = await boundary_storage.resolve_permission_boundary(
+                "main",
+                None,
+                "family",
+                "user",
+                PermissionLevel.ADMIN,
+                entity_type=EntityType.CATEGORY,
+            )
+
+        assert boundary is None
+        assert boundary_storage.get_permission_boundary.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_forget_permission_boundaries(self, boundary_storage):
+        args = ("main", None, "family", "user", PermissionLevel.READ)
+
+        await boundary_storage.resolve_permission_boundary(
+            *args, entity_type=EntityType.CATEGORY
+        )
+        boundary_storage._forget_permission_boundaries()
+        await boundary_storage.resolve_permission_boundary(
+            *args, entity_type=EntityType.CATEGORY
+        )
+
+        assert boundary_storage.get_permission_boundary.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_permission_change_event_resets_boundaries(
+        self, boundary_storage
+    ):
+        args = ("main", None, "family", "user", PermissionLevel.READ)
+        await boundary_storage.resolve_permission_boundary(
+            *args, entity_type=EntityType.CATEGORY
+        )
+
+        await boundary_storage._emit_invalidation(
+            InvalidationEvent(
+                entity_type=EntityType.CATEGORY,
+                storage_name="main",
+                name="family",
+                op="set_permission",
+                version=2,
+            )
+        )
+        await boundary_storage.resolve_permission_boundary(
+            *args, entity_type=EntityType.CATEGORY
+        )
+
+        assert boundary_storage.get_permission_boundary.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_revoke_during_lookup_is_not_cached(self, boundary_storage):
+        args = ("main", None, "family", "user", PermissionLevel.READ)
+
+        async def lookup(*_, **__):
+            await boundary_storage._emit_invalidation(
+                InvalidationEvent(
+                    entity_type=EntityType.CATEGORY,
+                    storage_name="main",
+                    name="family",
+                    op="remove_permission",
+                    version=2,
+                )
+            )
+            return "main/family"
+
+        boundary_storage.get_permission_boundary.side_effect = lookup
+        await boundary_storage.resolve_permission_boundary(
+            *args, entity_type=EntityType.CATEGORY
+        )
+        boundary_storage.get_permission_boundary.side_effect = None
+        boundary_storage.get_permission_boundary.return_value = None
+
+        boundary = await boundary_storage.resolve_permission_boundary(
+            *args, entity_type=EntityType.CATEGORY
+        )
+
+        assert boundary is None
+
+    @pytest.mark.asyncio
+    async def test_delete_and_recreate_resets_boundaries(
+        self, boundary_storage
+    ):
+        args = ("main", None, "family", "user", PermissionLevel.READ)
+        await boundary_storage.resolve_permission_boundary(
+            *args, entity_type=EntityType.CATEGORY
+        )
+
+        for op in ("delete", "create"):
+            await boundary_storage._emit_invalidation(
+                InvalidationEvent(
+                    entity_type=EntityType.CATEGORY,
+                    storage_name="main",
+                    name="family",
+                    op=op,
+                )
+            )
+        boundary_storage.get_permission_boundary.return_value = None
+        boundary = await boundary_storage.resolve_permission_boundary(
+            *args, entity_type=EntityType.CATEGORY
+        )
+
+        assert boundary is None
+        assert boundary_storage.get_permission_boundary.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_description_change_keeps_boundaries(self, boundary_storage):
+        args = ("main", None, "family", "user", PermissionLevel.READ)
+        await boundary_storage.resolve_permission_boundary(
+            *args, entity_type=EntityType.CATEGORY
+        )
+
+        await boundary_storage._emit_invalidation(
+            InvalidationEvent(
+                entity_type=EntityType.CATEGORY,
+                storage_name="main",
+                name="family",
+                op="update_description",
+                version=2,
+            )
+        )
+        await boundary_storage.resolve_permission_boundary(
+            *args, entity_type=EntityType.CATEGORY
+        )
+
+        assert boundary_storage.get_permission_boundary.await_count == 1
+
+
+class TestKnowledgeCategoryInterfaceInvalidation:
+    @pytest.mark.asyncio
+    async def test_listeners_receive_events(self, boundary_storage):
+        first, second = AsyncMock(), AsyncMock()
+        boundary_storage.register_invalidation_listener(first)
+        boundary_storage.register_invalidation_listener(second)
+        event = InvalidationEvent(
+            entity_type=EntityType.SUBCATEGORY,
+            storage_name="main",
+            parent_name="family",
+            name="custody",
+            op="rename",
+            version=5,
+        )
+
+        await boundary_storage._emit_invalidation(event)
+
+        first.assert_awaited_once_with(event)
+        second.assert_awaited_once_with(event)
+
+    @pytest.mark.asyncio
+    async def test_failing_listener_does_not_stop_others(
+        self, boundary_storage, caplog
+    ):
+        failing = AsyncMock(side_effect=RuntimeError("broker down"))
+        second = AsyncMock()
+        boundary_storage.register_invalidation_listener(failing)
+        boundary_storage.register_invalidation_listener(second)
+        event = InvalidationEvent(
+            entity_type=EntityType.CATEGORY,
+            storage_name="main",
+            name="family",
+            op="rename",
+            version=3,
+        )
+
+        await boundary_storage._emit_invalidation(event)
+
+        second.assert_awaited_once_with(event)
+        assert "Invalidation listener failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_emit_without_listeners(self, boundary_storage):
+        await boundary_storage._emit_invalidation(
+            InvalidationEvent(
+                entity_type=EntityType.CATEGORY,
+                storage_name="main",
+                name="family",
+                op="delete",
+            )
+        )
+
+
+class TestKnowledgeCategoryInterfaceEntityLock:
+    @pytest.mark.asyncio
+    async def test_waits_until_lock_is_free(self, boundary_storage):
+        token = LockToken(path="main/family", token="t1")
+        boundary_storage.try_acquire_entity_lock = AsyncMock(
+            side_effect=[None, token]
+        )
+        boundary_storage.wait_entity_lock = AsyncMock()
+        boundary_storage.release_entity_lock = AsyncMock()
+
+        async with boundary_storage.entity_lock(
+            "main", None, "family", entity_type=EntityType.CATEGORY
+        ) as held:
+            assert held is token
+            boundary_storage.release_entity_lock.assert_not_awaited()
+
+        boundary_storage.wait_entity_lock.assert_awaited_once_with(
+            "main", None, "family", entity_type=EntityType.CATEGORY
+        )
+        boundary_storage.release_entity_lock.assert_awaited_once_with(token)
+
+    @pytest.mark.asyncio
+    async def test_releases_lock_on_error(self, boundary_storage):
+        token = LockToken(path="main/family", token="t1")
+        boundary_storage.try_acquire_entity_lock = AsyncMock(
+            return_value=token
+        )
+        boundary_storage.release_entity_lock = AsyncMock()
+
+        with pytest.raises(RuntimeError):
+            async with boundary_storage.entity_lock(
+                "main", None, "family", entity_type=EntityType.CATEGORY
+            ):
+                raise RuntimeError
+
+        boundary_storage.release_entity_lock.assert_awaited_once_with(token)
@@ -0,0 +1,29 @@
+import inspect
+
+import pytest
+
+from src.knowledge_storage.interfaces import (
+    KnowledgeCategoryInterface,
+    KnowledgeCategoryReader,
+)
+
+READER_METHODS = [
+    name
+    for name, member in vars(KnowledgeCategoryReader).items()
+    if inspect.iscoroutinefunction(member)
+]
+
+
+class TestKnowledgeCategoryReader:
+    def test_declares_methods(self):
+        assert "get_category" in READER_METHODS
+        assert "list_subcategories" in READER_METHODS
+
+    @pytest.mark.parametrize("name", READER_METHODS)
+    def test_matches_interface_signature(self, name):
+        reader = inspect.signature(getattr(KnowledgeCategoryReader, name))
+        interface = inspect.signature(
+            getattr(KnowledgeCategoryInterface, name)
+        )
+
+        assert reader == interface
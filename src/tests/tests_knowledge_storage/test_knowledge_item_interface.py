@@ -0,0 +1,374 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.knowledge_storage.interfaces.knowledge_item_interface import (
+    KnowledgeItemInterface,
+)
+from src.knowledge_storage.schemas import (
+    ItemMoveSchema,
+    ItemPath,
+    PaginatedResponse,
+    PaginationParams,
+    PathSource,
+    SmartSearchSchema,
+)
+
+
+class _StubItemStorage(KnowledgeItemInterface):
+    pass
+
+
+_StubItemStorage.__abstractmethods__ = frozenset()
+
+
+@pytest.fixture
+def item_storage():
+    storage = _StubItemStorage()
+    storage._embed = AsyncMock(return_value=[[0.1, 0.2]])
+    storage._ann_search = AsyncMock(
+        return_value=[
+            SmartSearchSchema(
+                text="Custody arrangements",
+                item_path="main/family/custody.pdf",
+                metadata={},
+                relevance_score=0.9,
+            )
+        ]
+    )
+    return storage
+
+
+class TestKnowledgeItemInterfaceSmartSearch:
+    @pytest.mark.asyncio
+    async def test_smart_search_delegates_to_ann_search(self, item_storage):
+        response = await item_storage.smart_search(
+            "main", "custody", category_name="family", num_results=5
+        )
+
+        assert response.query == "custody"
+        assert response.total_results == 1
+        assert response.results[0].item_path == "main/family/custody.pdf"
+        item_storage._embed.assert_awaited_once_with(["custody"])
+        item_storage._ann_search.assert_awaited_once_with(
+            "main", (0.1, 0.2), 5, "family", None
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_reuses_cached_embedding(self, item_storage):
+        await item_storage.smart_search("main", "custody")
+        await item_storage.smart_search("main", "custody")
+
+        item_storage._embed.assert_awaited_once_with(["custody"])
+        assert item_storage._ann_search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_query_embedding_cache_is_bounded(
+        self, item_storage, monkeypatch
+    ):
+        monkeypatch.setattr(_StubItemStorage, "_QUERY_EMBEDDINGS_MAXSIZE", 1)
+
+        await item_storage.smart_search("main", "first")
+        await item_storage.smart_search("main", "second")
+        await item_storage.smart_search("main", "first")
+
+        assert item_storage._embed.await_count == 3
+
+
+class TestKnowledgeItemInterfaceBulkDefaults:
+    @pytest.mark.asyncio
+    async def test_move_item_delegates_to_bulk(self, item_storage):
+        moved = ItemMoveSchema(
+            name="custody.pdf",
+            new_parent="archive",
+            knowledge_storage="main",
+            category="archive",
+        )
+        item_storage.move_items = AsyncMock(return_value=[moved])
+
+        result = await item_storage.move_item(
+            "main", "family", "custody.pdf", "archive"
+        )
+
+        assert result is moved
+        item_storage.move_items.assert_awaited_once_with(
+            "main", "family", ["custody.pdf"], "archive", None, None
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_item_delegates_to_bulk(self, item_storage):
+        source = PathSource(path="/tmp/custody.pdf")
+        created = object()
+        item_storage.create_items = AsyncMock(return_value=[created])
+
+        result = await item_storage.create_item(
+            "main",
+            "family",
+            "custody.pdf",
+            source,
+            description="Custody order",
+            tags=frozenset({"court"}),
+        )
+
+        assert result is created
+        item_storage.create_items.assert_awaited_once_with(
+            "main",
+            "family",
+            [("custody.pdf", source)],
+            None,
+            descriptions=["Custody order"],
+            tags=[frozenset({"court"})],
+        )
+
+
+class TestKnowledgeItemInterfaceResolveItemId:
+    @pytest.mark.asyncio
+    async def test_resolved_id_is_cached(self, item_storage):
+        item_storage._resolve_item_id = AsyncMock(return_value=42)
+
+        first = await item_storage.resolve_item_id("main", "family", "a.pdf")
+        second = await item_storage.resolve_item_id("main", "family", "a.pdf")
+
+        assert first == second == 42
+        item_storage._resolve_item_id.assert_awaited_once_with(
+            ItemPath("main", "family", "a.pdf")
+        )
+
+    @pytest.mark.asyncio
+    async def test_expired_id_is_resolved_again(
+        self, item_storage, monkeypatch
+    ):
+        item_storage._resolve_item_id = AsyncMock(return_value=42)
+        monkeypatch.setattr(_StubItemStorage, "_ITEM_IDS_CACHE_TTL", 0.0)
+
+        await item_storage.resolve_item_id("main", "family", "a.pdf")
+        await item_storage.resolve_item_id("main", "family", "a.pdf")
+
+        assert item_storage._resolve_item_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_forgotten_id_is_resolved_again(self, item_storage):
+        item_storage._resolve_item_id = AsyncMock(side_effect=[42, 43])
+
+        await item_storage.resolve_item_id("main", "family", "a.pdf")
+        item_storage._forget_item_ids([ItemPath("main", "family", "a.pdf")])
+        result = await item_storage.resolve_item_id("main", "family", "a.pdf")
+
+        assert result == 43
+
+
+class TestKnowledgeItemInterfacePrefetch:
+    @pytest.mark.asyncio
+    async def test_next_page_is_served_from_prefetch(self, item_storage):
+        item_storage.list_items = AsyncMock(
+            side_effect=[
+                PaginatedResponse(items=[], next_cursor="c1"),
+                PaginatedResponse(items=[], next_cursor=None),
+            ]
+        )
+
+        await item_storage.list_items_ahead(
+            "main",
+            "family",
+            pagination=PaginationParams(page_size=2, cursor="c0"),
+        )
+        await asyncio.sleep(0)
+        second = await item_storage.list_items_ahead(
+            "main",
+            "family",
+            pagination=PaginationParams(page_size=2, cursor="c1"),
+        )
+
+        assert second.next_cursor is None
+        assert item_storage.list_items.await_count == 2
+        item_storage.list_items.assert_awaited_with(
+            "main",
+            "family",
+            None,
+            pagination=PaginationParams(page_size=2, cursor="c1"),
+            include=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_last_page_starts_no_prefetch(self, item_storage):
+        item_storage.list_items = AsyncMock(
+            return_value=PaginatedResponse(items=[], total_pages=1)
+        )
+
+        await item_storage.list_items_ahead(
+            "main", "family", pagination=PaginationParams()
+        )
+        await asyncio.sleep(0)
+
+        item_storage.list_items.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_forget_drops_prefetched_pages(self, item_storage):
+        item_storage.list_items = AsyncMock(
+            return_value=PaginatedResponse(items=[], next_cursor="c1")
+        )
+
+        await item_storage.list_items_ahead(
+            "main", "family", pagination=PaginationParams(cursor="c0")
+        )
+        await asyncio.sleep(0)
+        item_storage._forget_prefetched_pages()
+        await item_storage.list_items_ahead(
+            "main", "family", pagination=PaginationParams(cursor="c1")
+        )
+        await asyncio.sleep(0)
+
+        assert item_storage.list_items.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_odd_offset_page_is_merged_with_next(self, item_storage):
+        item_storage.list_items = AsyncMock(
+            side_effect=[
+                PaginatedResponse(items=["a", "b", "c", "d"], total=5),
+                PaginatedResponse(items=["e"], total=5),
+            ]
+        )
+
+        first = await item_storage.list_items_ahead(
+            "main", "family", pagination=PaginationParams(page_size=2)
+        )
+        second = await item_storage.list_items_ahead(
+            "main", "family", pagination=PaginationParams(page=2, page_size=2)
+        )
+        await asyncio.sleep(0)
+
+        assert first.items == ["a", "b"]
+        assert first.total_pages == 3
+        assert second.items == ["c", "d"]
+        assert second.page == 2
+        assert [
+            call.kwargs["pagination"]
+            for call in item_storage.list_items.await_args_list
+        ] == [
+            PaginationParams(page=1, page_size=4),
+            PaginationParams(page=2, page_size=4),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_write_during_merged_fetch_drops_second_half(
+        self, item_storage
+    ):
+        async def list_items(*args, pagination, include):
+            item_storage._forget_prefetched_pages()
+            return PaginatedResponse(items=["a", "b", "c", "d"], total=4)
+
+        item_storage.list_items = AsyncMock(side_effect=list_items)
+
+        await item_storage.list_items_ahead(
+            "main", "family", pagination=PaginationParams(page_size=2)
+        )
+        await item_storage.list_items_ahead(
+            "main", "family", pagination=PaginationParams(page=2, page_size=2)
+        )
+
+        assert item_storage.list_items.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_a_query(
+        self, item_storage
+    ):
+        item_storage.list_items = AsyncMock(
+            return_value=PaginatedResponse(items=[])
+        )
+        pagination = PaginationParams(cursor="c0")
+
+        await asyncio.gather(
+            item_storage.list_items_ahead(
+                "main", "family", pagination=pagination
+            ),
+            item_storage.list_items_ahead(
+                "main", "family", pagination=pagination
+            ),
+        )
+
+        item_storage.list_items.assert_awaited_once()
+
+
+class TestKnowledgeItemInterfaceRemoveTag:
+    @pytest.mark.asyncio
+    async def test_checks_membership_on_tags_only(self, item_storage):
+        item_storage.get_tags = AsyncMock(return_value={"custody", "draft"})
+        item_storage.get_item = AsyncMock()
+        item_storage.set_item_tags = AsyncMock(return_value="updated")
+
+        result = await item_storage.remove_item_tag(
+            "main", "family", "a.pdf", "draft"
+        )
+
+        assert result == "updated"
+        item_storage.get_tags.assert_awaited_once_with(
+            ItemPath("main", "family", "a.pdf")
+        )
+        item_storage.get_item.assert_not_awaited()
+        item_storage.set_item_tags.assert_awaited_once_with(
+            "main", "family", "a.pdf", {"custody"}, None
+        )
+
+    @pytest.mark.asyncio
+    async def test_missing_tag_raises(self, item_storage):
+        item_storage.get_tags = AsyncMock(return_value={"custody"})
+
+        with pytest.raises(ValueError):
+            await item_storage.remove_item_tag(
+                "main", "family", "a.pdf", "draft"
+            )
+
+
+class TestKnowledgeItemInterfaceStoreContents:
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency_and_keeps_order(self, item_storage):
+        item_storage._UPLOAD_CONCURRENCY = 2
+        running = 0
+        peak = 0
+
+        async def store(name, source):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return name
+
+        items = [(f"{i}.pdf", PathSource(path=f"/tmp/{i}")) for i in range(5)]
+
+        result = await item_storage._store_contents(items, store)
+
+        assert result == [name for name, _ in items]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_siblings_and_discards_stored(
+        self, item_storage
+    ):
+        release = asyncio.Event()
+        cancelled = []
+
+        async def store(name, source):
+            if name == "ok.pdf":
+                return name
+            if name == "bad.pdf":
+                await asyncio.sleep(0)
+                raise ValueError("hash mismatch")
+            try:
+                await release.wait()
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+
+        discard = AsyncMock()
+        items = [
+            (name, PathSource(path=f"/tmp/{name}"))
+            for name in ("ok.pdf", "bad.pdf", "slow.pdf")
+        ]
+
+        with pytest.raises(ValueError, match="hash mismatch"):
+            await item_storage._store_contents(items, store, discard)
+
+        assert cancelled == ["slow.pdf"]
+        discard.assert_awaited_once_with("ok.pdf")
@@ -0,0 +1,253 @@
+from datetime import datetime
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import UploadFile
+from pydantic import TypeAdapter, ValidationError
+
+from src.knowledge_storage.schemas import (
+    AddTagEntityOp,
+    CategoryDetailSchema,
+    CategoryRow,
+    CategorySchema,
+    EntityOp,
+    EntityType,
+    FileSource,
+    ItemPath,
+    ItemSchema,
+    ItemSource,
+    KnowledgeDetailSchema,
+    PaginatedResponse,
+    PathSource,
+    PermissionLevel,
+    RenameEntityOp,
+    SubCategoryDetailSchema,
+    SubCategoryRow,
+    SubCategorySchema,
+    UrlSource,
+    decode_cursor,
+    encode_cursor,
+    intern_tags,
+    materialized_path,
+)
+
+item_source_adapter: TypeAdapter = TypeAdapter(ItemSource)
+entity_ops_adapter: TypeAdapter = TypeAdapter(List[EntityOp])
+
+
+class TestPaginatedResponse:
+    def test_unpaginated_defaults(self):
+        category = CategorySchema(name="family", knowledge_storage="main")
+
+        response = PaginatedResponse[CategorySchema](items=[category])
+
+        assert response.items == [category]
+        assert response.total is None
+        assert response.page is None
+        assert response.page_size is None
+        assert response.total_pages is None
+
+    def test_items_are_validated_as_parameter_type(self):
+        response = PaginatedResponse[CategorySchema](
+            items=[{"name": "family", "knowledge_storage": "main"}],
+            total=1,
+            page=1,
+            page_size=10,
+            total_pages=1,
+        )
+
+        assert isinstance(response.items[0], CategorySchema)
+        assert response.total == 1
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = encode_cursor(datetime(2024, 1, 2, 3, 4), "family")
+
+        assert decode_cursor(cursor) == ["2024-01-02 03:04:00", "family"]
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor("a/b?c" * 10)
+
+        assert "/" not in cursor and "+" not in cursor
+
+    @pytest.mark.parametrize("cursor", ["%%%", "e30=", "bm90IGpzb24="])
+    def test_malformed_cursor_is_rejected(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestItemSource:
+    def test_url_kind_selects_url_source(self):
+        source = item_source_adapter.validate_python(
+            {"kind": "url", "url": "https://example.com/doc.pdf"}
+        )
+
+        assert isinstance(source, UrlSource)
+        assert str(source.url) == "https://example.com/doc.pdf"
+
+    def test_path_kind_does_not_parse_url(self):
+        source = item_source_adapter.validate_python(
+            {"kind": "path", "path": "https://not-parsed"}
+        )
+
+        assert isinstance(source, PathSource)
+        assert source.path == "https://not-parsed"
+
+    def test_file_kind_selects_file_source(self):
+        upload = MagicMock(spec=UploadFile)
+
+        source = item_source_adapter.validate_python(FileSource(file=upload))
+
+        assert isinstance(source, FileSource)
+        assert source.file is upload
+
+    def test_unknown_kind_is_rejected(self):
+        with pytest.raises(ValidationError):
+            item_source_adapter.validate_python({"kind": "ftp", "url": "x"})
+
+
+class TestEntityOp:
+    def test_op_selects_operation_schema(self):
+        ops = entity_ops_adapter.validate_python(
+            [
+                {
+                    "op": "rename",
+                    "entity_type": "category",
+                    "name": "family",
+                    "new_name": "divorce",
+                },
+                {
+                    "op": "add_tag",
+                    "entity_type": "subcategory",
+                    "parent_name": "divorce",
+                    "name": "custody",
+                    "tag": "urgent",
+                },
+            ]
+        )
+
+        assert isinstance(ops[0], RenameEntityOp)
+        assert ops[0].parent_name is None
+        assert isinstance(ops[1], AddTagEntityOp)
+        assert ops[1].entity_type is EntityType.SUBCATEGORY
+
+    def test_missing_operation_field_is_rejected(self):
+        with pytest.raises(ValidationError):
+            entity_ops_adapter.validate_python(
+                [{"op": "rename", "entity_type": "category", "name": "x"}]
+            )
+
+
+class TestEntityRows:
+    def test_category_row_from_record(self):
+        row = CategoryRow(
+            "family",
+            "main",
+            7,
+            "Family law",
+            frozenset({"b"}),
+            {"u1": PermissionLevel.READ},
+        )
+
+        schema = row.to_schema()
+
+        assert isinstance(schema, CategorySchema)
+        assert schema.knowledge_storage == "main"
+        assert schema.version == 7
+        assert schema.model_dump()["tags"] == ["b"]
+        assert schema.permissions == {"u1": PermissionLevel.READ}
+
+    def test_subcategory_row_keeps_parent(self):
+        schema = SubCategoryRow("custody", "main", "family", 3).to_schema()
+
+        assert isinstance(schema, SubCategorySchema)
+        assert schema.category == "family"
+        assert schema.version == 3
+        assert schema.description is None
+        assert schema.permissions == {}
+
+
+class TestDetailSchemas:
+    @pytest.mark.parametrize(
+        "schema",
+        [KnowledgeDetailSchema, CategoryDetailSchema, SubCategoryDetailSchema],
+    )
+    def test_detail_schemas_are_built_at_import(self, schema):
+        assert schema.__pydantic_complete__
+
+
+class TestInternTags:
+    def test_deduplicates_into_frozenset(self):
+        assert intern_tags(["custody", "urgent", "custody"]) == frozenset(
+            {"custody", "urgent"}
+        )
+
+    def test_equal_tags_share_one_object(self):
+        first = "".join(["cus", "tody"])
+        second = "".join(["cust", "ody"])
+
+        (a,) = intern_tags([first])
+        (b,) = intern_tags([second])
+
+        assert a is b
+
+
+class TestMaterializedPath:
+    def test_category_path_skips_missing_parent(self):
+        assert materialized_path("main", None, "family") == "main/family"
+
+    def test_subcategory_path(self):
+        path = materialized_path("main", "family", "custody")
+
+        assert path == "main/family/custody"
+
+    @pytest.mark.parametrize("name", ["family/custody", ""])
+    def test_rejects_ambiguous_segments(self, name):
+        with pytest.raises(ValueError):
+            materialized_path("main", None, name)
+
+    def test_category_cannot_collide_with_subcategory(self):
+        subcategory = materialized_path("main", "family", "custody")
+
+        with pytest.raises(ValueError):
+            materialized_path("main", None, "family/custody")
+        assert subcategory == "main/family/custody"
+
+
+class TestItemPath:
+    def test_interned_parts_are_shared(self):
+        storage = "".join(["ma", "in"])
+
+        path = ItemPath.of(storage, "family", "a.pdf")
+
+        assert path.storage is ItemPath.of("main", "family", "a.pdf").storage
+        assert path == ItemPath("main", "family", "a.pdf", None)
+
+    def test_materialized_includes_subcategory(self):
+        path = ItemPath("main", "family", "a.pdf", "custody")
+
+        assert path.materialized == "main/family/custody/a.pdf"
+
+
+class TestTagSerialization:
+    def test_category_tags_serialize_sorted(self):
+        category = CategorySchema(
+            name="family",
+            knowledge_storage="main",
+            tags={"urgent", "custody", "alimony"},
+        )
+
+        assert category.model_dump()["tags"] == [
+            "alimony",
+            "custody",
+            "urgent",
+        ]
+
+    def test_item_tags_serialize_sorted_in_json(self):
+        item = ItemSchema(
+            name="a.pdf", url="https://example.com/a.pdf", tags={"b", "a"}
+        )
+
+        assert '"tags":["a","b"]' in item.model_dump_json()
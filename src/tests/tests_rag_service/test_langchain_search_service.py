@@ -129,3 +129,29 @@ class TestLangChainSearchService:
         # Assert
         assert len(results) == 0
         assert isinstance(results, list)
+
+    async def test_search_orders_and_truncates_by_score(
+        self, search_service, mock_vector_store
+    ):
+        # Setup
+        docs = []
+        for chunk_id in ("id1", "id2", "id3"):
+            doc = MagicMock()
+            doc.page_content = f"Content {chunk_id}"
+            doc.metadata = {"chunk_id": chunk_id, "source": "file.pdf"}
+            docs.append(doc)
+
+        mock_vector_store.similarity_search_with_score.return_value = [
+            (docs[0], 0.2),
+            (docs[1], 0.7),
+            (docs[2], 0.5),
+        ]
+
+        # Execute
+        results = await search_service.search(
+            query="test", index_name="test", namespace="test", top_k=2
+        )
+
+        # Assert
+        assert [result.id for result in results] == ["id2", "id3"]
+        assert [result.score for result in results] == [0.7, 0.5]
@@ -0,0 +1,70 @@
+import json
+
+from src.services.rag_service.schemas import (
+    QueryResultSchema,
+    SearchResponseSchema,
+    SearchResultsBatch,
+    build_search_response_bytes,
+)
+
+
+def _make_result(idx: int, score: float) -> QueryResultSchema:
+    return QueryResultSchema(
+        id=f"id{idx}",
+        text=f"text {idx}",
+        metadata={"page": idx},
+        score=score,
+        file_path=f"path{idx}.pdf",
+    )
+
+
+class TestBuildSearchResponseBytes:
+    def test_matches_pydantic_serialization(self):
+        results = [_make_result(1, 0.9), _make_result(2, 0.8)]
+
+        payload = build_search_response_bytes("query", results, len(results))
+
+        expected = SearchResponseSchema(
+            query="query", results=results, total=len(results)
+        ).model_dump_json()
+        assert json.loads(payload) == json.loads(expected)
+
+    def test_empty_results(self):
+        payload = build_search_response_bytes("query", iter([]), 0)
+
+        assert json.loads(payload) == {
+            "query": "query",
+            "results": [],
+            "total": 0,
+        }
+
+    def test_output_is_byte_identical_to_pydantic(self):
+        results = [_make_result(1, 0.5), _make_result(2, 1e-7)]
+
+        payload = build_search_response_bytes("запит", results, 2)
+
+        assert (
+            payload
+            == (
+                SearchResponseSchema(
+                    query="запит", results=results, total=2
+                ).model_dump_json()
+            ).encode()
+        )
+
+
+class TestSearchResultsBatch:
+    def test_top_k_orders_by_score_and_keeps_ties_stable(self):
+        batch = SearchResultsBatch()
+        for idx, score in enumerate([0.2, 0.7, 0.5, 0.7]):
+            batch.append(f"id{idx}", "text", {}, score, "file.pdf")
+
+        results = batch.top_k(3)
+
+        assert [result.id for result in results] == ["id1", "id3", "id2"]
+
+    def test_top_k_larger_than_batch(self):
+        batch = SearchResultsBatch()
+        batch.append("id0", "text", {}, 0.1, "file.pdf")
+
+        assert [result.id for result in batch.top_k(5)] == ["id0"]
@@ -51,10 +51,7 @@ def file_schema():
 
 @pytest.fixture
 def file_delete_schema():
-    return FileDeleteSchema(
-        file=Path("/test/test.txt"),
-        date_deleted=datetime.now(timezone.utc),
-    )
+    return FileDeleteSchema.from_path(Path("/test/test.txt"))
 
 
 @pytest.fixture
@@ -445,6 +445,14 @@ class TestCloudStorage:
             prefix="test/", search_query="file", case_sensitive=True
         )
 
+    def test_iter_files(self, cloud_storage):
+        result = cloud_storage.iter_files(prefix="test/")
+
+        cloud_storage._cloud_storage.iter_blobs.assert_called_once_with(
+            prefix="test/"
+        )
+        assert result is cloud_storage._cloud_storage.iter_blobs.return_value
+
     @pytest.mark.asyncio
     async def test_list_folders(self, cloud_storage):
         result = await cloud_storage.list_folders()
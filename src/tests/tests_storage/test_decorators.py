@@ -1,3 +1,6 @@
+import inspect
+from unittest.mock import create_autospec
+
 import pytest
 from fastapi import HTTPException
 from google.api_core.exceptions import ClientError, NotFound
@@ -8,6 +11,8 @@ from src.services.storage.decorators import (
     handle_delete_file_exceptions,
     handle_cloud_storage_exceptions,
     async_handle_cloud_storage_exceptions,
+    cloud_storage_errors,
+    async_cloud_storage_errors,
 )
 from src.services.storage.exceptions import (
     ErrorUploadingFile,
@@ -160,3 +165,52 @@ class TestAsyncHandleCloudStorageExceptions:
 
         assert exc_info.value.status_code == 500
         assert "Unexpected error" in str(exc_info.value.detail)
+
+    @pytest.mark.asyncio
+    async def test_decorated_method_binds_instance(self):
+        class Storage:
+            @async_handle_cloud_storage_exceptions
+            async def get(self, name):
+                """Get a blob."""
+                raise NotFound(name)
+
+        storage = Storage()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await storage.get("missing.txt")
+
+        assert exc_info.value.status_code == 404
+        assert Storage.get.__name__ == "get"
+        assert Storage.get.__doc__ == "Get a blob."
+
+    def test_decorated_method_stays_a_coroutine_function(self):
+        class Storage:
+            @async_handle_cloud_storage_exceptions
+            async def get(self, name):
+                return name
+
+        assert inspect.iscoroutinefunction(Storage.get)
+        assert inspect.iscoroutinefunction(Storage().get)
+        assert inspect.iscoroutinefunction(create_autospec(Storage).get)
+
+
+class TestCloudStorageErrorHandler:
+    def test_no_error(self):
+        with cloud_storage_errors:
+            result = "success"
+
+        assert result == "success"
+
+    def test_sync_client_error(self):
+        with pytest.raises(ProblemWithRequestToGCP) as exc_info:
+            with cloud_storage_errors:
+                raise ClientError("Client error")
+
+        assert "Client error" in str(exc_info.value)
+
+    def test_async_not_found_error(self):
+        with pytest.raises(HTTPException) as exc_info:
+            with async_cloud_storage_errors:
+                raise NotFound("Not found")
+
+        assert exc_info.value.status_code == 404
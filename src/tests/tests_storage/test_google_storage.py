@@ -2,6 +2,7 @@ import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from google.auth.exceptions import GoogleAuthError
 from google.cloud.storage import Blob, Bucket
 from google.cloud.storage_control_v2 import (
     CreateFolderRequest,
@@ -9,9 +10,13 @@ from google.cloud.storage_control_v2 import (
     RenameFolderRequest,
 )
 
+from src.services.storage.implementations import google_storage
 from src.services.storage.implementations.google_storage import (
     GoogleCloudStorage,
+    close_shared_http_session,
+    get_shared_http_session,
 )
+from src.services.storage.exceptions import ErrorWithAuthenticationInGCP
 from src.services.storage.shemas import (
     FileSchema,
     FileDeleteSchema,
@@ -21,6 +26,14 @@ from src.services.storage.shemas import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_client_caches():
+    yield
+    google_storage._get_client.cache_clear()
+    google_storage._get_storage_control.cache_clear()
+    google_storage._get_bucket.cache_clear()
+
+
 @pytest.fixture
 def mock_storage_client():
     with patch(
@@ -29,6 +42,15 @@ def mock_storage_client():
         yield mock_client
 
 
+@pytest.fixture
+def mock_http_session():
+    with patch(
+        "src.services.storage.implementations.google_storage"
+        ".get_shared_http_session"
+    ) as mock_session:
+        yield mock_session
+
+
 @pytest.fixture
 def mock_storage_control_client():
     with patch(
@@ -58,7 +80,10 @@ def mock_blob():
 
 @pytest.fixture
 def cloud_storage(
-    mock_storage_client, mock_storage_control_client, mock_bucket
+    mock_storage_client,
+    mock_storage_control_client,
+    mock_bucket,
+    mock_http_session,
 ):
     storage = GoogleCloudStorage(
         bucket_name="test-bucket", project_id="test-project"
@@ -81,13 +106,46 @@ class TestGoogleCloudStorage:
             == "https://storage.googleapis.com/test-bucket"
         )
 
-    def test_client_property(self, cloud_storage, mock_storage_client):
+    def test_client_property(
+        self, cloud_storage, mock_storage_client, mock_http_session
+    ):
         # Set client to None to force the client property to create a new one
         cloud_storage._client = None
         client = cloud_storage.client
-        mock_storage_client.assert_called_once_with(project="test-project")
+        mock_storage_client.assert_called_once_with(
+            project="test-project", _http=mock_http_session.return_value
+        )
         assert client == mock_storage_client.return_value
 
+    def test_clients_shared_between_instances(
+        self,
+        mock_storage_client,
+        mock_storage_control_client,
+        mock_http_session,
+    ):
+        first = GoogleCloudStorage(
+            bucket_name="test-bucket", project_id="test-project"
+        )
+        second = GoogleCloudStorage(
+            bucket_name="test-bucket", project_id="test-project"
+        )
+
+        assert first.client is second.client
+        assert first.storage_control is second.storage_control
+        assert first.bucket is second.bucket
+        mock_storage_client.assert_called_once()
+        mock_storage_control_client.assert_called_once()
+        mock_storage_client.return_value.get_bucket.assert_called_once()
+
+    def test_client_property_auth_error(
+        self, cloud_storage, mock_storage_client
+    ):
+        cloud_storage._client = None
+        mock_storage_client.side_effect = GoogleAuthError("no credentials")
+
+        with pytest.raises(ErrorWithAuthenticationInGCP):
+            _ = cloud_storage.client
+
     def test_storage_control_property(
         self, cloud_storage, mock_storage_control_client
     ):
@@ -151,6 +209,32 @@ class TestGoogleCloudStorage:
 
         assert isinstance(result, FileSchema)
 
+    @pytest.mark.asyncio
+    async def test_upload_blob_large_content_is_chunked(
+        self, cloud_storage, mock_bucket, mock_blob
+    ):
+        mock_bucket.blob.return_value = mock_blob
+        content = b"large content"
+
+        with patch.object(
+            GoogleCloudStorage, "_RESUMABLE_UPLOAD_THRESHOLD", 4
+        ):
+            await cloud_storage.upload_blob(
+                file_path="test/file.txt",
+                content=content,
+                content_type="text/plain",
+            )
+
+        mock_blob.upload_from_string.assert_not_called()
+        mock_blob.upload_from_file.assert_called_once()
+        file_obj = mock_blob.upload_from_file.call_args.args[0]
+        assert file_obj.getvalue() == content
+        assert mock_blob.upload_from_file.call_args.kwargs == {
+            "size": len(content),
+            "content_type": "text/plain",
+        }
+        assert mock_blob.chunk_size == 4
+
     @pytest.mark.asyncio
     async def test_get_blob(self, cloud_storage, mock_bucket, mock_blob):
         mock_bucket.get_blob.return_value = mock_blob
@@ -217,15 +301,17 @@ class TestGoogleCloudStorage:
         new_blob.size = 1024
         new_blob.content_type = "text/plain"
 
-        mock_bucket.get_blob.return_value = source_blob
+        mock_bucket.blob.return_value = source_blob
         mock_bucket.rename_blob.return_value = new_blob
 
         result = await cloud_storage.rename_blob(
             "/test/file.txt", "new_name.txt"
         )
 
-        mock_bucket.get_blob.assert_called_once_with("test/file.txt")
-        mock_bucket.rename_blob.assert_called_once()
+        mock_bucket.blob.assert_called_once_with("test/file.txt")
+        mock_bucket.rename_blob.assert_called_once_with(
+            source_blob, "test/new_name.txt"
+        )
 
         assert isinstance(result, FileSchema)
         assert result.filename == "new_name.txt"
@@ -234,6 +320,29 @@ class TestGoogleCloudStorage:
         assert result.size == new_blob.size
         assert result.content_type == new_blob.content_type
 
+    @pytest.mark.asyncio
+    async def test_rename_blob_in_bucket_root(
+        self, cloud_storage, mock_bucket
+    ):
+        source_blob = MagicMock(spec=Blob)
+        new_blob = MagicMock(spec=Blob)
+        new_blob.name = "new_name.txt"
+        new_blob.public_url = (
+            "https://storage.googleapis.com/test-bucket/new_name.txt"
+        )
+        new_blob.size = 1024
+        new_blob.content_type = "text/plain"
+
+        mock_bucket.blob.return_value = source_blob
+        mock_bucket.rename_blob.return_value = new_blob
+
+        result = await cloud_storage.rename_blob("/file.txt", "new_name.txt")
+
+        mock_bucket.rename_blob.assert_called_once_with(
+            source_blob, "new_name.txt"
+        )
+        assert result.path == "/new_name.txt"
+
     @pytest.mark.asyncio
     async def test_list_blobs(self, cloud_storage, mock_bucket):
         blob1 = MagicMock(spec=Blob)
@@ -255,11 +364,17 @@ class TestGoogleCloudStorage:
         folder_blob = MagicMock(spec=Blob)
         folder_blob.name = "test/folder/"
 
-        mock_bucket.list_blobs.return_value = [blob1, blob2, folder_blob]
+        mock_bucket.list_blobs.return_value.pages = iter(
+            [[blob1, folder_blob], [blob2]]
+        )
 
         result = await cloud_storage.list_blobs("/test")
 
-        mock_bucket.list_blobs.assert_called_once_with(prefix="test")
+        mock_bucket.list_blobs.assert_called_once_with(
+            prefix="test",
+            fields="items(name,size,contentType),nextPageToken",
+            page_size=1000,
+        )
 
         assert isinstance(result, list)
         assert len(result) == 2  # folder_blob должен быть исключен
@@ -267,6 +382,30 @@ class TestGoogleCloudStorage:
         assert result[0].filename == "file1.txt"
         assert result[1].filename == "file2.txt"
 
+    @pytest.mark.asyncio
+    async def test_iter_blobs_fetches_pages_lazily(
+        self, cloud_storage, mock_bucket
+    ):
+        fetched = []
+
+        def pages():
+            for idx in range(2):
+                blob = MagicMock(spec=Blob)
+                blob.name = f"test/file{idx}.txt"
+                blob.size = 1024
+                blob.content_type = "text/plain"
+                fetched.append(idx)
+                yield [blob]
+
+        mock_bucket.list_blobs.return_value.pages = pages()
+
+        files = cloud_storage.iter_blobs("test")
+        first = await files.__anext__()
+        await files.aclose()
+
+        assert first.filename == "file0.txt"
+        assert fetched == [0]
+
     @pytest.mark.asyncio
     async def test_list_blobs_with_search(self, cloud_storage, mock_bucket):
         blob1 = MagicMock(spec=Blob)
@@ -289,7 +428,11 @@ class TestGoogleCloudStorage:
 
         result = await cloud_storage.list_blobs("/test", search_query="file")
 
-        mock_bucket.list_blobs.assert_called_once_with(prefix="test")
+        mock_bucket.list_blobs.assert_called_once_with(
+            prefix="test",
+            fields="items(name,size,contentType),nextPageToken",
+            page_size=1000,
+        )
 
         assert isinstance(result, list)
         assert len(result) == 1
@@ -312,12 +455,6 @@ class TestGoogleCloudStorage:
         mock_storage_control_client.return_value.create_folder.return_value = (
             response_mock
         )
-        mock_storage_control_client.return_value.common_project_path.return_value = (
-            "projects/_"
-        )
-        mock_storage_control_client.return_value.common_folder_path.return_value = (
-            "folders/test_folder/"
-        )
 
         mock_create_request = MagicMock(spec=CreateFolderRequest)
 
@@ -348,12 +485,6 @@ class TestGoogleCloudStorage:
         mock_storage_control_client.return_value.get_folder.return_value = (
             folder_mock
         )
-        mock_storage_control_client.return_value.folder_path.return_value = (
-            "projects/_/buckets/test-bucket/folders/test_folder"
-        )
-        mock_storage_control_client.return_value.common_folder_path.return_value = (
-            "folders/test_folder/"
-        )
 
         result = await cloud_storage.get_folder("test_folder")
 
@@ -410,12 +541,6 @@ class TestGoogleCloudStorage:
         mock_storage_control_client.return_value.rename_folder.return_value = (
             MagicMock()
         )
-        mock_storage_control_client.return_value.folder_path.return_value = (
-            "projects/_/buckets/test-bucket/folders/old_folder"
-        )
-        mock_storage_control_client.return_value.common_folder_path.return_value = (
-            "folders/new_folder/"
-        )
 
         mock_rename_request = MagicMock(spec=RenameFolderRequest)
 
@@ -450,12 +575,6 @@ class TestGoogleCloudStorage:
             folder1,
             folder2,
         ]
-        mock_storage_control_client.return_value.common_project_path.return_value = (
-            "projects/_"
-        )
-        mock_storage_control_client.return_value.common_folder_path.side_effect = (
-            lambda x: f"folders/{x}/"
-        )
 
         result = await cloud_storage.list_folders(prefix="test")
 
@@ -467,19 +586,81 @@ class TestGoogleCloudStorage:
         assert result[0].folder_name == "folder1"
         assert result[1].folder_name == "folder2"
 
-    def test_get_bucket_path(self, cloud_storage, mock_storage_control_client):
-        mock_storage_control_client.return_value.common_project_path.return_value = (
-            "projects/_"
+    async def test_list_folders_served_from_cache(
+        self, cloud_storage, mock_storage_control_client
+    ):
+        folder = MagicMock()
+        folder.name = "projects/_/buckets/test-bucket/folders/folder1"
+        folder.create_time = datetime.datetime.now()
+        folder.update_time = datetime.datetime.now()
+        list_folders = mock_storage_control_client.return_value.list_folders
+        list_folders.return_value = [folder]
+
+        first = await cloud_storage.list_folders(prefix="test")
+        second = await cloud_storage.list_folders(prefix="test")
+
+        list_folders.assert_called_once()
+        assert first == second
+        assert first is not second
+
+    async def test_list_folders_stale_entry_refreshed_in_background(
+        self, cloud_storage
+    ):
+        cached = [MagicMock(spec=FolderDataSchema)]
+        fresh = [MagicMock(spec=FolderDataSchema)]
+        cloud_storage._folders_cache["test"] = (
+            google_storage.time.monotonic()
+            - cloud_storage._FOLDERS_CACHE_TTL
+            - 1,
+            cached,
         )
 
-        result = cloud_storage._get_bucket_path()
+        with patch.object(
+            cloud_storage, "_fetch_folders", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = fresh
+
+            result = await cloud_storage.list_folders(prefix="test")
+            assert result == cached
 
-        assert result == "projects/_/buckets/test-bucket"
+            await cloud_storage._folders_refresh_tasks["test"]
+
+            mock_fetch.assert_awaited_once_with("test")
+            assert cloud_storage._folders_cache["test"][1] == fresh
+            assert "test" not in cloud_storage._folders_refresh_tasks
+
+    async def test_create_folder_invalidates_folders_cache(
+        self, cloud_storage, mock_storage_control_client
+    ):
+        cloud_storage._folders_cache["test"] = (
+            google_storage.time.monotonic(),
+            [],
+        )
+        response = MagicMock()
+        response.name = "projects/_/buckets/test-bucket/folders/test/new"
+        response.create_time = datetime.datetime.now()
+        response.update_time = datetime.datetime.now()
+        mock_storage_control_client.return_value.create_folder.return_value = (
+            response
+        )
+
+        await cloud_storage.create_folder("test/new")
+
+        assert cloud_storage._folders_cache == {}
+
+    def test_bucket_path(self, cloud_storage):
+        assert cloud_storage._bucket_path == "projects/_/buckets/test-bucket"
 
     def test_get_blob_path(self, cloud_storage):
         result = cloud_storage._get_blob_path("test/file.txt")
         assert result == "/test/file.txt"
 
+    def test_get_public_url(self, cloud_storage):
+        result = cloud_storage._get_public_url("docs/my file~1.pdf")
+        assert result == (
+            "https://storage.googleapis.com/test-bucket/docs/my%20file~1.pdf"
+        )
+
     def test_get_blob_name(self, cloud_storage):
         result = cloud_storage._get_blob_name("test/file.txt")
         assert result == "file.txt"
@@ -523,25 +704,12 @@ class TestGoogleCloudStorage:
         result = cloud_storage._get_folder_name("test_folder")
         assert result == "test_folder"
 
-    def test_get_folder_path(self, cloud_storage, mock_storage_control_client):
-        mock_storage_control_client.return_value.folder_path.return_value = (
-            "projects/_/buckets/test-bucket/folders/test_folder"
-        )
-
+    def test_get_folder_path(self, cloud_storage):
         result = cloud_storage._get_folder_path("/test_folder")
 
-        mock_storage_control_client.return_value.folder_path.assert_called_once_with(
-            project="_", bucket="test-bucket", folder="test_folder"
-        )
         assert result == "projects/_/buckets/test-bucket/folders/test_folder"
 
-    def test_get_common_folder_path(
-        self, cloud_storage, mock_storage_control_client
-    ):
-        mock_storage_control_client.return_value.common_folder_path.return_value = (
-            "folders/test_folder"
-        )
-
+    def test_get_common_folder_path(self, cloud_storage):
         result = cloud_storage._get_common_folder_path("test_folder")
 
         assert result == "test_folder/"
@@ -567,7 +735,7 @@ class TestGoogleCloudStorage:
         )
 
         with patch.object(
-            cloud_storage, "list_folders", new_callable=AsyncMock
+            cloud_storage, "_fetch_folders", new_callable=AsyncMock
         ) as mock_list_folders, patch.object(
             cloud_storage, "_delete_folder", new_callable=AsyncMock
         ) as mock_delete_folder:
@@ -581,29 +749,66 @@ class TestGoogleCloudStorage:
             assert result is True
 
     @pytest.mark.asyncio
-    async def test_delete_all_files_in_folder(self, cloud_storage):
-        file1 = FileSchema(
-            filename="file1.txt", path="/test_folder/file1.txt", url="url1"
-        )
-        file2 = FileSchema(
-            filename="file2.txt", path="/test_folder/file2.txt", url="url2"
-        )
+    async def test_delete_subfolders_deepest_first(self, cloud_storage):
+        subfolders = [
+            FolderDataSchema(folder_name="a", folder_path="root/a/"),
+            FolderDataSchema(folder_name="b", folder_path="root/a/b/"),
+            FolderDataSchema(folder_name="c", folder_path="root/c/"),
+            FolderDataSchema(folder_name="d", folder_path="root/a/b/d/"),
+        ]
+        deleted = []
+
+        async def record_delete(path):
+            deleted.append(path)
+            return True
 
         with patch.object(
-            cloud_storage, "list_blobs", new_callable=AsyncMock
-        ) as mock_list_blobs, patch.object(
-            cloud_storage, "delete_blob", new_callable=AsyncMock
-        ) as mock_delete_blob:
-            mock_list_blobs.return_value = [file1, file2]
-            mock_delete_blob.return_value = MagicMock()
-
-            result = await cloud_storage._delete_all_files_in_folder(
-                "test_folder"
-            )
+            cloud_storage, "_fetch_folders", new_callable=AsyncMock
+        ) as mock_list_folders, patch.object(
+            cloud_storage, "_delete_folder", side_effect=record_delete
+        ):
+            mock_list_folders.return_value = subfolders
 
-            mock_list_blobs.assert_called_once_with(prefix="test_folder")
-            assert mock_delete_blob.call_count == 2
-            assert result is True
+            await cloud_storage._delete_subfolders("root")
+
+        assert deleted[:2] == ["root/a/b/d/", "root/a/b/"]
+        assert set(deleted[2:]) == {"root/a/", "root/c/"}
+
+    @pytest.mark.asyncio
+    async def test_delete_all_files_in_folder(
+        self, cloud_storage, mock_bucket, mock_storage_client
+    ):
+        blobs = []
+        for idx in range(150):
+            blob = MagicMock(spec=Blob)
+            blob.name = f"test_folder/file{idx}.txt"
+            blobs.append(blob)
+        placeholder = MagicMock(spec=Blob)
+        placeholder.name = "test_folder/"
+        mock_bucket.list_blobs.return_value.pages = iter(
+            [[placeholder, *blobs[:120]], blobs[120:]]
+        )
+        mock_bucket.blob.side_effect = lambda name: name
+
+        result = await cloud_storage._delete_all_files_in_folder(
+            "/test_folder"
+        )
+
+        mock_bucket.list_blobs.assert_called_once_with(
+            prefix="test_folder",
+            fields="items(name),nextPageToken",
+            page_size=1000,
+        )
+        assert mock_storage_client.return_value.batch.call_count == 3
+        deleted = [
+            name
+            for call in mock_bucket.delete_blobs.call_args_list
+            for name in call.args[0]
+        ]
+        assert sorted(deleted) == sorted(
+            f"test_folder/file{idx}.txt" for idx in range(150)
+        )
+        assert result is True
 
     @pytest.mark.asyncio
     async def test_delete_folder_internal(
@@ -666,3 +871,25 @@ class TestGoogleCloudStorage:
 
         assert len(result) == 1
         assert result[0].filename == "file1.txt"
+
+
+class TestSharedHttpSession:
+    def test_session_is_shared_and_closed(self):
+        module = "src.services.storage.implementations.google_storage"
+        with patch(
+            f"{module}.google.auth.default",
+            return_value=(MagicMock(), "test-project"),
+        ), patch(f"{module}.AuthorizedSession") as mock_session_cls:
+            close_shared_http_session()
+
+            first = get_shared_http_session()
+            second = get_shared_http_session()
+
+            assert first is second
+            mock_session_cls.assert_called_once()
+            first.mount.assert_called_once()
+
+            close_shared_http_session()
+
+            first.close.assert_called_once()
+            assert get_shared_http_session.cache_info().currsize == 0
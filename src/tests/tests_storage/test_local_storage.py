@@ -0,0 +1,511 @@
+import asyncio
+import io
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from urllib.parse import quote
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from src.services.storage.exceptions import ErrorSavingFile
+from src.services.storage.local_storage import LocalStorage, _quote_path
+from src.services.storage.shemas import FileSchema
+
+
+@pytest.fixture
+def mock_request():
+    request = MagicMock()
+    request.scope = {"user": "test_user"}
+    request.base_url = "http://testserver/"
+    return request
+
+
+@pytest.fixture
+def local_storage(tmp_path):
+    return LocalStorage(path_to_upload_dir=str(tmp_path))
+
+
+def make_upload_file(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(content), filename=filename, size=len(content)
+    )
+
+
+class TestLocalStorage:
+    @pytest.mark.asyncio
+    async def test_upload(self, local_storage, mock_request, tmp_path):
+        upload_file = make_upload_file("test.txt", b"test content")
+
+        result = await local_storage.upload(upload_file, mock_request)
+
+        saved_file = tmp_path / "test_user" / "test.txt"
+        assert isinstance(result, FileSchema)
+        assert result.filename == "test.txt"
+        assert result.path == str(saved_file)
+        assert result.size == len(b"test content")
+        assert saved_file.read_bytes() == b"test content"
+        assert upload_file.file.closed
+
+    @pytest.mark.asyncio
+    async def test_upload_streams_in_chunks(
+        self, local_storage, mock_request, tmp_path
+    ):
+        content = b"x" * 10 + b"y" * 10 + b"z" * 5
+        upload_file = make_upload_file("large.bin", content)
+
+        with patch.object(LocalStorage, "_UPLOAD_CHUNK_SIZE", 10), patch(
+            "src.services.storage.local_storage.shutil.copyfileobj",
+            wraps=shutil.copyfileobj,
+        ) as mock_copy:
+            await local_storage.upload(upload_file, mock_request)
+
+        assert mock_copy.call_args.args[2] == 10
+        assert (tmp_path / "test_user" / "large.bin").read_bytes() == content
+
+    @pytest.mark.skipif(
+        not sys.platform.startswith("linux"),
+        reason="sendfile to a regular file is Linux-only",
+    )
+    @pytest.mark.asyncio
+    async def test_upload_spilled_file_uses_sendfile(
+        self, local_storage, mock_request, tmp_path
+    ):
+        content = b"spilled content" * 100
+        spool = SpooledTemporaryFile(max_size=10)
+        spool.write(content)
+        spool.seek(0)
+        upload_file = UploadFile(file=spool, filename="big.bin")
+
+        with patch(
+            "src.services.storage.local_storage.os.sendfile",
+            wraps=os.sendfile,
+        ) as mock_sendfile:
+            await local_storage.upload(upload_file, mock_request)
+
+        mock_sendfile.assert_called()
+        assert (tmp_path / "test_user" / "big.bin").read_bytes() == content
+
+    @pytest.mark.asyncio
+    async def test_upload_in_memory_spool_is_not_rolled_over(
+        self, local_storage, mock_request, tmp_path
+    ):
+        spool = SpooledTemporaryFile(max_size=1024)
+        spool.write(b"small")
+        spool.seek(0)
+        upload_file = UploadFile(file=spool, filename="small.txt")
+
+        with patch(
+            "src.services.storage.local_storage.os.sendfile"
+        ) as mock_sendfile:
+            await local_storage.upload(upload_file, mock_request)
+
+        mock_sendfile.assert_not_called()
+        assert (tmp_path / "test_user" / "small.txt").read_bytes() == b"small"
+
+    @pytest.mark.asyncio
+    async def test_multi_upload_limits_concurrency(
+        self, local_storage, mock_request
+    ):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_upload_to(directory, file, base_url):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return file.filename
+
+        files = [
+            make_upload_file(f"file{idx}.txt", b"data") for idx in range(5)
+        ]
+
+        with patch.object(
+            LocalStorage, "_MAX_CONCURRENT_UPLOADS", 2
+        ), patch.object(
+            local_storage, "_upload_to", side_effect=fake_upload_to
+        ):
+            result = await local_storage.multi_upload(files, mock_request)
+
+        assert result == [f"file{idx}.txt" for idx in range(5)]
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_multi_upload_resolves_user_once(
+        self, local_storage, mock_request, tmp_path
+    ):
+        files = [
+            make_upload_file(f"file{idx}.txt", b"data") for idx in range(3)
+        ]
+
+        with patch.object(
+            LocalStorage,
+            "_get_user_identifier",
+            wraps=LocalStorage._get_user_identifier,
+        ) as mock_identifier:
+            result = await local_storage.multi_upload(files, mock_request)
+
+        mock_identifier.assert_called_once_with(mock_request)
+        assert [file.filename for file in result] == [
+            f"file{idx}.txt" for idx in range(3)
+        ]
+        assert (tmp_path / "test_user" / "file2.txt").read_bytes() == b"data"
+
+    @pytest.mark.asyncio
+    async def test_list_files(self, local_storage, mock_request, tmp_path):
+        (tmp_path / "docs" / "nested").mkdir(parents=True)
+        (tmp_path / "docs" / "b.txt").write_bytes(b"bb")
+        (tmp_path / "docs" / "nested" / "a.txt").write_bytes(b"a")
+
+        result = await local_storage.list_files(mock_request, prefix="docs")
+
+        assert [file.filename for file in result] == ["a.txt", "b.txt"]
+        assert result[0].path == str(tmp_path / "docs" / "nested" / "a.txt")
+        assert [file.size for file in result] == [1, 2]
+        assert result[1].url == "http://testserver/" + quote(
+            (tmp_path / "docs" / "b.txt").as_posix()
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_files_stats_only_the_root(
+        self, local_storage, mock_request, tmp_path
+    ):
+        (tmp_path / "docs" / "nested").mkdir(parents=True)
+        for idx in range(3):
+            (tmp_path / "docs" / "nested" / f"{idx}.txt").write_bytes(b"a")
+
+        with patch(
+            "src.services.storage.local_storage.os.stat", wraps=os.stat
+        ) as mock_stat:
+            result = await local_storage.list_files(
+                mock_request, prefix="docs"
+            )
+
+        assert len(result) == 3
+        mock_stat.assert_called_once_with(str(tmp_path / "docs"))
+
+    @pytest.mark.asyncio
+    async def test_list_files_missing_prefix(
+        self, local_storage, mock_request
+    ):
+        result = await local_storage.list_files(mock_request, prefix="none")
+
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_list_files_prefix_is_file(
+        self, local_storage, mock_request, tmp_path
+    ):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "file.txt").write_bytes(b"data")
+
+        with patch(
+            "src.services.storage.local_storage._scan_tree"
+        ) as mock_scan_tree:
+            result = await local_storage.list_files(
+                mock_request, prefix="docs/file.txt"
+            )
+
+        mock_scan_tree.assert_not_called()
+        assert [file.filename for file in result] == ["file.txt"]
+        assert result[0].size == 4
+
+    @pytest.mark.asyncio
+    async def test_iter_files_yields_in_batches(
+        self, local_storage, mock_request, tmp_path
+    ):
+        (tmp_path / "docs" / "nested").mkdir(parents=True)
+        for idx in range(3):
+            (tmp_path / "docs" / f"file{idx}.txt").write_bytes(b"data")
+        (tmp_path / "docs" / "nested" / "file3.txt").write_bytes(b"data")
+
+        with patch.object(LocalStorage, "_ITER_BATCH_SIZE", 2), patch.object(
+            LocalStorage,
+            "_next_files_batch",
+            wraps=LocalStorage._next_files_batch,
+        ) as mock_next_batch:
+            result = [
+                file
+                async for file in local_storage.iter_files(
+                    "docs", mock_request
+                )
+            ]
+
+        assert sorted(file.filename for file in result) == [
+            f"file{idx}.txt" for idx in range(4)
+        ]
+        assert mock_next_batch.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_iter_files_cancelled_mid_batch(
+        self, local_storage, tmp_path
+    ):
+        for idx in range(4):
+            (tmp_path / f"file{idx}.txt").write_bytes(b"data")
+        entered = threading.Event()
+        release = threading.Event()
+        closed = []
+
+        def scan_tree(root):
+            try:
+                yield from os.scandir(root)
+            finally:
+                closed.append(root)
+
+        original_next_batch = LocalStorage._next_files_batch
+        calls = []
+
+        def next_batch(entries, base_url):
+            calls.append(base_url)
+            if len(calls) == 2:
+                entered.set()
+                release.wait(timeout=5)
+            return original_next_batch(entries, base_url)
+
+        async def consume():
+            async for _ in local_storage.iter_files():
+                pass
+
+        with patch.object(LocalStorage, "_ITER_BATCH_SIZE", 2), patch(
+            "src.services.storage.local_storage._scan_tree", scan_tree
+        ), patch.object(
+            LocalStorage, "_next_files_batch", staticmethod(next_batch)
+        ):
+            task = asyncio.create_task(consume())
+            try:
+                assert await asyncio.to_thread(entered.wait, 5)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                assert closed == []
+            finally:
+                release.set()
+            for _ in range(100):
+                if closed:
+                    break
+                await asyncio.sleep(0.01)
+
+        assert closed == [str(tmp_path)]
+
+    @pytest.mark.asyncio
+    async def test_list_folders(self, local_storage, tmp_path):
+        (tmp_path / "docs" / "nested").mkdir(parents=True)
+        (tmp_path / "docs" / "file.txt").write_bytes(b"data")
+
+        result = await local_storage.list_folders()
+
+        assert sorted(folder.folder_name for folder in result) == [
+            "docs",
+            "nested",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_files_by_name(
+        self, local_storage, mock_request, tmp_path
+    ):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "Report.pdf").write_bytes(b"data")
+        (tmp_path / "docs" / "notes.txt").write_bytes(b"data")
+
+        result = await local_storage.search_files_by_name(
+            "report", mock_request
+        )
+
+        assert [file.filename for file in result] == ["Report.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_search_files_by_name_case_sensitive(
+        self, local_storage, mock_request, tmp_path
+    ):
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "report.pdf").write_bytes(b"data")
+        (tmp_path / "a_report.txt").write_bytes(b"data")
+        (tmp_path / "Report.pdf").write_bytes(b"data")
+
+        result = await local_storage.search_files_by_name(
+            "report", mock_request, case_sensitive=True
+        )
+
+        assert [file.filename for file in result] == [
+            "a_report.txt",
+            "report.pdf",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_folder_contents(self, local_storage, tmp_path):
+        (tmp_path / "docs" / "nested").mkdir(parents=True)
+        (tmp_path / "docs" / "file.txt").write_bytes(b"data")
+
+        result = await local_storage.get_folder_contents(
+            str(tmp_path / "docs")
+        )
+
+        assert [item["name"] for item in result["items"]] == [
+            "nested",
+            "file.txt",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_delete_folder(self, local_storage, mock_request, tmp_path):
+        folder = tmp_path / "docs"
+        (folder / "nested").mkdir(parents=True)
+        (folder / "nested" / "file.txt").write_bytes(b"data")
+
+        result = await local_storage.delete_folder(str(folder), mock_request)
+
+        assert result.folder_name == str(folder)
+        assert not folder.exists()
+
+    @pytest.mark.asyncio
+    async def test_upload_creates_user_directory_once(
+        self, local_storage, mock_request
+    ):
+        with patch.object(
+            Path, "mkdir", autospec=True, side_effect=Path.mkdir
+        ) as mock_mkdir:
+            for idx in range(3):
+                await local_storage.upload(
+                    make_upload_file(f"file{idx}.txt", b"data"), mock_request
+                )
+
+        assert mock_mkdir.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_upload_after_user_directory_deleted(
+        self, local_storage, mock_request, tmp_path
+    ):
+        user_dir = tmp_path / "test_user"
+        await local_storage.upload(
+            make_upload_file("first.txt", b"data"), mock_request
+        )
+        await local_storage.delete_folder(str(user_dir), mock_request)
+
+        await local_storage.upload(
+            make_upload_file("second.txt", b"data"), mock_request
+        )
+
+        assert (user_dir / "second.txt").exists()
+
+    @pytest.mark.asyncio
+    async def test_get_folder_contents_missing_folder(
+        self, local_storage, tmp_path
+    ):
+        with pytest.raises(ErrorSavingFile):
+            await local_storage.get_folder_contents(str(tmp_path / "none"))
+
+    @pytest.mark.asyncio
+    async def test_create_folder_already_exists(
+        self, local_storage, mock_request, tmp_path
+    ):
+        (tmp_path / "docs").mkdir()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await local_storage.create_folder(
+                str(tmp_path / "docs"), mock_request
+            )
+
+        assert exc_info.value.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_rename_folder(self, local_storage, mock_request, tmp_path):
+        (tmp_path / "old").mkdir()
+
+        result = await local_storage.rename_folder(
+            str(tmp_path / "old"), str(tmp_path / "new"), mock_request
+        )
+
+        assert result.folder_name == "new"
+        assert (tmp_path / "new").is_dir()
+        assert not (tmp_path / "old").exists()
+
+    @pytest.mark.asyncio
+    async def test_rename_folder_missing_source(
+        self, local_storage, mock_request, tmp_path
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            await local_storage.rename_folder(
+                str(tmp_path / "old"), str(tmp_path / "new"), mock_request
+            )
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_rename_folder_target_exists(
+        self, local_storage, mock_request, tmp_path
+    ):
+        (tmp_path / "old").mkdir()
+        (tmp_path / "new").mkdir()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await local_storage.rename_folder(
+                str(tmp_path / "old"), str(tmp_path / "new"), mock_request
+            )
+
+        assert exc_info.value.status_code == 409
+        assert (tmp_path / "old").is_dir()
+
+    @pytest.mark.asyncio
+    async def test_get_file(self, local_storage, mock_request, tmp_path):
+        file_path = tmp_path / "file.txt"
+        file_path.write_bytes(b"data")
+
+        result = await local_storage.get_file(str(file_path), mock_request)
+
+        assert result.filename == "file.txt"
+        assert result.path == str(file_path)
+        assert result.size == 4
+
+    @pytest.mark.asyncio
+    async def test_delete_file(self, local_storage, mock_request, tmp_path):
+        file_path = tmp_path / "file.txt"
+        file_path.write_bytes(b"data")
+
+        result = await local_storage.delete_file(str(file_path), mock_request)
+
+        assert result.file == str(file_path)
+        assert not file_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_delete_missing_file(
+        self, local_storage, mock_request, tmp_path
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            await local_storage.delete_file(
+                str(tmp_path / "none.txt"), mock_request
+            )
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_rename_file(self, local_storage, mock_request, tmp_path):
+        old_path = tmp_path / "old.txt"
+        new_path = tmp_path / "new.txt"
+        old_path.write_bytes(b"data")
+
+        result = await local_storage.rename_file(
+            str(old_path), str(new_path), mock_request
+        )
+
+        assert result.filename == "new.txt"
+        assert result.path == str(new_path)
+        assert new_path.read_bytes() == b"data"
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/uploads/user/report-1_final.v2~.pdf",
+        "/uploads/user/my file (1).pdf",
+        "/uploads/user/100%?#&=+.txt",
+        "/uploads/юзер/документ.pdf",
+        "",
+    ],
+)
+def test_quote_path_matches_urllib(path):
+    assert _quote_path(path) == quote(path, safe="/")